@@ -0,0 +1,28 @@
+import os
+from pathlib import Path
+
+
+def env_bool(name: str, default: bool) -> bool:
+    """Lê uma variável de ambiente booleana ("1", "true", "yes", "on")."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+# Raiz do projeto: caminhos relativos da configuração são resolvidos a partir
+# dela, e não do diretório de onde o processo foi iniciado.
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+def data_path(env_name: str, filename: str) -> Path:
+    """
+    Caminho de um arquivo de dados locais (SQLite, por exemplo).
+
+    Usa a variável `env_name` se definida; senão `<DATA_DIR>/<filename>`
+    (DATA_DIR padrão: `data` na raiz do projeto). Caminhos relativos são
+    resolvidos a partir da raiz do projeto.
+    """
+    value = os.getenv(env_name) or str(Path(os.getenv("DATA_DIR", "data")) / filename)
+    path = Path(value)
+    return path if path.is_absolute() else PROJECT_ROOT / path
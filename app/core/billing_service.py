@@ -0,0 +1,250 @@
+import asyncio
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+import httpx
+
+from app.core.client_factory import ClientFactory
+from app.utils.circuit_breaker import CircuitOpenError
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+ReceivableBuilder = Callable[[Dict[str, Any], Dict[str, Any], Dict[str, Any]], Dict[str, Any]]
+
+# Erros esperados de um passo. Qualquer outro é tratado como bug: registrado com
+# traceback no resultado do cliente, sem interromper os demais.
+STEP_ERRORS = (httpx.HTTPError, CircuitOpenError, ValueError, OSError)
+
+
+def _response_id(response: Dict[str, Any], *keys: str) -> Optional[str]:
+    """ID retornado pelo provedor (`id` nas integrações reais, `<tipo>_id` nos mocks)."""
+    for key in ("id", *keys):
+        if response.get(key):
+            return str(response[key])
+    return None
+
+
+def link_receivable(
+    receivable: Dict[str, Any], invoice: Dict[str, Any], payment: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Montagem padrão da conta a receber: registra na observação os IDs da NFSE e
+    da cobrança, preservando o texto informado.
+    """
+    invoice_id = _response_id(invoice, "invoice_id")
+    payment_id = _response_id(payment, "payment_id")
+    reference = f"NFSE {invoice_id} | Cobrança {payment_id}"
+
+    observation = receivable.get("observacao")
+    return {**receivable, "observacao": f"{observation} | {reference}" if observation else reference}
+
+
+class BillingService:
+    """
+    Orquestra o faturamento de clientes: emissão da NFSE, cobrança no provedor de
+    pagamentos e conta a receber no ERP.
+
+    Para cada cliente, a NFSE e a cobrança são criadas ao mesmo tempo; a conta a
+    receber é criada assim que as duas existem, com os IDs delas (ver
+    `link_receivable`). A latência por cliente passa a ser a da chamada mais
+    lenta entre NFSE e cobrança, mais a do ERP, em vez da soma das três.
+
+    Vários clientes são processados em paralelo, mas só `max_customers` por vez
+    (default: BILLING_MAX_CUSTOMERS ou metade de `max_concurrency`): cada um
+    chega à conta a receber antes de o próximo começar, então a latência por
+    cliente não cresce com o tamanho do lote. Todas as chamadas aos provedores
+    compartilham um único limite de concorrência (`max_concurrency`; default:
+    BILLING_MAX_CONCURRENCY ou 10).
+
+    Se a NFSE ou a cobrança falhar, a conta a receber não é criada e o passo
+    que deu certo não é desfeito. As três integrações reais usam a mesma chave
+    de idempotência (`external_id`), então repetir o faturamento do cliente
+    conclui apenas o que faltou.
+
+    Os clientes vêm do `ClientFactory` (variáveis ERP_CLIENT, INVOICE_CLIENT e
+    PAYMENT_CLIENT), a menos que sejam informados.
+    """
+
+    def __init__(
+        self,
+        invoice_client: Any = None,
+        payment_client: Any = None,
+        erp_client: Any = None,
+        max_concurrency: Optional[int] = None,
+        receivable_builder: ReceivableBuilder = link_receivable,
+        max_customers: Optional[int] = None,
+    ):
+        self.invoice_client = invoice_client or ClientFactory.get_async_invoice_client()
+        self.payment_client = payment_client or ClientFactory.get_async_payment_client()
+        self.erp_client = erp_client or ClientFactory.get_async_erp_client()
+        self.max_concurrency = max_concurrency or int(os.getenv("BILLING_MAX_CONCURRENCY", "10"))
+        # NFSE e cobrança de um cliente rodam juntas: metade do limite de
+        # chamadas mantém os dois passos de cada cliente em voo.
+        self.max_customers = max_customers or int(
+            os.getenv("BILLING_MAX_CUSTOMERS", str(max(1, self.max_concurrency // 2)))
+        )
+        self.receivable_builder = receivable_builder
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def _call(self, call: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            return await call()
+
+    async def bill_customer(self, billing: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Fatura um cliente.
+
+        Args:
+            billing (Dict[str, Any]): Dados do faturamento:
+                - external_id (str): Identificador do faturamento; usado como
+                  `externalId` da NFSE, `externalReference` da cobrança e
+                  `codigo_lancamento_integracao` da conta a receber, quando
+                  esses campos não forem informados.
+                - invoice (dict): Payload de `issue_invoice`.
+                - payment (dict): Payload de `create_payment`.
+                - receivable (dict): Payload de `create_accounts_receivable`.
+
+        Returns:
+            Dict[str, Any]: `external_id`, `status` ("success" ou "error"), as
+            respostas de `invoice`, `payment` e `receivable` (None se o passo não
+            foi concluído), `errors` por passo e `elapsed` em segundos.
+        """
+        external_id = billing.get("external_id")
+        invoice_data = dict(billing["invoice"])
+        payment_data = dict(billing["payment"])
+        receivable_data = dict(billing["receivable"])
+        if external_id:
+            invoice_data.setdefault("externalId", external_id)
+            payment_data.setdefault("externalReference", external_id)
+            receivable_data.setdefault("codigo_lancamento_integracao", external_id)
+
+        started = time.monotonic()
+        result: Dict[str, Any] = {
+            "external_id": external_id,
+            "status": "error",
+            "invoice": None,
+            "payment": None,
+            "receivable": None,
+            "errors": {},
+        }
+
+        invoice, payment = await asyncio.gather(
+            self._step(result, "invoice", lambda: self.invoice_client.issue_invoice(invoice_data)),
+            self._step(result, "payment", lambda: self.payment_client.create_payment(payment_data)),
+        )
+
+        if invoice is not None and payment is not None:
+            receivable_data = self.receivable_builder(receivable_data, invoice, payment)
+            receivable = await self._step(
+                result,
+                "receivable",
+                lambda: self.erp_client.create_accounts_receivable(receivable_data),
+            )
+            if receivable is not None:
+                result["status"] = "success"
+        else:
+            logger.warning(
+                "Faturamento %s: conta a receber não criada; falha em %s.",
+                external_id,
+                ", ".join(result["errors"]),
+            )
+
+        result["elapsed"] = round(time.monotonic() - started, 3)
+        return result
+
+    async def _step(
+        self,
+        result: Dict[str, Any],
+        name: str,
+        call: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> Optional[Dict[str, Any]]:
+        try:
+            response = await self._call(call)
+        except STEP_ERRORS as e:
+            logger.error("Faturamento %s: falha em %s: %s", result["external_id"], name, e)
+            result["errors"][name] = str(e)
+            return None
+        except Exception as e:
+            logger.exception(
+                "Faturamento %s: erro inesperado em %s: %s", result["external_id"], name, e
+            )
+            result["errors"][name] = f"{type(e).__name__}: {e}"
+            return None
+        result[name] = response
+        return response
+
+    async def _bill_customer_safely(self, billing: Any) -> Dict[str, Any]:
+        """
+        `bill_customer` que nunca levanta: um faturamento malformado (ex: sem
+        `invoice`) vira erro apenas no resultado desse cliente.
+        """
+        try:
+            return await self.bill_customer(billing)
+        except Exception as e:
+            external_id = billing.get("external_id") if isinstance(billing, dict) else None
+            logger.exception("Faturamento %s: falha ao processar o cliente: %s", external_id, e)
+            return {
+                "external_id": external_id,
+                "status": "error",
+                "invoice": None,
+                "payment": None,
+                "receivable": None,
+                "errors": {"billing": f"{type(e).__name__}: {e}"},
+                "elapsed": 0.0,
+            }
+
+    async def bill_customers(self, billings: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Fatura vários clientes em paralelo: `max_customers` workers consomem a
+        lista, um cliente por vez cada, dentro do limite de concorrência.
+
+        Returns:
+            Dict[str, Any]: Resumo com `status` ("success", "partial" ou "error"),
+            contadores, o resultado de cada cliente em `results` e as falhas em `failures`.
+        """
+        billings = list(billings)
+        logger.info(
+            "Faturamento: processando %d clientes (até %d por vez, %d chamadas simultâneas).",
+            len(billings),
+            self.max_customers,
+            self.max_concurrency,
+        )
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(billings)
+        queue = iter(enumerate(billings))
+
+        async def worker() -> None:
+            for index, billing in queue:
+                results[index] = await self._bill_customer_safely(billing)
+
+        await asyncio.gather(*(worker() for _ in range(min(self.max_customers, len(billings)))))
+
+        failures = [result for result in results if result["status"] != "success"]
+        succeeded = len(results) - len(failures)
+        summary = {
+            "status": "success" if not failures else ("partial" if succeeded else "error"),
+            "total": len(results),
+            "succeeded": succeeded,
+            "failed": len(failures),
+            "results": results,
+            "failures": failures,
+        }
+        logger.info(
+            "Faturamento concluído — %d clientes faturados, %d com falha.",
+            summary["succeeded"],
+            summary["failed"],
+        )
+        return summary
+
+
+def bill_customers(billings: Iterable[Dict[str, Any]], **options: Any) -> Dict[str, Any]:
+    """Atalho síncrono para `BillingService(**options).bill_customers(billings)`."""
+
+    async def run() -> Dict[str, Any]:
+        return await BillingService(**options).bill_customers(billings)
+
+    return asyncio.run(run())
@@ -1,47 +1,159 @@
+import importlib
 import os
+import threading
+from typing import Any, Dict, Tuple
+
 from app.erp.erp_client_interface import ERPClientInterface
 from app.invoice.invoice_client_interface import InvoiceClientInterface
 from app.payment.payment_client_interface import PaymentClientInterface
+from app.payables.payables_client_interface import PayablesClientInterface
+from app.erp.erp_client_async_interface import AsyncERPClientInterface
+from app.invoice.invoice_client_async_interface import AsyncInvoiceClientInterface
+from app.payment.payment_client_async_interface import AsyncPaymentClientInterface
+from app.payables.payables_client_async_interface import AsyncPayablesClientInterface
+
 
-# Mocks
-from app.erp.erp_client_mock import ERPClientMock
-from app.invoice.invoice_client_mock import InvoiceClientMock
-from app.payment.payment_client_mock import PaymentClientMock
+# Variável de ambiente que seleciona a implementação de cada domínio.
+CLIENT_ENV_VARS = {
+    "erp": "ERP_CLIENT",
+    "invoice": "INVOICE_CLIENT",
+    "payment": "PAYMENT_CLIENT",
+    "payables": "PAYABLE_CLIENT",
+}
 
-# Futuras implementações reais (ex: Omie)
-from app.erp.erp_client_omie import ERPClientOmie
+# Prefixos das variáveis de ambiente lidas por cada implementação. Uma mudança
+# nelas gera uma nova instância em vez de reaproveitar a que está em cache.
+CLIENT_ENV_PREFIXES = {
+    "mock": ("MOCK_",),
+    "omie": ("OMIE_",),
+    "nfe_io": ("NFE_IO_",),
+    "asaas": ("ASAAS_",),
+    "superlogica": ("SUPERLOGICA_",),
+}
 
-# from app.invoice.nfeio_client import NFeIOClient
-# from app.payment.asaas_client import AsaasClient
+# (domínio, assíncrono) -> {implementação: "módulo:Classe"}. Os módulos só são
+# importados quando a implementação é usada pela primeira vez.
+CLIENT_REGISTRY: Dict[Tuple[str, bool], Dict[str, str]] = {
+    ("erp", False): {
+        "mock": "app.erp.erp_client_mock:ERPClientMock",
+        "omie": "app.erp.erp_client_omie:ERPClientOmie",
+    },
+    ("erp", True): {
+        "mock": "app.erp.erp_client_async_mock:AsyncERPClientMock",
+        "omie": "app.erp.erp_client_async_omie:AsyncERPClientOmie",
+    },
+    ("invoice", False): {
+        "mock": "app.invoice.invoice_client_mock:InvoiceClientMock",
+        "nfe_io": "app.invoice.invoice_client_nfe_io:InvoiceClientNFEio",
+    },
+    ("invoice", True): {
+        "mock": "app.invoice.invoice_client_async_mock:AsyncInvoiceClientMock",
+        "nfe_io": "app.invoice.invoice_client_async_nfe_io:AsyncInvoiceClientNFEio",
+    },
+    ("payment", False): {
+        "mock": "app.payment.payment_client_mock:PaymentClientMock",
+        "asaas": "app.payment.payment_client_asaas:PaymentClientAsaas",
+    },
+    ("payment", True): {
+        "mock": "app.payment.payment_client_async_mock:AsyncPaymentClientMock",
+        "asaas": "app.payment.payment_client_async_asaas:AsyncPaymentClientAsaas",
+    },
+    ("payables", False): {
+        "mock": "app.payables.payables_client_mock:PayablesClientMock",
+        "superlogica": "app.payables.payables_client_superlogica:SuperlogicaPayablesClient",
+    },
+    ("payables", True): {
+        "mock": "app.payables.payables_client_async_mock:AsyncPayablesClientMock",
+        "superlogica": "app.payables.payables_client_async_superlogica:AsyncSuperlogicaPayablesClient",
+    },
+}
 
 
 class ClientFactory:
-    @staticmethod
-    def get_erp_client() -> ERPClientInterface:
-        client_type = os.getenv("ERP_CLIENT", "mock").lower()
-        if client_type == "mock":
-            return ERPClientMock()
-        elif client_type == "omie":
-            return ERPClientOmie()
-        else:
-            raise ValueError(f"ERP client '{client_type}' is not supported.")
+    """
+    Fornece os clientes de cada domínio conforme as variáveis de ambiente
+    (ERP_CLIENT, INVOICE_CLIENT, PAYMENT_CLIENT, PAYABLE_CLIENT).
 
-    @staticmethod
-    def get_invoice_client() -> InvoiceClientInterface:
-        client_type = os.getenv("INVOICE_CLIENT", "mock").lower()
-        if client_type == "mock":
-            return InvoiceClientMock()
-        # elif client_type == "nfe_io":
-        #     return NFeIOClient()
-        else:
-            raise ValueError(f"Invoice client '{client_type}' is not supported.")
+    O módulo de cada implementação é importado apenas na primeira vez em que ela
+    é pedida, e a instância criada é reaproveitada enquanto as variáveis de
+    ambiente do provedor não mudarem. `clear_cache()` descarta as instâncias.
+    """
+
+    _cache: Dict[Tuple, Any] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def register(cls, domain: str, client_type: str, target: str, is_async: bool = False) -> None:
+        """Registra (ou substitui) uma implementação no formato "módulo:Classe"."""
+        CLIENT_REGISTRY.setdefault((domain, is_async), {})[client_type.lower()] = target
+        cls.clear_cache()
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        with cls._lock:
+            cls._cache.clear()
 
     @staticmethod
-    def get_payment_client() -> PaymentClientInterface:
-        client_type = os.getenv("PAYMENT_CLIENT", "mock").lower()
-        if client_type == "mock":
-            return PaymentClientMock()
-        # elif client_type == "asaas":
-        #     return AsaasClient()
-        else:
-            raise ValueError(f"Payment client '{client_type}' is not supported.")
+    def _config_fingerprint(client_type: str) -> Tuple[Tuple[str, str], ...]:
+        prefixes = CLIENT_ENV_PREFIXES.get(client_type, (f"{client_type.upper()}_",))
+        return tuple(
+            sorted(
+                (name, value)
+                for name, value in os.environ.items()
+                if name.startswith(prefixes)
+            )
+        )
+
+    @classmethod
+    def _get_client(cls, domain: str, is_async: bool) -> Any:
+        client_type = os.getenv(CLIENT_ENV_VARS[domain], "mock").lower()
+        target = CLIENT_REGISTRY.get((domain, is_async), {}).get(client_type)
+        if target is None:
+            label = "ERP" if domain == "erp" else domain.capitalize()
+            raise ValueError(f"{label} client '{client_type}' is not supported.")
+
+        key = (domain, is_async, client_type, cls._config_fingerprint(client_type))
+        client = cls._cache.get(key)
+        if client is not None:
+            return client
+
+        with cls._lock:
+            client = cls._cache.get(key)
+            if client is None:
+                module_name, class_name = target.split(":")
+                client_class = getattr(importlib.import_module(module_name), class_name)
+                client = client_class()
+                cls._cache[key] = client
+        return client
+
+    @classmethod
+    def get_erp_client(cls) -> ERPClientInterface:
+        return cls._get_client("erp", is_async=False)
+
+    @classmethod
+    def get_invoice_client(cls) -> InvoiceClientInterface:
+        return cls._get_client("invoice", is_async=False)
+
+    @classmethod
+    def get_payment_client(cls) -> PaymentClientInterface:
+        return cls._get_client("payment", is_async=False)
+
+    @classmethod
+    def get_payables_client(cls) -> PayablesClientInterface:
+        return cls._get_client("payables", is_async=False)
+
+    @classmethod
+    def get_async_erp_client(cls) -> AsyncERPClientInterface:
+        return cls._get_client("erp", is_async=True)
+
+    @classmethod
+    def get_async_invoice_client(cls) -> AsyncInvoiceClientInterface:
+        return cls._get_client("invoice", is_async=True)
+
+    @classmethod
+    def get_async_payment_client(cls) -> AsyncPaymentClientInterface:
+        return cls._get_client("payment", is_async=True)
+
+    @classmethod
+    def get_async_payables_client(cls) -> AsyncPayablesClientInterface:
+        return cls._get_client("payables", is_async=True)
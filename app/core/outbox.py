@@ -0,0 +1,628 @@
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+import requests
+from urllib3.exceptions import NewConnectionError
+
+from app.config.settings import data_path
+from app.core.client_factory import ClientFactory
+from app.utils.circuit_breaker import CircuitOpenError
+from app.utils.logger import get_logger
+from app.utils.retry import RetryPolicy
+
+logger = get_logger(__name__)
+
+# (domínio, operação) -> método do cliente do domínio.
+OPERATIONS: Dict[str, Dict[str, str]] = {
+    "erp": {
+        "create": "create_accounts_receivable",
+        "settle": "settle_accounts_receivable",
+        "cancel": "cancel_accounts_receivable",
+    },
+    "invoice": {
+        "create": "issue_invoice",
+        "cancel": "cancel_invoice",
+    },
+    "payment": {
+        "create": "create_payment",
+        "cancel": "cancel_payment",
+    },
+    "payables": {
+        "create": "create_payable",
+        "settle": "settle_payable",
+        "cancel": "cancel_payable",
+    },
+}
+
+# Criações que o provedor não deduplica: a NFE.io e a Asaas aceitam
+# `externalId`/`externalReference` repetidos e o Superlógica não tem chave
+# externa. Depois de uma falha em que a requisição pode ter chegado ao provedor
+# (timeout de leitura, 5xx, reserva expirada), repetir criaria um segundo
+# registro; o job fica em "reconcile" até ser conferido.
+NON_IDEMPOTENT_OPERATIONS: FrozenSet[Tuple[str, str]] = frozenset(
+    {("invoice", "create"), ("payment", "create"), ("payables", "create")}
+)
+
+CLIENT_GETTERS: Dict[str, Callable[[], Any]] = {
+    "erp": ClientFactory.get_erp_client,
+    "invoice": ClientFactory.get_invoice_client,
+    "payment": ClientFactory.get_payment_client,
+    "payables": ClientFactory.get_payables_client,
+}
+
+# Falhas transitórias: o job volta para a fila com backoff. As demais (dados
+# inválidos, erro de negócio do provedor) encerram o job como "failed".
+RETRYABLE_ERRORS = (requests.RequestException, CircuitOpenError, ConnectionError, TimeoutError)
+
+
+def is_retryable(error: BaseException) -> bool:
+    """
+    Se a falha é transitória. `HTTPError` (levantado pelo `raise_for_status()`
+    dos clientes) só é transitório em 429 e 5xx; um 4xx é erro de dados ou de
+    negócio e repetir não adianta.
+    """
+    if isinstance(error, requests.HTTPError):
+        status = error.response.status_code if error.response is not None else None
+        return status is None or status == 429 or status >= 500
+    return isinstance(error, RETRYABLE_ERRORS)
+
+
+def was_not_sent(error: BaseException) -> bool:
+    """
+    Se a falha garante que o provedor não processou a requisição: conexão não
+    estabelecida, circuit breaker aberto ou 429 (recusada antes de processar).
+    Em timeouts de leitura e 5xx a requisição pode ter sido aplicada.
+    """
+    if isinstance(error, (CircuitOpenError, requests.ConnectTimeout, ConnectionRefusedError)):
+        return True
+    if isinstance(error, requests.HTTPError):
+        return error.response is not None and error.response.status_code == 429
+    if isinstance(error, requests.ConnectionError):
+        # O `requests` também usa ConnectionError para conexões derrubadas no
+        # meio da resposta; só a falha ao abrir a conexão é segura.
+        reason = error.args[0] if error.args else None
+        return isinstance(getattr(reason, "reason", reason), NewConnectionError)
+    # Falhas simuladas dos mocks (`MockProviderError`) trazem o status.
+    return getattr(error, "status_code", None) == 429
+
+
+PENDING, RUNNING, DONE, FAILED = "pending", "running", "done", "failed"
+# Criação sem deduplicação com resultado incerto: não é repetida automaticamente.
+RECONCILE = "reconcile"
+
+
+class OutboxFullError(RuntimeError):
+    """A fila atingiu `max_pending` jobs não concluídos."""
+
+
+class Outbox:
+    """
+    Fila persistente (SQLite em modo WAL) de operações nos provedores.
+
+    `enqueue` grava o job e retorna imediatamente; um `OutboxWorkerPool`
+    executa os jobs depois. Cada job é "reservado" por um worker por
+    `lease_seconds`: se o processo cair no meio da execução, a reserva expira e
+    o job volta a ser executado (na mesma ou em outra instância). Por isso as
+    criações devem levar sua chave de idempotência (`codigo_lancamento_integracao`,
+    `externalId`, `externalReference`): criações já registradas no
+    `IdempotencyStore` não são repetidas.
+
+    As criações de `NON_IDEMPOTENT_OPERATIONS` só são repetidas quando a falha
+    garante que o provedor não as recebeu (`was_not_sent`). Nos demais casos,
+    inclusive reserva expirada, o job fica em "reconcile" até `resolve`.
+
+    Configuração (variáveis de ambiente):
+        - OUTBOX_DB_PATH: arquivo SQLite (default: <DATA_DIR>/outbox.sqlite3;
+          caminhos relativos partem da raiz do projeto)
+        - OUTBOX_MAX_PENDING: jobs não concluídos aceitos antes de recusar
+          novos com `OutboxFullError` (default: 10000)
+        - OUTBOX_MAX_ATTEMPTS: tentativas por job (default: 5)
+        - OUTBOX_LEASE_SECONDS: duração da reserva de um job (default: 300)
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_pending: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+        lease_seconds: Optional[float] = None,
+    ):
+        self.path = path or str(data_path("OUTBOX_DB_PATH", "outbox.sqlite3"))
+        self.max_pending = max_pending or int(os.getenv("OUTBOX_MAX_PENDING", "10000"))
+        self.max_attempts = max_attempts or int(os.getenv("OUTBOX_MAX_ATTEMPTS", "5"))
+        self.lease_seconds = lease_seconds or float(os.getenv("OUTBOX_LEASE_SECONDS", "300"))
+
+        self._lock = threading.Lock()
+        self._available = threading.Condition()
+        self._conn = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        conn = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None, timeout=30
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS outbox_jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                domain TEXT NOT NULL,
+                operation TEXT NOT NULL,
+                args TEXT NOT NULL,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                max_attempts INTEGER NOT NULL,
+                available_at REAL NOT NULL,
+                locked_by TEXT,
+                locked_until REAL,
+                result TEXT,
+                error TEXT,
+                dedupe_key TEXT UNIQUE,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS outbox_jobs_ready "
+            "ON outbox_jobs (status, available_at)"
+        )
+        logger.debug("Outbox: usando banco %s.", self.path)
+        return conn
+
+    def enqueue(
+        self,
+        domain: str,
+        operation: str,
+        *args: Any,
+        dedupe_key: Optional[str] = None,
+        max_attempts: Optional[int] = None,
+        **kwargs: Any,
+    ) -> int:
+        """
+        Enfileira `operation` ("create", "settle" ou "cancel") no cliente do `domain`.
+
+        Os argumentos são repassados ao método do cliente e precisam ser
+        serializáveis em JSON. Com `dedupe_key`, enfileirar de novo a mesma
+        chave retorna o job já existente.
+
+        Raises:
+            ValueError: Domínio ou operação não suportados.
+            OutboxFullError: A fila atingiu `max_pending` jobs não concluídos.
+
+        Returns:
+            int: ID do job.
+        """
+        if operation not in OPERATIONS.get(domain, {}):
+            raise ValueError(f"Outbox: operação '{operation}' não suportada para '{domain}'.")
+
+        payload = json.dumps({"args": args, "kwargs": kwargs}, ensure_ascii=False, default=str)
+        now = time.time()
+        with self._lock:
+            if dedupe_key is not None:
+                row = self._conn.execute(
+                    "SELECT id FROM outbox_jobs WHERE dedupe_key = ?", (dedupe_key,)
+                ).fetchone()
+                if row is not None:
+                    return row["id"]
+
+            pending = self._conn.execute(
+                "SELECT COUNT(*) FROM outbox_jobs WHERE status IN (?, ?)", (PENDING, RUNNING)
+            ).fetchone()[0]
+            if pending >= self.max_pending:
+                raise OutboxFullError(
+                    f"Outbox: fila cheia ({pending} jobs pendentes, limite {self.max_pending})."
+                )
+
+            job_id = self._conn.execute(
+                "INSERT INTO outbox_jobs (domain, operation, args, status, max_attempts, "
+                "available_at, dedupe_key, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    domain,
+                    operation,
+                    payload,
+                    PENDING,
+                    max_attempts or self.max_attempts,
+                    now,
+                    dedupe_key,
+                    now,
+                    now,
+                ),
+            ).lastrowid
+
+        logger.debug("Outbox: job %s enfileirado (%s.%s).", job_id, domain, operation)
+        with self._available:
+            self._available.notify()
+        return job_id
+
+    def claim(self, worker_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Reserva o próximo job disponível: pendente e liberado para execução, ou
+        em execução com a reserva expirada (worker que caiu).
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._claim_row(worker_id, time.time())
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        if row is None:
+            return None
+        job = self._to_dict(row)
+        job.update(status=RUNNING, attempts=row["attempts"] + 1, locked_by=worker_id)
+        return job
+
+    def _claim_row(self, worker_id: str, now: float) -> Optional[sqlite3.Row]:
+        while True:
+            row = self._conn.execute(
+                "SELECT * FROM outbox_jobs "
+                "WHERE (status = ? AND available_at <= ?) "
+                "OR (status = ? AND locked_until < ?) "
+                "ORDER BY available_at, id LIMIT 1",
+                (PENDING, now, RUNNING, now),
+            ).fetchone()
+            if row is None or row["status"] == PENDING:
+                break
+
+            if (row["domain"], row["operation"]) in NON_IDEMPOTENT_OPERATIONS:
+                logger.error(
+                    "Outbox: reserva do job %s (%s.%s) expirou durante a criação; "
+                    "conferir no provedor antes de reenviar.",
+                    row["id"],
+                    row["domain"],
+                    row["operation"],
+                )
+                self._conn.execute(
+                    "UPDATE outbox_jobs SET status = ?, error = ?, locked_by = NULL, "
+                    "locked_until = NULL, updated_at = ? WHERE id = ?",
+                    (RECONCILE, "Reserva expirada durante a criação.", now, row["id"]),
+                )
+                continue
+
+            if row["attempts"] < row["max_attempts"]:
+                logger.warning(
+                    "Outbox: reserva do job %s (%s) expirou; executando novamente.",
+                    row["id"],
+                    row["locked_by"],
+                )
+                break
+
+            # O job derrubou o worker em todas as tentativas: não é executado de novo.
+            logger.error(
+                "Outbox: job %s abandonado após %d tentativas sem conclusão.",
+                row["id"],
+                row["attempts"],
+            )
+            self._conn.execute(
+                "UPDATE outbox_jobs SET status = ?, error = ?, locked_by = NULL, "
+                "locked_until = NULL, updated_at = ? WHERE id = ?",
+                (FAILED, "Reserva expirada em todas as tentativas.", now, row["id"]),
+            )
+
+        if row is not None:
+            self._conn.execute(
+                "UPDATE outbox_jobs SET status = ?, attempts = attempts + 1, "
+                "locked_by = ?, locked_until = ?, updated_at = ? WHERE id = ?",
+                (RUNNING, worker_id, now + self.lease_seconds, now, row["id"]),
+            )
+        return row
+
+    def complete(self, job_id: int, worker_id: str, result: Any) -> bool:
+        return self._finish(
+            job_id,
+            worker_id,
+            DONE,
+            result=json.dumps(result, ensure_ascii=False, default=str),
+        )
+
+    def fail(
+        self, job_id: int, worker_id: str, error: str, retry_in: Optional[float] = None
+    ) -> bool:
+        """Registra a falha; com `retry_in`, o job volta à fila após esse atraso."""
+        if retry_in is None:
+            return self._finish(job_id, worker_id, FAILED, error=error)
+
+        now = time.time()
+        with self._lock:
+            updated = self._conn.execute(
+                "UPDATE outbox_jobs SET status = ?, error = ?, available_at = ?, "
+                "locked_by = NULL, locked_until = NULL, updated_at = ? "
+                "WHERE id = ? AND locked_by = ?",
+                (PENDING, error, now + retry_in, now, job_id, worker_id),
+            ).rowcount
+        return self._check_fence(job_id, worker_id, updated)
+
+    def hold_for_reconciliation(self, job_id: int, worker_id: str, error: str) -> bool:
+        """Encerra o job em "reconcile": a criação pode ter sido aplicada no provedor."""
+        return self._finish(job_id, worker_id, RECONCILE, error=error)
+
+    def resolve(self, job_id: int, result: Any = None) -> bool:
+        """
+        Encerra um job em "reconcile" depois de conferido no provedor: com
+        `result` (o registro encontrado), como concluído; sem, devolve à fila
+        para uma nova criação.
+        """
+        now = time.time()
+        with self._lock:
+            if result is not None:
+                updated = self._conn.execute(
+                    "UPDATE outbox_jobs SET status = ?, result = ?, updated_at = ? "
+                    "WHERE id = ? AND status = ?",
+                    (
+                        DONE,
+                        json.dumps(result, ensure_ascii=False, default=str),
+                        now,
+                        job_id,
+                        RECONCILE,
+                    ),
+                ).rowcount
+            else:
+                updated = self._conn.execute(
+                    "UPDATE outbox_jobs SET status = ?, attempts = 0, available_at = ?, "
+                    "updated_at = ? WHERE id = ? AND status = ?",
+                    (PENDING, now, now, job_id, RECONCILE),
+                ).rowcount
+        if updated and result is None:
+            self.wake_all()
+        return bool(updated)
+
+    def _finish(
+        self,
+        job_id: int,
+        worker_id: str,
+        status: str,
+        result: Optional[str] = None,
+        error: Optional[str] = None,
+    ) -> bool:
+        with self._lock:
+            updated = self._conn.execute(
+                "UPDATE outbox_jobs SET status = ?, result = ?, error = ?, "
+                "locked_by = NULL, locked_until = NULL, updated_at = ? "
+                "WHERE id = ? AND locked_by = ?",
+                (status, result, error, time.time(), job_id, worker_id),
+            ).rowcount
+        return self._check_fence(job_id, worker_id, updated)
+
+    @staticmethod
+    def _check_fence(job_id: int, worker_id: str, updated: int) -> bool:
+        """
+        A conclusão só vale enquanto o worker mantém a reserva. Se ela expirou e
+        outro worker assumiu o job, o resultado atrasado é descartado para não
+        sobrescrever o estado da execução mais recente.
+        """
+        if not updated:
+            logger.warning(
+                "Outbox: reserva do job %s não pertence mais a %s; resultado descartado.",
+                job_id,
+                worker_id,
+            )
+        return bool(updated)
+
+    def get(self, job_id: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM outbox_jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_dict(row) if row is not None else None
+
+    def retry_failed(self) -> int:
+        """Devolve à fila os jobs com status "failed", zerando as tentativas."""
+        now = time.time()
+        with self._lock:
+            count = self._conn.execute(
+                "UPDATE outbox_jobs SET status = ?, attempts = 0, available_at = ?, "
+                "updated_at = ? WHERE status = ?",
+                (PENDING, now, now, FAILED),
+            ).rowcount
+        self.wake_all()
+        return count
+
+    def purge_done(self, older_than: float = 0.0) -> int:
+        """Remove os jobs concluídos há mais de `older_than` segundos."""
+        with self._lock:
+            return self._conn.execute(
+                "DELETE FROM outbox_jobs WHERE status = ? AND updated_at <= ?",
+                (DONE, time.time() - older_than),
+            ).rowcount
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM outbox_jobs GROUP BY status"
+            ).fetchall()
+        counts = {PENDING: 0, RUNNING: 0, DONE: 0, FAILED: 0, RECONCILE: 0}
+        counts.update({status: count for status, count in rows})
+        return counts
+
+    def wait_for_jobs(self, timeout: float) -> None:
+        """Bloqueia até um novo `enqueue` neste processo ou até `timeout`."""
+        with self._available:
+            self._available.wait(timeout)
+
+    def wake_all(self) -> None:
+        """Acorda todos os workers bloqueados em `wait_for_jobs`."""
+        with self._available:
+            self._available.notify_all()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        job = dict(row)
+        payload = json.loads(job.pop("args"))
+        job["args"], job["kwargs"] = payload["args"], payload["kwargs"]
+        if job["result"] is not None:
+            job["result"] = json.loads(job["result"])
+        return job
+
+
+class OutboxWorkerPool:
+    """
+    Threads que executam os jobs do `Outbox` com concorrência limitada.
+
+    Cada worker reserva um job por vez, chama o método correspondente no
+    cliente do domínio (via `ClientFactory`) e registra o resultado. Falhas
+    transitórias (rede, 429, 5xx, circuit breaker aberto) voltam à fila com
+    backoff exponencial até `max_attempts`; as demais (inclusive HTTP 4xx)
+    encerram o job como "failed". Nas criações sem deduplicação no provedor,
+    uma falha transitória após o envio encerra o job como "reconcile". Se a
+    reserva expirar durante a execução e outro worker assumir o job, o
+    resultado do primeiro é descartado.
+
+    Configuração (variáveis de ambiente):
+        - OUTBOX_WORKERS: workers simultâneos (default: 4)
+        - OUTBOX_POLL_INTERVAL: espera máxima, em segundos, entre verificações
+          da fila quando ela está vazia (default: 1)
+    """
+
+    def __init__(
+        self,
+        outbox: Outbox,
+        max_workers: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ):
+        self.outbox = outbox
+        self.max_workers = max_workers or int(os.getenv("OUTBOX_WORKERS", "4"))
+        self.poll_interval = poll_interval or float(os.getenv("OUTBOX_POLL_INTERVAL", "1"))
+        self.retry_policy = retry_policy or RetryPolicy(base_delay=2.0, max_delay=300.0)
+
+        self._stopping = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._prefix = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+    def start(self) -> "OutboxWorkerPool":
+        self._stopping.clear()
+        for index in range(self.max_workers):
+            thread = threading.Thread(
+                target=self._run,
+                args=(f"{self._prefix}:{index}",),
+                name=f"outbox-worker-{index}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+        logger.info("Outbox: %d workers iniciados.", self.max_workers)
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Para os workers após os jobs em execução."""
+        self._stopping.set()
+        self.outbox.wake_all()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads.clear()
+        logger.info("Outbox: workers finalizados.")
+
+    def run_until_empty(self) -> Dict[str, int]:
+        """Executa os jobs disponíveis na thread atual até esvaziar a fila."""
+        worker_id = f"{self._prefix}:sync"
+        while self._run_once(worker_id):
+            pass
+        return self.outbox.stats()
+
+    def __enter__(self) -> "OutboxWorkerPool":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _run(self, worker_id: str) -> None:
+        while not self._stopping.is_set():
+            try:
+                processed = self._run_once(worker_id)
+            except sqlite3.Error as e:
+                logger.error("Outbox: erro ao acessar a fila: %s", e)
+                processed = False
+            if not processed:
+                self.outbox.wait_for_jobs(self.poll_interval)
+
+    def _run_once(self, worker_id: str) -> bool:
+        job = self.outbox.claim(worker_id)
+        if job is None:
+            return False
+
+        label = f"{job['domain']}.{job['operation']}#{job['id']}"
+        try:
+            client = CLIENT_GETTERS[job["domain"]]()
+            method = getattr(client, OPERATIONS[job["domain"]][job["operation"]])
+            result = method(*job["args"], **job["kwargs"])
+        except Exception as e:
+            if is_retryable(e) and self._may_duplicate(job, e):
+                logger.error(
+                    "Outbox: %s pode ter sido aplicado no provedor (%s); "
+                    "conferir antes de reenviar.",
+                    label,
+                    e,
+                )
+                self.outbox.hold_for_reconciliation(job["id"], worker_id, str(e))
+            elif is_retryable(e):
+                if job["attempts"] >= job["max_attempts"]:
+                    logger.error(
+                        "Outbox: %s falhou após %d tentativas: %s", label, job["attempts"], e
+                    )
+                    self.outbox.fail(job["id"], worker_id, str(e))
+                else:
+                    delay = self.retry_policy.backoff(job["attempts"])
+                    logger.warning(
+                        "Outbox: %s falhou (%s); nova tentativa em %.1fs.", label, e, delay
+                    )
+                    self.outbox.fail(job["id"], worker_id, str(e), retry_in=delay)
+            elif isinstance(e, (ValueError, requests.HTTPError)):
+                # Payload inválido, erro de negócio ou HTTP 4xx do provedor:
+                # repetir não adianta.
+                logger.error("Outbox: %s recusado: %s", label, e)
+                self.outbox.fail(job["id"], worker_id, str(e))
+            else:
+                # Falha inesperada: também é definitiva, mas não pode derrubar o worker.
+                logger.exception("Outbox: %s falhou: %s", label, e)
+                self.outbox.fail(job["id"], worker_id, f"{type(e).__name__}: {e}")
+        else:
+            if self.outbox.complete(job["id"], worker_id, result):
+                logger.debug("Outbox: %s concluído.", label)
+        return True
+
+    @staticmethod
+    def _may_duplicate(job: Dict[str, Any], error: BaseException) -> bool:
+        operation = (job["domain"], job["operation"])
+        return operation in NON_IDEMPOTENT_OPERATIONS and not was_not_sent(error)
+
+
+_outbox: Optional[Outbox] = None
+_outbox_lock = threading.Lock()
+
+
+def get_outbox() -> Outbox:
+    """Retorna o `Outbox` compartilhado (criado sob demanda)."""
+    global _outbox
+    if _outbox is None:
+        with _outbox_lock:
+            if _outbox is None:
+                _outbox = Outbox()
+    return _outbox
+
+
+if __name__ == "__main__":
+    # Processo dedicado aos workers: python -m app.core.outbox
+    pool = OutboxWorkerPool(get_outbox()).start()
+    try:
+        while True:
+            time.sleep(60)
+            logger.info("Outbox: %s", get_outbox().stats())
+    except KeyboardInterrupt:
+        pool.stop()
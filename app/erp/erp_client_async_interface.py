@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict
+
+
+class AsyncERPClientInterface(ABC):
+    """Contraparte assíncrona (asyncio) de `ERPClientInterface`."""
+
+    @abstractmethod
+    async def create_accounts_receivable(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Cria um novo lançamento de contas a receber."""
+        pass
+
+    @abstractmethod
+    async def update_accounts_receivable(
+        self, id: str, data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Atualiza um lançamento de contas a receber existente."""
+        pass
+
+    @abstractmethod
+    async def settle_accounts_receivable(self, id: str) -> Dict[str, Any]:
+        """Dá baixa (marca como pago) em um lançamento de contas a receber."""
+        pass
+
+    @abstractmethod
+    async def cancel_accounts_receivable(self, id: str) -> Dict[str, Any]:
+        """Cancela um lançamento de contas a receber existente."""
+        pass
@@ -0,0 +1,56 @@
+from typing import Any, AsyncIterator, Dict, List, Optional
+from app.erp.erp_client_async_interface import AsyncERPClientInterface
+from app.erp.erp_client_mock import ERPClientMock
+from app.erp.utils.listing import DateLike
+from app.mocks.load_profile import LoadProfile
+from app.utils.metrics import instrument_client
+
+
+@instrument_client("mock", include=("create_accounts_receivable_batch",))
+class AsyncERPClientMock(AsyncERPClientInterface):
+    """Mock assíncrono de ERP; delega o armazenamento em memória ao `ERPClientMock`."""
+
+    def __init__(self):
+        # A latência e as falhas são aplicadas aqui, sem bloquear o event loop;
+        # o mock síncrono interno só guarda os dados.
+        self._load = LoadProfile.from_env()
+        self._client = ERPClientMock(LoadProfile())
+
+    async def create_accounts_receivable(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        await self._load.apply_async("create_accounts_receivable")
+        return self._client.create_accounts_receivable(data)
+
+    async def create_accounts_receivable_batch(
+        self, items: List[Dict[str, Any]], chunk_size: int = 50
+    ) -> Dict[str, Any]:
+        await self._load.apply_async("create_accounts_receivable_batch")
+        return self._client.create_accounts_receivable_batch(items, chunk_size)
+
+    async def update_accounts_receivable(
+        self, id: str, data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        await self._load.apply_async("update_accounts_receivable")
+        return self._client.update_accounts_receivable(id, data)
+
+    async def settle_accounts_receivable(self, id: str) -> Dict[str, Any]:
+        await self._load.apply_async("settle_accounts_receivable")
+        return self._client.settle_accounts_receivable(id)
+
+    async def cancel_accounts_receivable(self, id: str) -> Dict[str, Any]:
+        await self._load.apply_async("cancel_accounts_receivable")
+        return self._client.cancel_accounts_receivable(id)
+
+    async def list_accounts_receivable(
+        self,
+        status: Optional[str] = None,
+        due_date_from: Optional[DateLike] = None,
+        due_date_to: Optional[DateLike] = None,
+        customer_id: Optional[int] = None,
+        **filters: Any,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        await self._load.apply_async("list_accounts_receivable")
+        receivables = self._client.list_accounts_receivable(
+            status, due_date_from, due_date_to, customer_id, **filters
+        )
+        for receivable in receivables:
+            yield receivable
@@ -0,0 +1,246 @@
+import logging
+import httpx
+
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from app.erp.erp_client_async_interface import AsyncERPClientInterface
+from app.utils.async_http_transport import AsyncProviderTransport, get_async_transport
+from app.erp.utils.batch import (
+    INTEGRATION_KEY,
+    OMIE_MAX_BATCH_SIZE,
+    chunked,
+    item_success,
+    map_batch_results,
+)
+from app.erp.utils.listing import OMIE_MAX_PAGE_SIZE, DateLike
+from app.erp.utils.omie_base import RECEIVABLE_PATH, OmieClientBase
+from app.utils.circuit_breaker import CircuitOpenError
+from app.utils.json_codec import dumps_text
+from app.utils.logger import get_logger
+from app.utils.metrics import instrument_client
+from app.utils.pagination import Page, aiter_pages
+
+logger = get_logger(__name__)
+
+
+@instrument_client("omie", include=("create_accounts_receivable_batch",))
+class AsyncERPClientOmie(OmieClientBase, AsyncERPClientInterface):
+    """
+    Versão assíncrona do cliente Omie (Contas a Receber).
+
+    Mesmo contrato de `ERPClientOmie`, mas cada método é uma coroutine, o que
+    permite manter várias chamadas à Omie em voo na mesma thread.
+
+    Requisitos:
+        - Variáveis de ambiente:
+            - OMIE_APP_KEY
+            - OMIE_APP_SECRET
+            - OMIE_BASE_URL
+            - OMIE_DEFAULT_ACCOUNT_ID (opcional para baixa)
+    """
+
+    @property
+    def _http(self) -> AsyncProviderTransport:
+        return get_async_transport().for_provider("omie", retry_policy=self._retry_policy)
+
+    async def _post_to_omie(self, payload: Dict[str, Any], **kwargs: Any) -> httpx.Response:
+        url = self._url(RECEIVABLE_PATH)
+        logger.debug("Omie: POST para %s com payload: %s", url, payload)
+        return await self._http.post(url, json=payload, **kwargs)
+
+    async def create_accounts_receivable(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Cria um novo lançamento no Contas a Receber da Omie.
+
+        Args:
+            data (Dict[str, Any]): Dados do lançamento (ver `ERPClientOmie.create_accounts_receivable`).
+
+        Returns:
+            Dict[str, Any]: Resposta da API contendo os códigos do lançamento ou erro.
+        """
+
+        logger.debug("Omie: criando conta a receber com os dados fornecidos.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Omie: dados recebidos:\n%s",
+                dumps_text(data, indent=True),
+            )
+        integration_key = data.get(INTEGRATION_KEY)
+        stored = await self._idempotency.get_async("omie", integration_key)
+        if stored is not None:
+            logger.info(
+                f"Omie: lançamento {integration_key} já criado; retornando resposta registrada."
+            )
+            return stored
+
+        payload = self._create_payload(data)
+        response = await self._post_to_omie(payload, idempotency_key=integration_key)
+        result = self._handle_response(response)
+        await self._idempotency.put_async("omie", integration_key, result)
+        return result
+
+    async def create_accounts_receivable_batch(
+        self, items: List[Dict[str, Any]], chunk_size: int = OMIE_MAX_BATCH_SIZE
+    ) -> Dict[str, Any]:
+        """
+        Cria vários lançamentos no Contas a Receber usando a chamada em lote
+        `IncluirContaReceberPorLote`, com até `chunk_size` títulos por requisição.
+
+        Args:
+            items (List[Dict[str, Any]]): Lançamentos no mesmo formato de
+                `create_accounts_receivable`. Cada um deve possuir
+                `codigo_lancamento_integracao`, usado para mapear o resultado.
+            chunk_size (int): Quantidade máxima de títulos por lote (limite da Omie: 50).
+
+        Returns:
+            Dict[str, Any]: Resumo com `status` ("success", "partial" ou "error"),
+            contadores e o resultado de cada item em `results` (e em `failures`
+            apenas os que falharam).
+        """
+
+        chunk_size = self._batch_chunk_size(items, chunk_size)
+
+        results: List[Dict[str, Any]] = []
+        valid_items = []
+        for item in items:
+            integration_key = item.get(INTEGRATION_KEY)
+            if not integration_key:
+                results.append(self._missing_key_error())
+                continue
+
+            stored = await self._idempotency.get_async("omie", integration_key)
+            if stored is not None:
+                results.append(item_success(integration_key, stored))
+                continue
+
+            valid_items.append(self._normalize_receivable(dict(item)))
+
+        for lote, chunk in enumerate(chunked(valid_items, chunk_size), start=1):
+            payload = self._batch_payload(lote, chunk)
+            try:
+                # A Omie recusa `codigo_lancamento_integracao` repetido, então
+                # reenviar o lote não duplica títulos.
+                response = await self._post_to_omie(payload, idempotent=True)
+                result = self._handle_response(response)
+            except (httpx.HTTPError, CircuitOpenError, ValueError) as e:
+                results.extend(self._batch_failure(lote, chunk, e))
+                continue
+
+            for item_result in map_batch_results(chunk, result):
+                if item_result["status"] == "success":
+                    await self._idempotency.put_async(
+                        "omie", item_result[INTEGRATION_KEY], item_result["response"]
+                    )
+                results.append(item_result)
+
+        return self._batch_summary(results)
+
+    async def update_accounts_receivable(
+        self, id: str, data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Atualiza um lançamento existente no Contas a Receber.
+
+        Args:
+            id (str): Código do lançamento (`codigo_lancamento_omie`) a ser atualizado.
+            data (Dict[str, Any]): Campos a serem atualizados.
+
+        Returns:
+            Dict[str, Any]: Resposta da API com a confirmação da atualização.
+        """
+
+        logger.debug(f"Omie: iniciando atualização da conta a receber {id}.")
+
+        payload = self._update_payload(id, data)
+        response = await self._post_to_omie(payload, idempotent=True)
+        return self._handle_response(response)
+
+    async def settle_accounts_receivable(
+        self, id: str, valor: str, conta_corrente_id: str, data: str
+    ) -> Dict[str, Any]:
+        """
+        Realiza a baixa de um título em aberto no Contas a Receber da Omie.
+
+        Args:
+            id (str): Código do lançamento (`codigo_lancamento`) a ser baixado.
+            valor (str): Valor da baixa.
+            conta_corrente_id (str): ID da conta corrente.
+            data (str): Data da baixa no formato "dd/mm/aaaa".
+
+        Returns:
+            Dict[str, Any]: Resposta da API com os dados da baixa.
+        """
+
+        logger.debug(f"Omie: iniciando baixa da conta a receber {id}.")
+
+        payload = self._settle_payload(id, valor, conta_corrente_id, data)
+        response = await self._post_to_omie(payload)
+        return self._handle_response(response)
+
+    async def cancel_accounts_receivable(self, id: str) -> Dict[str, Any]:
+        """
+        Cancela (exclui) um lançamento existente no Contas a Receber da Omie.
+
+        Args:
+            id (str): Código do lançamento (`codigo_lancamento_omie`) a ser cancelado.
+
+        Returns:
+            Dict[str, Any]: Resposta da API com a confirmação da exclusão.
+        """
+
+        logger.debug(f"Omie: iniciando cancelamento da conta a receber {id}.")
+
+        payload = self._cancel_payload(id)
+        response = await self._post_to_omie(payload, idempotent=True)
+        return self._handle_response(response)
+
+    async def list_accounts_receivable(
+        self,
+        status: Optional[str] = None,
+        due_date_from: Optional[DateLike] = None,
+        due_date_to: Optional[DateLike] = None,
+        issue_date_from: Optional[DateLike] = None,
+        issue_date_to: Optional[DateLike] = None,
+        customer_id: Optional[int] = None,
+        page_size: int = OMIE_MAX_PAGE_SIZE,
+        prefetch: Optional[int] = None,
+        **filters: Any,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Percorre `ListarContasReceber` página a página, entregando um lançamento por vez.
+
+        As páginas seguintes à primeira são buscadas em paralelo (até `prefetch`
+        à frente; default: OMIE_LIST_PREFETCH ou 2), sempre sujeitas ao rate
+        limiter da Omie. Os lançamentos são entregues sob demanda, então uma
+        exportação completa nunca fica inteira em memória.
+
+        Args:
+            status (str): Ex: "A VENCER", "ATRASADO", "RECEBIDO", "CANCELADO".
+            due_date_from (date | str): Vencimento a partir de (inclusive).
+            due_date_to (date | str): Vencimento até (inclusive).
+            issue_date_from (date | str): Emissão a partir de (inclusive).
+            issue_date_to (date | str): Emissão até (inclusive).
+            customer_id (int): Código do cliente na Omie.
+            page_size (int): Registros por página (máximo 500).
+            filters: Outros filtros da API, com o nome original.
+        """
+        query, page_size, prefetch = self._list_query(
+            status,
+            due_date_from,
+            due_date_to,
+            issue_date_from,
+            issue_date_to,
+            customer_id,
+            page_size,
+            prefetch,
+            filters,
+        )
+
+        async def fetch_page(index: int) -> Page:
+            payload = self._list_page_payload(query, index, page_size)
+            response = await self._post_to_omie(payload, idempotent=True)
+            return self._parse_list_response(response)
+
+        async for page in aiter_pages(fetch_page, prefetch):
+            for receivable in page:
+                yield receivable
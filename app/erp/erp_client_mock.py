@@ -1,15 +1,27 @@
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, List, Optional
 from app.erp.erp_client_interface import ERPClientInterface
+from app.erp.utils.batch import INTEGRATION_KEY, item_error, item_success, summarize_batch
+from app.erp.utils.listing import DateLike
+from app.erp.utils.validators import validate_receivable_payload
+from app.mocks.load_profile import LoadProfile
+from app.mocks.store import MockStore, date_key
 from app.utils.logger import get_logger
+from app.utils.metrics import instrument_client
 
 logger = get_logger(__name__)
 
 
+@instrument_client("mock", include=("create_accounts_receivable_batch",))
 class ERPClientMock(ERPClientInterface):
-    def __init__(self):
+    def __init__(self, load_profile: Optional[LoadProfile] = None):
         self._token = None
-        self._receivables = {}
+        self._receivables = MockStore(
+            "ar",
+            indexes=("status", "codigo_cliente_fornecedor", INTEGRATION_KEY),
+            range_indexes={"data_vencimento": date_key},
+        )
+        self._load = load_profile or LoadProfile.from_env()
 
     def _get_config(self) -> Dict[str, Any]:
         logger.debug("MockERP: carregando configurações do ambiente.")
@@ -38,56 +50,97 @@ class ERPClientMock(ERPClientInterface):
         # Simula lógica real — aqui sempre será válido se gerado
 
     def create_accounts_receivable(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        self._load.apply("create_accounts_receivable")
+        return self._create_accounts_receivable(data)
+
+    def _create_accounts_receivable(self, data: Dict[str, Any]) -> Dict[str, Any]:
         logger.debug("MockERP: iniciando criação de conta a receber.")
         self._validate_token()
 
-        required_fields = [
-            "codigo_cliente_fornecedor",
-            "data_vencimento",
-            "valor_documento",
-            "codigo_categoria",
-            "id_conta_corrente",
-        ]
-        for field in required_fields:
-            if field not in data:
-                logger.error(f"MockERP: campo obrigatório '{field}' ausente.")
-                raise ValueError(f"Campo obrigatório '{field}' ausente.")
-
-        ar_id = f"ar-{len(self._receivables) + 1}"
-        self._receivables[ar_id] = {"id": ar_id, **data, "status": "open"}
+        try:
+            data = validate_receivable_payload(data)
+        except ValueError as e:
+            logger.error(f"MockERP: payload inválido: {e}")
+            raise
+
+        ar_id = self._receivables.insert({**data, "status": "open"})["id"]
 
         logger.info(f"MockERP: conta a receber criada com ID {ar_id}")
         return {"status": "success", "accounts_receivable_id": ar_id}
 
+    def create_accounts_receivable_batch(
+        self, items: List[Dict[str, Any]], chunk_size: int = 50
+    ) -> Dict[str, Any]:
+        logger.debug(f"MockERP: criando {len(items)} contas a receber em lote.")
+        self._load.apply("create_accounts_receivable_batch")
+        results = []
+        for item in items:
+            key = item.get(INTEGRATION_KEY)
+            try:
+                results.append(item_success(key, self._create_accounts_receivable(item)))
+            except ValueError as e:
+                results.append(item_error(key, str(e)))
+        return summarize_batch(results)
+
     def update_accounts_receivable(
         self, id: str, data: Dict[str, Any]
     ) -> Dict[str, Any]:
         logger.debug(f"MockERP: atualizando conta a receber {id}.")
-        if id not in self._receivables:
+        self._load.apply("update_accounts_receivable")
+        if self._receivables.update(id, data) is None:
             logger.warning(f"MockERP: conta a receber {id} não encontrada.")
             return {"status": "not_found"}
 
-        self._receivables[id].update(data)
         logger.info(f"MockERP: conta a receber {id} atualizada.")
         return {"status": "success", "updated_id": id}
 
     def settle_accounts_receivable(self, id: str) -> Dict[str, Any]:
         logger.debug(f"MockERP: efetuando baixa da conta a receber {id}.")
-        if id not in self._receivables:
+        self._load.apply("settle_accounts_receivable")
+        if self._receivables.update(id, {"status": "settled"}) is None:
             logger.warning(f"MockERP: conta a receber {id} não encontrada.")
             return {"status": "not_found"}
 
-        self._receivables[id]["status"] = "settled"
         logger.info(f"MockERP: conta a receber {id} marcada como paga.")
         return {"status": "success", "settled_id": id}
 
 
     def cancel_accounts_receivable(self, id: str) -> Dict[str, Any]:
         logger.debug(f"MockERP: cancelando conta a receber {id}.")
-        if id not in self._receivables:
+        self._load.apply("cancel_accounts_receivable")
+        if self._receivables.update(id, {"status": "cancelled"}) is None:
             logger.warning(f"MockERP: conta a receber {id} não encontrada.")
             return {"status": "not_found"}
 
-        self._receivables[id]["status"] = "cancelled"
         logger.info(f"MockERP: conta a receber {id} cancelada com sucesso.")
-        return {"status": "success", "cancelled_id": id}
\ No newline at end of file
+        return {"status": "success", "cancelled_id": id}
+
+    def list_accounts_receivable(
+        self,
+        status: Optional[str] = None,
+        due_date_from: Optional[DateLike] = None,
+        due_date_to: Optional[DateLike] = None,
+        customer_id: Optional[int] = None,
+        **filters: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Consulta as contas a receber do mock pelos índices, com os filtros
+        equivalentes aos de `ERPClientOmie.list_accounts_receivable`.
+
+        Args:
+            status (str): "open", "settled" ou "cancelled".
+            due_date_from (date | str): Vencimento a partir de (inclusive).
+            due_date_to (date | str): Vencimento até (inclusive).
+            customer_id (int): `codigo_cliente_fornecedor`.
+            filters: Igualdade em outros campos (ex: `codigo_lancamento_integracao`).
+
+        Ex: contas em aberto com vencimento até X:
+            `list_accounts_receivable(status="open", due_date_to=X)`
+        """
+        self._load.apply("list_accounts_receivable")
+        query = {"status": status, "codigo_cliente_fornecedor": customer_id, **filters}
+        query = {field: value for field, value in query.items() if value is not None}
+        ranges = {}
+        if due_date_from or due_date_to:
+            ranges["data_vencimento"] = (due_date_from, due_date_to)
+        return iter(self._receivables.find(ranges, **query))
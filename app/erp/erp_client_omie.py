@@ -1,16 +1,30 @@
-import os
-import json
+import logging
 import requests
 
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, List, Optional
 
 from app.erp.erp_client_interface import ERPClientInterface
+from app.utils.http_transport import get_transport
+from app.erp.utils.batch import (
+    INTEGRATION_KEY,
+    OMIE_MAX_BATCH_SIZE,
+    chunked,
+    item_success,
+    map_batch_results,
+)
+from app.erp.utils.listing import OMIE_MAX_PAGE_SIZE, DateLike
+from app.erp.utils.omie_base import RECEIVABLE_PATH, OmieClientBase
+from app.utils.circuit_breaker import CircuitOpenError
+from app.utils.json_codec import dumps_text
 from app.utils.logger import get_logger
+from app.utils.metrics import instrument_client
+from app.utils.pagination import Page, iter_pages
 
 logger = get_logger(__name__)
 
 
-class ERPClientOmie(ERPClientInterface):
+@instrument_client("omie", include=("create_accounts_receivable_batch",))
+class ERPClientOmie(OmieClientBase, ERPClientInterface):
     """
     Cliente responsável por integração com a API do Omie (Contas a Receber).
 
@@ -32,53 +46,13 @@ class ERPClientOmie(ERPClientInterface):
     """
 
     def __init__(self):
-        config = self._get_config()
-        self.base_url = config["base_url"]
-        self.app_key = config["app_key"]
-        self.app_secret = config["app_secret"]
-        self.default_account_id = config["default_account_id"]
-
-    def _get_config(self) -> Dict[str, Any]:
-        logger.debug("Omie: carregando configurações do ambiente.")
-        config = {
-            "app_key": os.getenv("OMIE_APP_KEY"),
-            "app_secret": os.getenv("OMIE_APP_SECRET"),
-            "base_url": os.getenv("OMIE_BASE_URL"),
-            "default_account_id": os.getenv("OMIE_DEFAULT_ACCOUNT_ID"),
-        }
-
-        if not config["app_key"] or not config["app_secret"]:
-            logger.error("Omie: OMIE_APP_KEY ou OMIE_APP_SECRET não configurados.")
-            raise EnvironmentError("Credenciais da Omie não configuradas.")
-
-        return config
-
-    def _build_payload(self, call: str, data: Dict[str, Any]) -> Dict[str, Any]:
-        logger.debug(f"Omie: construindo payload para chamada {call}.")
-        return {
-            "call": call,
-            "app_key": self.app_key,
-            "app_secret": self.app_secret,
-            "param": [data],
-        }
-
-    def _post_to_omie(self, path: str, payload: Dict[str, Any]) -> requests.Response:
-        url = f"{self.base_url}{path}"
-        logger.debug(f"Omie: POST para {url} com payload: {payload}")
-        return requests.post(url, json=payload)
-
-    def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
-        if response.status_code != 200:
-            logger.error(f"Omie: erro HTTP {response.status_code} - {response.text}")
-            response.raise_for_status()
-
-        result = response.json()
-        if "faultstring" in result:
-            logger.error(f"Omie: erro lógico da API: {result['faultstring']}")
-            raise ValueError(result["faultstring"])
-
-        logger.info(f"Omie: operação concluída com sucesso. Resposta: {result}")
-        return result
+        super().__init__()
+        self._http = get_transport().for_provider("omie", retry_policy=self._retry_policy)
+
+    def _post_to_omie(self, payload: Dict[str, Any], **kwargs: Any) -> requests.Response:
+        url = self._url(RECEIVABLE_PATH)
+        logger.debug("Omie: POST para %s com payload: %s", url, payload)
+        return self._http.post(url, json=payload, **kwargs)
 
     def create_accounts_receivable(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -100,20 +74,80 @@ class ERPClientOmie(ERPClientInterface):
         """
 
         logger.debug("Omie: criando conta a receber com os dados fornecidos.")
-        logger.debug(
-            f"Omie: dados recebidos:\n{json.dumps(data, indent=2, ensure_ascii=False)}"
-        )
-        for field in [
-            "codigo_cliente_fornecedor",
-            "valor_documento",
-            "id_conta_corrente",
-        ]:
-            if field in data:
-                data[field] = str(data[field])
-
-        payload = self._build_payload("IncluirContaReceber", data)
-        response = self._post_to_omie("financas/contareceber/", payload)
-        return self._handle_response(response)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Omie: dados recebidos:\n%s",
+                dumps_text(data, indent=True),
+            )
+        integration_key = data.get(INTEGRATION_KEY)
+        stored = self._idempotency.get("omie", integration_key)
+        if stored is not None:
+            logger.info(
+                f"Omie: lançamento {integration_key} já criado; retornando resposta registrada."
+            )
+            return stored
+
+        payload = self._create_payload(data)
+        response = self._post_to_omie(payload, idempotency_key=integration_key)
+        result = self._handle_response(response)
+        self._idempotency.put("omie", integration_key, result)
+        return result
+
+    def create_accounts_receivable_batch(
+        self, items: List[Dict[str, Any]], chunk_size: int = OMIE_MAX_BATCH_SIZE
+    ) -> Dict[str, Any]:
+        """
+        Cria vários lançamentos no Contas a Receber usando a chamada em lote
+        `IncluirContaReceberPorLote`, com até `chunk_size` títulos por requisição.
+
+        Args:
+            items (List[Dict[str, Any]]): Lançamentos no mesmo formato de
+                `create_accounts_receivable`. Cada um deve possuir
+                `codigo_lancamento_integracao`, usado para mapear o resultado.
+            chunk_size (int): Quantidade máxima de títulos por lote (limite da Omie: 50).
+
+        Returns:
+            Dict[str, Any]: Resumo com `status` ("success", "partial" ou "error"),
+            contadores e o resultado de cada item em `results` (e em `failures`
+            apenas os que falharam).
+        """
+
+        chunk_size = self._batch_chunk_size(items, chunk_size)
+
+        results: List[Dict[str, Any]] = []
+        valid_items = []
+        for item in items:
+            integration_key = item.get(INTEGRATION_KEY)
+            if not integration_key:
+                results.append(self._missing_key_error())
+                continue
+
+            stored = self._idempotency.get("omie", integration_key)
+            if stored is not None:
+                results.append(item_success(integration_key, stored))
+                continue
+
+            valid_items.append(self._normalize_receivable(dict(item)))
+
+        for lote, chunk in enumerate(chunked(valid_items, chunk_size), start=1):
+            payload = self._batch_payload(lote, chunk)
+            try:
+                # A Omie recusa `codigo_lancamento_integracao` repetido, então
+                # reenviar o lote não duplica títulos.
+                response = self._post_to_omie(payload, idempotent=True)
+                result = self._handle_response(response)
+            except (requests.RequestException, CircuitOpenError, ValueError) as e:
+                results.extend(self._batch_failure(lote, chunk, e))
+                continue
+
+            for item_result in map_batch_results(chunk, result):
+                if item_result["status"] == "success":
+                    self._idempotency.put(
+                        "omie", item_result[INTEGRATION_KEY], item_result["response"]
+                    )
+                results.append(item_result)
+
+        return self._batch_summary(results)
 
     def update_accounts_receivable(
         self, id: str, data: Dict[str, Any]
@@ -132,11 +166,8 @@ class ERPClientOmie(ERPClientInterface):
 
         logger.debug(f"Omie: iniciando atualização da conta a receber {id}.")
 
-        data_with_id = {"codigo_lancamento_omie": int(id), **data}
-
-        payload = self._build_payload(call="AlterarContaReceber", data=data_with_id)
-
-        response = self._post_to_omie("financas/contareceber/", payload)
+        payload = self._update_payload(id, data)
+        response = self._post_to_omie(payload, idempotent=True)
         return self._handle_response(response)
 
     def settle_accounts_receivable(
@@ -155,17 +186,8 @@ class ERPClientOmie(ERPClientInterface):
 
         logger.debug(f"Omie: iniciando baixa da conta a receber {id}.")
 
-        payload_data = {
-            "codigo_lancamento": int(id),
-            "codigo_conta_corrente": conta_corrente_id,
-            "valor": valor,
-            "data": data,
-            "observacao": "Baixa automática via API",
-        }
-
-        payload = self._build_payload(call="LancarRecebimento", data=payload_data)
-
-        response = self._post_to_omie("financas/contareceber/", payload)
+        payload = self._settle_payload(id, valor, conta_corrente_id, data)
+        response = self._post_to_omie(payload)
         return self._handle_response(response)
 
     def cancel_accounts_receivable(self, id: str) -> Dict[str, Any]:
@@ -181,11 +203,57 @@ class ERPClientOmie(ERPClientInterface):
 
         logger.debug(f"Omie: iniciando cancelamento da conta a receber {id}.")
 
-        payload_data = {
-            "codigo_lancamento_omie": int(id)
-        }
+        payload = self._cancel_payload(id)
+        response = self._post_to_omie(payload, idempotent=True)
+        return self._handle_response(response)
+
+    def list_accounts_receivable(
+        self,
+        status: Optional[str] = None,
+        due_date_from: Optional[DateLike] = None,
+        due_date_to: Optional[DateLike] = None,
+        issue_date_from: Optional[DateLike] = None,
+        issue_date_to: Optional[DateLike] = None,
+        customer_id: Optional[int] = None,
+        page_size: int = OMIE_MAX_PAGE_SIZE,
+        prefetch: Optional[int] = None,
+        **filters: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Percorre `ListarContasReceber` página a página, entregando um lançamento por vez.
+
+        As páginas seguintes à primeira são buscadas em paralelo (até `prefetch`
+        à frente; default: OMIE_LIST_PREFETCH ou 2), sempre sujeitas ao rate
+        limiter da Omie. Os lançamentos são entregues sob demanda, então uma
+        exportação completa nunca fica inteira em memória.
+
+        Args:
+            status (str): Ex: "A VENCER", "ATRASADO", "RECEBIDO", "CANCELADO".
+            due_date_from (date | str): Vencimento a partir de (inclusive).
+            due_date_to (date | str): Vencimento até (inclusive).
+            issue_date_from (date | str): Emissão a partir de (inclusive).
+            issue_date_to (date | str): Emissão até (inclusive).
+            customer_id (int): Código do cliente na Omie.
+            page_size (int): Registros por página (máximo 500).
+            filters: Outros filtros da API, com o nome original.
+        """
+        query, page_size, prefetch = self._list_query(
+            status,
+            due_date_from,
+            due_date_to,
+            issue_date_from,
+            issue_date_to,
+            customer_id,
+            page_size,
+            prefetch,
+            filters,
+        )
 
-        payload = self._build_payload(call="ExcluirContaReceber", data=payload_data)
+        def fetch_page(index: int) -> Page:
+            payload = self._list_page_payload(query, index, page_size)
+            response = self._post_to_omie(payload, idempotent=True)
+            return self._parse_list_response(response)
 
-        response = self._post_to_omie("financas/contareceber/", payload)
-        return self._handle_response(response)
\ No newline at end of file
+        for page in iter_pages(fetch_page, prefetch):
+            for receivable in page:
+                yield receivable
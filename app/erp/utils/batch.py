@@ -0,0 +1,112 @@
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+INTEGRATION_KEY = "codigo_lancamento_integracao"
+
+# Limite de registros aceitos pela Omie em uma única chamada "PorLote".
+OMIE_MAX_BATCH_SIZE = 50
+
+
+def chunked(items: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Divide `items` em listas de no máximo `size` elementos."""
+    if size <= 0:
+        raise ValueError("O tamanho do lote deve ser maior que zero.")
+
+    chunk: List[Dict[str, Any]] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _item_result(
+    key: Any, status: str, response: Any = None, error: Optional[str] = None
+) -> Dict[str, Any]:
+    result = {INTEGRATION_KEY: key, "status": status}
+    if response is not None:
+        result["response"] = response
+    if error is not None:
+        result["error"] = error
+    return result
+
+
+def item_success(key: Any, response: Any) -> Dict[str, Any]:
+    return _item_result(key, "success", response=response)
+
+
+def item_error(key: Any, error: str) -> Dict[str, Any]:
+    return _item_result(key, "error", error=error)
+
+
+def _find_item_results(result: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+    """Procura na resposta do lote uma lista de retornos individuais por item."""
+    for value in result.values():
+        if (
+            isinstance(value, list)
+            and value
+            and all(isinstance(entry, dict) and INTEGRATION_KEY in entry for entry in value)
+        ):
+            return value
+    return None
+
+
+def _is_success(entry: Dict[str, Any]) -> bool:
+    return str(entry.get("codigo_status", "0")) == "0"
+
+
+def map_batch_results(
+    chunk: List[Dict[str, Any]], result: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """
+    Associa o retorno de uma chamada `IncluirContaReceberPorLote` a cada item do lote.
+
+    Quando a Omie devolve retornos individuais, cada um é mapeado pelo
+    `codigo_lancamento_integracao`. Caso contrário, o status do lote
+    (`codigo_status`/`descricao_status`) é aplicado a todos os itens.
+    """
+    keys = [item.get(INTEGRATION_KEY) for item in chunk]
+    entries = _find_item_results(result)
+
+    if entries is None:
+        if _is_success(result):
+            return [item_success(key, result) for key in keys]
+        error = result.get("descricao_status") or "Lote rejeitado pela Omie."
+        return [item_error(key, error) for key in keys]
+
+    by_key = {str(entry[INTEGRATION_KEY]): entry for entry in entries}
+    mapped = []
+    for key in keys:
+        entry = by_key.get(str(key))
+        if entry is None:
+            mapped.append(item_error(key, "Item sem retorno na resposta do lote."))
+        elif _is_success(entry):
+            mapped.append(item_success(key, entry))
+        else:
+            mapped.append(
+                item_error(key, entry.get("descricao_status") or "Item rejeitado pela Omie.")
+            )
+    return mapped
+
+
+def summarize_batch(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Consolida os resultados por item em um resumo do processamento em lote."""
+    failures = [result for result in results if result["status"] != "success"]
+    succeeded = len(results) - len(failures)
+
+    if not failures:
+        status = "success"
+    elif succeeded:
+        status = "partial"
+    else:
+        status = "error"
+
+    return {
+        "status": status,
+        "total": len(results),
+        "succeeded": succeeded,
+        "failed": len(failures),
+        "results": results,
+        "failures": failures,
+    }
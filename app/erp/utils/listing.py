@@ -0,0 +1,60 @@
+from datetime import date
+from typing import Any, Dict, Optional, Union
+
+from app.utils.pagination import Page
+
+# Limite de registros por página aceito por `ListarContasReceber`.
+OMIE_MAX_PAGE_SIZE = 500
+
+# A Omie responde uma página sem registros com `faultstring` em vez de lista vazia.
+NO_RECORDS_FAULT = "Não existem registros"
+
+DateLike = Union[str, date]
+
+
+def _format_date(value: DateLike) -> str:
+    return value.strftime("%d/%m/%Y") if isinstance(value, date) else value
+
+
+def build_receivable_filters(
+    status: Optional[str] = None,
+    due_date_from: Optional[DateLike] = None,
+    due_date_to: Optional[DateLike] = None,
+    issue_date_from: Optional[DateLike] = None,
+    issue_date_to: Optional[DateLike] = None,
+    customer_id: Optional[Union[int, str]] = None,
+    **extra: Any,
+) -> Dict[str, Any]:
+    """
+    Monta os filtros de `ListarContasReceber`.
+
+    Datas aceitam `date` ou texto no formato `DD/MM/AAAA` (o da Omie); os
+    intervalos são inclusivos. Outros filtros da API (ex: `filtrar_conta_corrente`)
+    podem ser passados em `extra` com o nome original.
+    """
+    filters: Dict[str, Any] = {
+        "filtrar_por_status": status,
+        "filtrar_por_data_de": _format_date(due_date_from) if due_date_from else None,
+        "filtrar_por_data_ate": _format_date(due_date_to) if due_date_to else None,
+        "filtrar_por_emissao_de": _format_date(issue_date_from) if issue_date_from else None,
+        "filtrar_por_emissao_ate": _format_date(issue_date_to) if issue_date_to else None,
+        "filtrar_cliente": customer_id,
+        **extra,
+    }
+    filters = {key: value for key, value in filters.items() if value is not None}
+    filters.setdefault("apenas_importado_api", "N")
+    return filters
+
+
+def page_params(filters: Dict[str, Any], index: int, page_size: int) -> Dict[str, Any]:
+    return {**filters, "pagina": index + 1, "registros_por_pagina": page_size}
+
+
+def parse_receivable_page(body: Dict[str, Any]) -> Page:
+    """Converte a resposta da listagem em `(itens, total de páginas)`."""
+    fault = body.get("faultstring")
+    if fault:
+        if NO_RECORDS_FAULT in fault:
+            return [], 0
+        raise ValueError(fault)
+    return body.get("conta_receber_cadastro", []), body.get("total_de_paginas")
@@ -0,0 +1,205 @@
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.erp.utils.batch import (
+    INTEGRATION_KEY,
+    OMIE_MAX_BATCH_SIZE,
+    item_error,
+    summarize_batch,
+)
+from app.erp.utils.listing import (
+    OMIE_MAX_PAGE_SIZE,
+    DateLike,
+    build_receivable_filters,
+    page_params,
+    parse_receivable_page,
+)
+from app.utils.idempotency_store import get_idempotency_store
+from app.utils.json_codec import decode_response
+from app.utils.logger import get_logger
+from app.utils.pagination import Page
+from app.utils.retry import RetryPolicy
+
+logger = get_logger(__name__)
+
+# A Omie responde erros de negócio (`faultstring`) com HTTP 500; só os demais
+# status transitórios são repetidos.
+OMIE_RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
+
+RECEIVABLE_PATH = "financas/contareceber/"
+
+
+class OmieClientBase:
+    """
+    Configuração, montagem dos payloads e leitura das respostas da API da Omie
+    (Contas a Receber).
+
+    Não faz I/O de rede, e por isso é compartilhado pelos clientes síncrono
+    (`ERPClientOmie`) e assíncrono (`AsyncERPClientOmie`), que só enviam as
+    requisições. As respostas podem vir do `requests` ou do `httpx`.
+    """
+
+    def __init__(self):
+        config = self._get_config()
+        self.base_url = config["base_url"]
+        self.app_key = config["app_key"]
+        self.app_secret = config["app_secret"]
+        self.default_account_id = config["default_account_id"]
+        self._idempotency = get_idempotency_store()
+        self._retry_policy = RetryPolicy(retry_on_status=OMIE_RETRYABLE_STATUS_CODES)
+
+    def _get_config(self) -> Dict[str, Any]:
+        logger.debug("Omie: carregando configurações do ambiente.")
+        config = {
+            "app_key": os.getenv("OMIE_APP_KEY"),
+            "app_secret": os.getenv("OMIE_APP_SECRET"),
+            "base_url": os.getenv("OMIE_BASE_URL"),
+            "default_account_id": os.getenv("OMIE_DEFAULT_ACCOUNT_ID"),
+        }
+
+        if not config["app_key"] or not config["app_secret"]:
+            logger.error("Omie: OMIE_APP_KEY ou OMIE_APP_SECRET não configurados.")
+            raise EnvironmentError("Credenciais da Omie não configuradas.")
+
+        return config
+
+    def _build_payload(self, call: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        logger.debug(f"Omie: construindo payload para chamada {call}.")
+        return {
+            "call": call,
+            "app_key": self.app_key,
+            "app_secret": self.app_secret,
+            "param": [data],
+        }
+
+    def _url(self, path: str) -> str:
+        return f"{self.base_url}{path}"
+
+    def _handle_response(self, response: Any) -> Dict[str, Any]:
+        if response.status_code != 200:
+            logger.error(f"Omie: erro HTTP {response.status_code} - {response.text}")
+            response.raise_for_status()
+
+        result = decode_response(response)
+        if "faultstring" in result:
+            logger.error(f"Omie: erro lógico da API: {result['faultstring']}")
+            raise ValueError(result["faultstring"])
+
+        logger.info("Omie: operação concluída com sucesso. Resposta: %s", result)
+        return result
+
+    def _normalize_receivable(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        for field in [
+            "codigo_cliente_fornecedor",
+            "valor_documento",
+            "id_conta_corrente",
+        ]:
+            if field in data:
+                data[field] = str(data[field])
+        return data
+
+    def _create_payload(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        self._normalize_receivable(data)
+        return self._build_payload("IncluirContaReceber", data)
+
+    def _update_payload(self, id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        data_with_id = {"codigo_lancamento_omie": int(id), **data}
+        return self._build_payload(call="AlterarContaReceber", data=data_with_id)
+
+    def _settle_payload(
+        self, id: str, valor: str, conta_corrente_id: str, data: str
+    ) -> Dict[str, Any]:
+        payload_data = {
+            "codigo_lancamento": int(id),
+            "codigo_conta_corrente": conta_corrente_id,
+            "valor": valor,
+            "data": data,
+            "observacao": "Baixa automática via API",
+        }
+        return self._build_payload(call="LancarRecebimento", data=payload_data)
+
+    def _cancel_payload(self, id: str) -> Dict[str, Any]:
+        payload_data = {"codigo_lancamento_omie": int(id)}
+        return self._build_payload(call="ExcluirContaReceber", data=payload_data)
+
+    # --- Lote ---------------------------------------------------------------
+
+    def _batch_chunk_size(self, items: List[Dict[str, Any]], chunk_size: int) -> int:
+        chunk_size = min(chunk_size, OMIE_MAX_BATCH_SIZE)
+        logger.debug(
+            f"Omie: criando {len(items)} contas a receber em lotes de {chunk_size}."
+        )
+        return chunk_size
+
+    def _missing_key_error(self) -> Dict[str, Any]:
+        return item_error(None, f"Campo obrigatório '{INTEGRATION_KEY}' ausente.")
+
+    def _batch_payload(self, lote: int, chunk: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return self._build_payload(
+            "IncluirContaReceberPorLote",
+            {"lote": lote, "conta_receber_cadastro": chunk},
+        )
+
+    def _batch_failure(
+        self, lote: int, chunk: List[Dict[str, Any]], error: Exception
+    ) -> List[Dict[str, Any]]:
+        logger.error(f"Omie: falha no lote {lote} ({len(chunk)} itens): {error}")
+        return [item_error(item[INTEGRATION_KEY], str(error)) for item in chunk]
+
+    def _batch_summary(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        summary = summarize_batch(results)
+        logger.info(
+            f"Omie: lote concluído — {summary['succeeded']} criados, "
+            f"{summary['failed']} com falha."
+        )
+        return summary
+
+    # --- Listagem -----------------------------------------------------------
+
+    def _list_query(
+        self,
+        status: Optional[str],
+        due_date_from: Optional[DateLike],
+        due_date_to: Optional[DateLike],
+        issue_date_from: Optional[DateLike],
+        issue_date_to: Optional[DateLike],
+        customer_id: Optional[int],
+        page_size: int,
+        prefetch: Optional[int],
+        filters: Dict[str, Any],
+    ) -> Tuple[Dict[str, Any], int, int]:
+        """Filtros da listagem, tamanho de página e páginas buscadas à frente."""
+        page_size = min(page_size, OMIE_MAX_PAGE_SIZE)
+        prefetch = prefetch or int(os.getenv("OMIE_LIST_PREFETCH", "2"))
+        query = build_receivable_filters(
+            status,
+            due_date_from,
+            due_date_to,
+            issue_date_from,
+            issue_date_to,
+            customer_id,
+            **filters,
+        )
+        logger.info("Omie: listando contas a receber com filtros %s.", query)
+        return query, page_size, prefetch
+
+    def _list_page_payload(
+        self, query: Dict[str, Any], index: int, page_size: int
+    ) -> Dict[str, Any]:
+        return self._build_payload("ListarContasReceber", page_params(query, index, page_size))
+
+    def _parse_list_response(self, response: Any) -> Page:
+        try:
+            body = decode_response(response)
+        except ValueError:
+            body = None
+
+        # Erros de negócio (inclusive "página sem registros") chegam como HTTP 500.
+        if not isinstance(body, dict) or (
+            response.status_code != 200 and "faultstring" not in body
+        ):
+            logger.error(f"Omie: erro HTTP {response.status_code} - {response.text}")
+            response.raise_for_status()
+            raise ValueError("Omie: resposta da listagem não está em JSON.")
+
+        return parse_receivable_page(body)
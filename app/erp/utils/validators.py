@@ -0,0 +1,39 @@
+from typing import Any, Dict
+
+from app.utils.schema import Field, Schema, is_absent
+
+# Campos exigidos na criação de uma conta a receber.
+REQUIRED_FIELDS_CREATE_RECEIVABLE = [
+    "codigo_cliente_fornecedor",
+    "data_vencimento",
+    "valor_documento",
+    "codigo_categoria",
+    "id_conta_corrente",
+]
+
+# Schema da criação de contas a receber (use com `validate_many` para lotes).
+# Como no mock original, só a chave ausente é erro (None é aceito).
+CREATE_RECEIVABLE_SCHEMA = Schema(
+    [
+        Field(
+            field,
+            required=True,
+            missing=is_absent,
+            required_message="Campo obrigatório '{name}' ausente.",
+        )
+        for field in REQUIRED_FIELDS_CREATE_RECEIVABLE
+    ]
+)
+
+
+def validate_receivable_payload(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Valida os campos obrigatórios da criação de uma conta a receber.
+
+    Returns:
+        Dict[str, Any]: Cópia validada dos dados.
+
+    Raises:
+        ValueError: Com todos os campos obrigatórios ausentes.
+    """
+    return CREATE_RECEIVABLE_SCHEMA.check(data)
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+
+class BorrowerSourceInterface(ABC):
+    """Origem dos dados de tomadores (borrowers) usados na emissão de NFSE."""
+
+    @abstractmethod
+    def get_by_federal_tax_number(self, federal_tax_number: Any) -> Optional[Dict[str, Any]]:
+        """Retorna o tomador com o CPF/CNPJ informado, ou None se não existir."""
+        pass
@@ -0,0 +1,29 @@
+from typing import Any, Dict, Iterable, Optional
+
+from app.invoice.borrower_source_interface import BorrowerSourceInterface
+from app.invoice.utils.borrower_index import (
+    index_by_federal_tax_number,
+    normalize_federal_tax_number,
+)
+from app.mocks.borrowers import MockBorrower
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class BorrowerSourceMock(BorrowerSourceInterface):
+    """
+    Origem de tomadores em memória, indexada por `federalTaxNumber`.
+
+    Por padrão usa `MockBorrower.mock_infos`; uma lista própria pode ser
+    informada (ex: carga de uma planilha de tomadores).
+    """
+
+    def __init__(self, borrowers: Optional[Iterable[Dict[str, Any]]] = None):
+        self._index = index_by_federal_tax_number(
+            MockBorrower.mock_infos if borrowers is None else borrowers
+        )
+        logger.debug(f"MockBorrowerSource: {len(self._index)} tomadores indexados.")
+
+    def get_by_federal_tax_number(self, federal_tax_number: Any) -> Optional[Dict[str, Any]]:
+        return self._index.get(normalize_federal_tax_number(federal_tax_number))
@@ -65,4 +65,9 @@ VALID_TAXATION_TYPES = [
     "SuspendedCourtDecision", "SuspendedAdministrativeProcedure",
     "OutsideCityFree", "OutsideCityImmune", "OutsideCitySuspended",
     "OutsideCitySuspendedAdministrativeProcedure", "ObjectiveImune"
-]
\ No newline at end of file
+]
+
+# `flowStatus` finais de uma NFSE: a partir deles não há mais mudança de estado.
+SUCCESS_FLOW_STATUSES = {"Issued", "Cancelled"}
+FAILED_FLOW_STATUSES = {"IssueFailed", "CancelFailed"}
+TERMINAL_FLOW_STATUSES = SUCCESS_FLOW_STATUSES | FAILED_FLOW_STATUSES
@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict
+
+
+class AsyncInvoiceClientInterface(ABC):
+    """Contraparte assíncrona (asyncio) de `InvoiceClientInterface`."""
+
+    @abstractmethod
+    async def issue_invoice(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Emite uma nova nota fiscal."""
+        pass
+
+    @abstractmethod
+    async def cancel_invoice(self, invoice_id: str) -> Dict[str, Any]:
+        """Cancela uma nota fiscal existente."""
+        pass
+
+    @abstractmethod
+    async def get_invoice_status(self, invoice_id: str) -> Dict[str, Any]:
+        """Consulta o status de uma nota fiscal."""
+        pass
+
+    @abstractmethod
+    async def download_invoice(self, invoice_id: str) -> Dict[str, Any]:
+        """Obtém o link ou conteúdo em PDF da nota fiscal emitida."""
+        pass
@@ -0,0 +1,48 @@
+from typing import Any, AsyncIterator, Dict, Optional
+from app.invoice.invoice_client_async_interface import AsyncInvoiceClientInterface
+from app.invoice.invoice_client_mock import InvoiceClientMock
+from app.mocks.load_profile import LoadProfile
+from app.utils.metrics import instrument_client
+
+
+@instrument_client("mock")
+class AsyncInvoiceClientMock(AsyncInvoiceClientInterface):
+    """Mock assíncrono de NFSE; delega o armazenamento em memória ao `InvoiceClientMock`."""
+
+    def __init__(self):
+        # A latência e as falhas são aplicadas aqui, sem bloquear o event loop;
+        # o mock síncrono interno só guarda os dados.
+        self._load = LoadProfile.from_env()
+        self._client = InvoiceClientMock(
+            LoadProfile(invoice_issue_delay=self._load.invoice_issue_delay)
+        )
+
+    def get_access_token(self) -> str:
+        return self._client.get_access_token()
+
+    async def issue_invoice(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        await self._load.apply_async("issue_invoice")
+        return self._client.issue_invoice(data)
+
+    async def cancel_invoice(self, invoice_id: str) -> Dict[str, Any]:
+        await self._load.apply_async("cancel_invoice")
+        return self._client.cancel_invoice(invoice_id)
+
+    async def get_invoice_status(self, invoice_id: str) -> Dict[str, Any]:
+        await self._load.apply_async("get_invoice_status")
+        return self._client.get_invoice_status(invoice_id)
+
+    async def download_invoice(self, invoice_id: str) -> Dict[str, Any]:
+        await self._load.apply_async("download_invoice")
+        return self._client.download_invoice(invoice_id)
+
+    async def list_invoices(
+        self,
+        status: Optional[str] = None,
+        customer_id: Optional[Any] = None,
+        external_id: Optional[str] = None,
+        **filters: Any,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        await self._load.apply_async("list_invoices")
+        for invoice in self._client.list_invoices(status, customer_id, external_id, **filters):
+            yield invoice
@@ -0,0 +1,82 @@
+from typing import Any, Dict, Iterable, Optional
+
+from app.invoice.invoice_client_async_interface import AsyncInvoiceClientInterface
+from app.invoice.utils.nfe_io_base import NFEioClientBase
+from app.invoice.utils.status_poller import InvoiceStatusPoller, StatusCallback
+from app.utils.async_http_transport import AsyncProviderTransport, get_async_transport
+from app.utils.logger import get_logger
+from app.utils.metrics import instrument_client
+
+
+logger = get_logger(__name__)
+
+
+@instrument_client("nfe_io")
+class AsyncInvoiceClientNFEio(NFEioClientBase, AsyncInvoiceClientInterface):
+    """Versão assíncrona de `InvoiceClientNFEio`; `create_data` continua síncrono."""
+
+    @property
+    def _http(self) -> AsyncProviderTransport:
+        return get_async_transport().for_provider("nfe_io")
+
+    async def issue_invoice(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Emite uma nova nota fiscal de serviço (NFSE)."""
+        logger.debug("NFE.io: Emitindo NFSE com os dados:")
+        logger.debug(data)
+
+        external_id = data.get("externalId")
+        stored = await self._idempotency.get_async("nfe_io", external_id)
+        if stored is not None:
+            logger.info(f"NFE.io: NFSE {external_id} já emitida; retornando resposta registrada.")
+            return stored
+
+        # Sem `idempotency_key`: a NFE.io não recusa `externalId` repetido, então
+        # repetir após uma resposta perdida emitiria uma segunda nota.
+        response = await self._http.post(
+            self._invoices_url(),
+            headers=self._headers(),
+            json=data,
+        )
+
+        result = self._handle_response(response, "emitir NFSE", expected=202)
+        await self._idempotency.put_async("nfe_io", external_id, result)
+        return result
+
+    async def cancel_invoice(self, invoice_id: str) -> Dict[str, Any]:
+        """Cancela uma NFSE existente."""
+        logger.debug(f"NFE.io: Cancelando NFSE {invoice_id}...")
+
+        response = await self._http.delete(
+            self._invoice_url(invoice_id), headers=self._headers(), idempotent=True
+        )
+        return self._handle_response(response, "cancelar NFSE")
+
+    async def get_invoice_status(self, invoice_id: str) -> Dict[str, Any]:
+        """Consulta o status/detalhes de uma NFSE."""
+        logger.debug(f"NFE.io: Consultando NFSE {invoice_id}...")
+
+        response = await self._http.get(self._invoice_url(invoice_id), headers=self._headers())
+        return self._handle_response(response, "consultar NFSE")
+
+    async def download_invoice(self, invoice_id: str) -> Dict[str, Any]:
+        """Obtém o link para download do PDF da NFSE emitida."""
+        logger.debug(f"NFE.io: Solicitando PDF da nota {invoice_id}...")
+
+        url = f"{self._invoice_url(invoice_id)}/pdf"
+        response = await self._http.get(url, headers=self._headers())
+        return self._pdf_link(response, invoice_id)
+
+    async def poll_invoices(
+        self,
+        invoice_ids: Iterable[str],
+        on_complete: Optional[StatusCallback] = None,
+        **poller_options: Any,
+    ) -> Dict[str, Any]:
+        """
+        Acompanha NFSE emitidas (202) até que cheguem a um `flowStatus` final.
+
+        Ver `InvoiceStatusPoller`; `poller_options` são repassadas a ele.
+        """
+        poller = InvoiceStatusPoller(self, on_complete=on_complete, **poller_options)
+        poller.add_many(invoice_ids)
+        return await poller.run()
@@ -1,15 +1,21 @@
 import os
-from typing import Any, Dict
+import time
+from typing import Any, Dict, Iterator, Optional
 from app.invoice.invoice_client_interface import InvoiceClientInterface
+from app.mocks.load_profile import LoadProfile
+from app.mocks.store import MockStore
 from app.utils.logger import get_logger
+from app.utils.metrics import instrument_client
 
 logger = get_logger(__name__)
 
 
+@instrument_client("mock")
 class InvoiceClientMock(InvoiceClientInterface):
-    def __init__(self):
+    def __init__(self, load_profile: Optional[LoadProfile] = None):
         self._token = None
-        self._invoices = {}
+        self._invoices = MockStore("inv", indexes=("status", "customer_id", "externalId"))
+        self._load = load_profile or LoadProfile.from_env()
 
     def get_config(self) -> Dict[str, Any]:
         logger.debug("MockInvoice: carregando configurações do ambiente.")
@@ -28,6 +34,7 @@ class InvoiceClientMock(InvoiceClientInterface):
         return self._token
 
     def issue_invoice(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        self._load.apply("issue_invoice")
         token = data.get("token")
         if token != self._token:
             logger.error("MockInvoice: token inválido ou ausente ao emitir nota.")
@@ -41,30 +48,39 @@ class InvoiceClientMock(InvoiceClientInterface):
 
         logger.info(f"MockInvoice: token {token} validado com sucesso.")
 
-        invoice_id = f"inv-{len(self._invoices) + 1}"
-        self._invoices[invoice_id] = {
-            "id": invoice_id,
+        invoice_id = self._invoices.insert({
             "customer_id": data["customer_id"],
             "amount": data["amount"],
             "description": data["service_description"],
-            "status": "issued",
-        }
+            "externalId": data.get("externalId"),
+            # Como na NFE.io, a nota é processada de forma assíncrona: fica
+            # "processing" até `invoice_issue_delay` segundos após a emissão.
+            "status": "processing" if self._load.invoice_issue_delay > 0 else "issued",
+            "issued_at": time.monotonic() + self._load.invoice_issue_delay,
+        })["id"]
 
         logger.info(f"MockInvoice: nota fiscal emitida com ID {invoice_id}")
         return {"status": "success", "invoice_id": invoice_id}
 
+    def _current_invoice(self, invoice_id: str) -> Optional[Dict[str, Any]]:
+        def finish_processing(invoice: Dict[str, Any]) -> None:
+            if invoice["status"] == "processing" and time.monotonic() >= invoice["issued_at"]:
+                invoice["status"] = "issued"
+
+        return self._invoices.modify(invoice_id, finish_processing)
+
     def cancel_invoice(self, invoice_id: str) -> Dict[str, Any]:
-        invoice = self._invoices.get(invoice_id)
-        if not invoice:
+        self._load.apply("cancel_invoice")
+        if self._invoices.update(invoice_id, {"status": "cancelled"}) is None:
             logger.warning(f"MockInvoice: nota fiscal {invoice_id} não encontrada.")
             return {"status": "not_found"}
 
-        invoice["status"] = "cancelled"
         logger.info(f"MockInvoice: nota fiscal {invoice_id} cancelada.")
         return {"status": "success", "cancelled_id": invoice_id}
 
     def get_invoice_status(self, invoice_id: str) -> Dict[str, Any]:
-        invoice = self._invoices.get(invoice_id)
+        self._load.apply("get_invoice_status")
+        invoice = self._current_invoice(invoice_id)
         if not invoice:
             logger.warning(f"MockInvoice: nota fiscal {invoice_id} não encontrada.")
             return {"status": "not_found"}
@@ -73,11 +89,41 @@ class InvoiceClientMock(InvoiceClientInterface):
         return {"status": "success", "invoice_status": invoice["status"]}
 
     def download_invoice(self, invoice_id: str) -> Dict[str, Any]:
-        invoice = self._invoices.get(invoice_id)
+        self._load.apply("download_invoice")
+        invoice = self._current_invoice(invoice_id)
         if not invoice:
             logger.warning(f"MockInvoice: nota fiscal {invoice_id} não encontrada para download.")
             return {"status": "not_found"}
+        if invoice["status"] == "processing":
+            logger.info(f"MockInvoice: nota fiscal {invoice_id} ainda em processamento.")
+            return {"status": "processing", "invoice_id": invoice_id}
 
         pdf_url = f"https://mock-invoice.local/pdf/{invoice_id}.pdf"
         logger.info(f"MockInvoice: link gerado para download da nota {invoice_id}: {pdf_url}")
         return {"status": "success", "invoice_id": invoice_id, "pdf_url": pdf_url}
+
+    def list_invoices(
+        self,
+        status: Optional[str] = None,
+        customer_id: Optional[Any] = None,
+        external_id: Optional[str] = None,
+        **filters: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Consulta as notas do mock pelos índices.
+
+        Args:
+            status (str): "processing", "issued" ou "cancelled".
+            customer_id: Cliente da nota.
+            external_id (str): `externalId` informado na emissão.
+            filters: Igualdade em outros campos.
+        """
+        self._load.apply("list_invoices")
+        # Notas cujo processamento já terminou ainda constam como "processing"
+        # até serem consultadas; atualiza antes de usar o índice de status.
+        for invoice in self._invoices.find(status="processing"):
+            self._current_invoice(invoice["id"])
+
+        query = {"status": status, "customer_id": customer_id, "externalId": external_id, **filters}
+        query = {field: value for field, value in query.items() if value is not None}
+        return iter(self._invoices.find(**query))
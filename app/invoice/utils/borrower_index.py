@@ -0,0 +1,23 @@
+from typing import Any, Dict, Iterable
+
+
+def normalize_federal_tax_number(federal_tax_number: Any) -> str:
+    """
+    Normaliza CPF/CNPJ para a forma usada como chave de busca: apenas dígitos.
+
+    Aceita inteiro (`59696922000128`) ou texto com ou sem máscara
+    (`"59.696.922/0001-28"`).
+    """
+    return "".join(ch for ch in str(federal_tax_number) if ch.isdigit())
+
+
+def index_by_federal_tax_number(
+    borrowers: Iterable[Dict[str, Any]],
+) -> Dict[str, Dict[str, Any]]:
+    """Monta um índice `{CPF/CNPJ normalizado: tomador}`; o último registro repetido prevalece."""
+    index: Dict[str, Dict[str, Any]] = {}
+    for borrower in borrowers:
+        key = borrower.get("federalTaxNumber")
+        if key is not None:
+            index[normalize_federal_tax_number(key)] = borrower
+    return index
@@ -0,0 +1,71 @@
+import os
+import threading
+from typing import Any, Dict, Optional
+
+from app.invoice.borrower_source_interface import BorrowerSourceInterface
+from app.invoice.borrower_source_mock import BorrowerSourceMock
+from app.invoice.utils.borrower_index import normalize_federal_tax_number
+from app.utils.logger import get_logger
+from app.utils.lru_cache import TTLCache
+
+logger = get_logger(__name__)
+
+
+class BorrowerRegistry:
+    """
+    Resolve tomadores por origem (`"mock"`, ...) com um cache LRU/TTL na frente.
+
+    Cada origem é uma implementação de `BorrowerSourceInterface`, registrada com
+    `register`. As consultas são cacheadas por (origem, CPF/CNPJ normalizado), de
+    modo que montar vários payloads para o mesmo tomador consulta a origem uma
+    única vez. Tomadores não encontrados não são cacheados.
+
+    Configuração (variáveis de ambiente):
+        - BORROWER_CACHE_SIZE: tomadores mantidos em cache (default: 10000)
+        - BORROWER_CACHE_TTL: validade de cada entrada em segundos (default: 300)
+    """
+
+    def __init__(self, cache: Optional[TTLCache] = None):
+        self._sources: Dict[str, BorrowerSourceInterface] = {}
+        self.cache = cache or TTLCache(
+            maxsize=int(os.getenv("BORROWER_CACHE_SIZE", "10000")),
+            ttl=float(os.getenv("BORROWER_CACHE_TTL", "300")),
+        )
+
+    def register(self, origem: str, source: BorrowerSourceInterface) -> None:
+        """Registra (ou substitui) a origem de tomadores `origem`."""
+        self._sources[origem] = source
+        self.cache.clear()
+        logger.debug(f"BorrowerRegistry: origem '{origem}' registrada.")
+
+    def get(self, origem: str, identificador: Any) -> Optional[Dict[str, Any]]:
+        source = self._sources.get(origem)
+        if source is None:
+            raise NotImplementedError(f"Origem '{origem}' não implementada.")
+
+        key = (origem, normalize_federal_tax_number(identificador))
+        borrower = self.cache.get(key)
+        if borrower is None:
+            borrower = source.get_by_federal_tax_number(identificador)
+            if borrower is not None:
+                self.cache.put(key, borrower)
+        return borrower
+
+    def stats(self) -> Dict[str, Any]:
+        return self.cache.stats()
+
+
+_registry: Optional[BorrowerRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_borrower_registry() -> BorrowerRegistry:
+    """Retorna o `BorrowerRegistry` compartilhado, já com a origem `"mock"` registrada."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                registry = BorrowerRegistry()
+                registry.register("mock", BorrowerSourceMock())
+                _registry = registry
+    return _registry
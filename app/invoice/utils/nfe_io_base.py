@@ -0,0 +1,62 @@
+import os
+from typing import Any, Dict
+
+from app.invoice.utils.nfe_io_payload import NFEioPayloadBuilder
+from app.utils.idempotency_store import get_idempotency_store
+from app.utils.json_codec import decode_response
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class NFEioClientBase(NFEioPayloadBuilder):
+    """
+    Configuração, URLs e leitura das respostas da NFE.io, além da montagem do
+    corpo de emissão herdada de `NFEioPayloadBuilder`.
+
+    Não faz I/O de rede, e por isso é compartilhado pelos clientes síncrono
+    (`InvoiceClientNFEio`) e assíncrono (`AsyncInvoiceClientNFEio`), que só
+    enviam as requisições. As respostas podem vir do `requests` ou do `httpx`.
+    """
+
+    def __init__(self):
+        self.base_url = os.getenv("NFE_IO_BASE_URL", "https://api.nfse.io/v1")
+        self.api_key = os.getenv("NFE_IO_API_KEY")
+        self.company_id = os.getenv("NFE_IO_COMPANY_ID")
+
+        if not self.api_key or not self.company_id:
+            raise EnvironmentError(
+                "NFE.io: API Key ou Company ID não configurados corretamente."
+            )
+
+        self._idempotency = get_idempotency_store()
+
+    def _headers(self):
+        return {"Content-Type": "application/json", "Authorization": f"{self.api_key}"}
+
+    def _invoices_url(self) -> str:
+        return f"{self.base_url}/companies/{self.company_id}/serviceinvoices"
+
+    def _invoice_url(self, invoice_id: str) -> str:
+        return f"{self._invoices_url()}/{invoice_id}"
+
+    def _raise_for_status(self, response: Any, action: str, expected: int = 200) -> None:
+        if response.status_code != expected:
+            logger.error(
+                f"Erro ao {action}: {response.status_code} - {response.text}"
+            )
+            response.raise_for_status()
+
+    def _handle_response(
+        self, response: Any, action: str, expected: int = 200
+    ) -> Dict[str, Any]:
+        self._raise_for_status(response, action, expected)
+        return decode_response(response)
+
+    def _pdf_link(self, response: Any, invoice_id: str) -> Dict[str, Any]:
+        self._raise_for_status(response, "baixar PDF da NFSE")
+
+        pdf_url = response.text.strip('"')  # A API retorna uma string com aspas
+        logger.info(f"NFE.io: PDF disponível em: {pdf_url}")
+
+        return {"status": "success", "invoice_id": invoice_id, "pdf_url": pdf_url}
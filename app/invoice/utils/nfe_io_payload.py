@@ -0,0 +1,90 @@
+from datetime import datetime
+from uuid import uuid4
+from typing import Any, Dict
+
+from app.utils.logger import get_logger
+from app.invoice.utils.borrower_registry import get_borrower_registry
+from app.invoice.utils.validators import BORROWER_SCHEMA, NFSE_SERVICE_SCHEMA
+from app.invoice.constants.nfe_io_constants import (
+    OPTIONAL_FIELDS,
+)
+
+
+logger = get_logger(__name__)
+
+
+class NFEioPayloadBuilder:
+    """
+    Montagem e validação do corpo de emissão de NFSE da NFE.io.
+
+    Não faz I/O de rede, e por isso é compartilhado pelos clientes síncrono
+    (`InvoiceClientNFEio`) e assíncrono (`AsyncInvoiceClientNFEio`).
+    """
+
+    def get_borrower_info(self, origem: str, identificador: str) -> Dict[str, Any]:
+        logger.debug(
+            f"Obtendo dados do tomador: origem={origem}, identificador={identificador}"
+        )
+
+        return get_borrower_registry().get(origem, identificador)
+
+    def _borrower_validator(self, borrower: Dict[str, Any]) -> Dict[str, Any]:
+        """Valida o tomador e devolve uma cópia com o país normalizado (ISO alpha-3)."""
+        return BORROWER_SCHEMA.check(borrower)
+
+    def _service_validator(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Valida os campos mínimos exigidos para emissão de NFSE, reportando todos
+        os campos inválidos de uma vez.
+        """
+        return NFSE_SERVICE_SCHEMA.check(data)
+
+    def _process_optional_fields(
+        self, data: Dict[str, Any], kwargs: Dict[str, Any]
+    ) -> None:
+        """
+        Processa os campos opcionais e os adiciona ao dicionário de dados, se válidos.
+        """
+        for key, value in kwargs.items():
+            if key in OPTIONAL_FIELDS:
+                data[key] = value
+                logger.debug(f"Campo opcional incluído: {key} = {value}")
+            else:
+                logger.warning(f"Campo opcional inválido ignorado: {key}")
+
+    def create_data(
+        self,
+        origem: str,
+        identificador: str,
+        city_service_code: str,
+        description: str,
+        services_amount: float,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Monta o corpo da requisição para emissão de NFSE com os campos obrigatórios,
+        e aceita campos adicionais válidos via kwargs.
+        """
+        borrower = self.get_borrower_info(origem, identificador)
+        if not borrower:
+            raise ValueError("Tomador de serviços não encontrado.")
+
+        borrower = self._borrower_validator(borrower)
+
+        data = {
+            "borrower": borrower,
+            "cityServiceCode": city_service_code,
+            "description": description,
+            "servicesAmount": services_amount,
+        }
+
+        for key in ["externalId", "issuedOn"]:
+            if key not in kwargs:
+                kwargs[key] = (
+                    str(uuid4())
+                    if key == "externalId"
+                    else datetime.utcnow().isoformat() + "Z"
+                )
+
+        self._process_optional_fields(data, kwargs)
+        return self._service_validator(data)
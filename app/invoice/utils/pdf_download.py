@@ -0,0 +1,221 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterable, List, Optional
+
+import requests
+
+from app.utils.circuit_breaker import CircuitOpenError
+from app.utils.http_transport import HttpTransport, get_transport
+from app.utils.logger import get_logger
+from app.utils.retry import RetryPolicy
+
+logger = get_logger(__name__)
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+SinkFactory = Callable[[str], BinaryIO]
+
+
+class _DownloadError(Exception):
+    pass
+
+
+def _range_total(response: requests.Response) -> Optional[int]:
+    """Tamanho total informado em `Content-Range: bytes */<total>` (None se ausente)."""
+    value = response.headers.get("Content-Range", "")
+    _, _, total = value.rpartition("/")
+    return int(total) if total.strip().isdigit() else None
+
+
+class InvoicePDFDownloader:
+    """
+    Download em lote dos PDFs de NFSE, com concorrência limitada.
+
+    Para cada nota, obtém o link do PDF via `client.download_invoice` (sujeito ao
+    rate limiter e ao circuit breaker da NFE.io) e transfere o arquivo em blocos
+    de `chunk_size` bytes, sem carregar o arquivo inteiro em memória.
+
+    Em disco, o arquivo é gravado como `<id>.pdf.part` e renomeado para
+    `<id>.pdf` ao final. Se a transferência for interrompida, a próxima tentativa
+    (na mesma execução ou em uma nova chamada) continua do ponto em que parou
+    com o cabeçalho `Range`; notas já baixadas são ignoradas.
+
+    Configuração (variáveis de ambiente):
+        - NFE_IO_DOWNLOAD_WORKERS: downloads simultâneos (default: 4)
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        max_workers: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        retry_policy: Optional[RetryPolicy] = None,
+        transport: Optional[HttpTransport] = None,
+    ):
+        self.client = client
+        self.max_workers = max_workers or int(os.getenv("NFE_IO_DOWNLOAD_WORKERS", "4"))
+        self.chunk_size = chunk_size
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.transport = transport or get_transport()
+
+    def download_many(
+        self,
+        invoice_ids: Iterable[str],
+        destination_dir: Optional[str] = None,
+        sink_factory: Optional[SinkFactory] = None,
+    ) -> Dict[str, Any]:
+        """
+        Baixa os PDFs de várias notas.
+
+        Args:
+            invoice_ids (Iterable[str]): IDs das notas na NFE.io.
+            destination_dir (str): Diretório onde os arquivos `<id>.pdf` são gravados.
+            sink_factory (Callable[[str], BinaryIO]): Alternativa ao disco; recebe o
+                ID da nota e retorna um objeto com `write(bytes)`, que não é
+                fechado aqui. Sem retomada: só há nova tentativa se nenhum byte
+                tiver sido escrito.
+
+        Returns:
+            Dict[str, Any]: Resumo com `status` ("success", "partial" ou "error"),
+            contadores, o resultado de cada nota em `results` e as falhas em `failures`.
+        """
+        if (destination_dir is None) == (sink_factory is None):
+            raise ValueError("Informe exatamente um entre 'destination_dir' e 'sink_factory'.")
+
+        if destination_dir is not None:
+            Path(destination_dir).mkdir(parents=True, exist_ok=True)
+
+        invoice_ids = list(invoice_ids)
+        logger.info(
+            f"NFE.io: baixando {len(invoice_ids)} PDFs com {self.max_workers} downloads simultâneos."
+        )
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(
+                executor.map(
+                    lambda invoice_id: self._download_one(invoice_id, destination_dir, sink_factory),
+                    invoice_ids,
+                )
+            )
+
+        failures = [result for result in results if result["status"] != "success"]
+        succeeded = len(results) - len(failures)
+        summary = {
+            "status": "success" if not failures else ("partial" if succeeded else "error"),
+            "total": len(results),
+            "succeeded": succeeded,
+            "failed": len(failures),
+            "results": results,
+            "failures": failures,
+        }
+        logger.info(
+            f"NFE.io: download concluído — {summary['succeeded']} PDFs, "
+            f"{summary['failed']} com falha."
+        )
+        return summary
+
+    def _download_one(
+        self,
+        invoice_id: str,
+        destination_dir: Optional[str],
+        sink_factory: Optional[SinkFactory],
+    ) -> Dict[str, Any]:
+        if destination_dir is not None:
+            target = Path(destination_dir) / f"{invoice_id}.pdf"
+            if target.exists():
+                logger.debug("NFE.io: PDF %s já baixado; ignorando.", invoice_id)
+                return {"invoice_id": invoice_id, "status": "success", "path": str(target), "skipped": True}
+
+        try:
+            pdf_url = self.client.download_invoice(invoice_id)["pdf_url"]
+            if destination_dir is not None:
+                size = self._to_file(pdf_url, target)
+                return {"invoice_id": invoice_id, "status": "success", "path": str(target), "bytes": size}
+
+            size = self._to_sink(pdf_url, sink_factory(invoice_id))
+            return {"invoice_id": invoice_id, "status": "success", "bytes": size}
+        except (requests.RequestException, CircuitOpenError, OSError, ValueError, _DownloadError) as e:
+            logger.error(f"NFE.io: falha ao baixar o PDF da nota {invoice_id}: {e}")
+            return {"invoice_id": invoice_id, "status": "error", "error": str(e)}
+
+    def _open_stream(self, url: str, offset: int = 0) -> requests.Response:
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        response = self.transport.get(url, headers=headers, stream=True)
+        if response.status_code == 416 and offset:
+            # Início além do fim do arquivo: `_to_file` confere o `.part`.
+            return response
+        if response.status_code not in (200, 206):
+            response.close()
+            if self.retry_policy.should_retry_status(response.status_code):
+                raise requests.ConnectionError(f"HTTP {response.status_code} ao baixar {url}")
+            raise _DownloadError(f"HTTP {response.status_code} ao baixar {url}")
+        return response
+
+    def _to_file(self, url: str, target: Path) -> int:
+        partial = target.with_name(target.name + ".part")
+
+        for attempt in range(1, self.retry_policy.max_attempts + 1):
+            offset = partial.stat().st_size if partial.exists() else 0
+            try:
+                response = self._open_stream(url, offset)
+                if response.status_code == 416:
+                    response.close()
+                    if _range_total(response) == offset:
+                        # O `.part` já contém o arquivo inteiro.
+                        os.replace(partial, target)
+                        return target.stat().st_size
+                    logger.warning(
+                        "NFE.io: %s com %s bytes não confere com o arquivo remoto (%s); "
+                        "baixando de novo.",
+                        partial.name,
+                        offset,
+                        response.headers.get("Content-Range"),
+                    )
+                    partial.unlink()
+                    offset = 0
+                    response = self._open_stream(url)
+
+                with response:
+                    # 200 em resposta a um Range: o servidor ignorou a retomada.
+                    mode = "ab" if offset and response.status_code == 206 else "wb"
+                    with open(partial, mode) as f:
+                        for chunk in response.iter_content(self.chunk_size):
+                            f.write(chunk)
+                os.replace(partial, target)
+                return target.stat().st_size
+            except requests.RequestException as e:
+                if attempt == self.retry_policy.max_attempts:
+                    raise
+                delay = self.retry_policy.backoff(attempt)
+                logger.warning(
+                    "NFE.io: download de %s interrompido (%s); retomando em %.2fs.",
+                    target.name,
+                    e,
+                    delay,
+                )
+                time.sleep(delay)
+
+    def _to_sink(self, url: str, sink: BinaryIO) -> int:
+        for attempt in range(1, self.retry_policy.max_attempts + 1):
+            written = 0
+            try:
+                with self._open_stream(url) as response:
+                    for chunk in response.iter_content(self.chunk_size):
+                        sink.write(chunk)
+                        written += len(chunk)
+                return written
+            except requests.RequestException:
+                if written or attempt == self.retry_policy.max_attempts:
+                    raise
+                time.sleep(self.retry_policy.backoff(attempt))
+
+    @staticmethod
+    def pending(invoice_ids: Iterable[str], destination_dir: str) -> List[str]:
+        """Retorna os IDs cujo PDF ainda não foi baixado por completo em `destination_dir`."""
+        return [
+            invoice_id
+            for invoice_id in invoice_ids
+            if not (Path(destination_dir) / f"{invoice_id}.pdf").exists()
+        ]
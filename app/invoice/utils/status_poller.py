@@ -0,0 +1,326 @@
+import asyncio
+import heapq
+import inspect
+import os
+import random
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Union
+
+import httpx
+import requests
+
+from app.invoice.constants.nfe_io_constants import SUCCESS_FLOW_STATUSES, TERMINAL_FLOW_STATUSES
+from app.utils.circuit_breaker import CircuitOpenError
+from app.utils.logger import get_logger
+from app.utils.rate_limiter import AdaptiveRateLimiter
+
+logger = get_logger(__name__)
+
+StatusCallback = Callable[[Dict[str, Any]], Union[None, Awaitable[None]]]
+
+_DONE = object()
+
+
+class InvoiceStatusPoller:
+    """
+    Acompanha NFSE pendentes na NFE.io até que cheguem a um `flowStatus` final.
+
+    Cada nota é consultada com intervalo proporcional ao tempo em que está
+    pendente (`age * age_factor`, limitado a `[min_interval, max_interval]`,
+    com ±10% de variação para espalhar as consultas): notas recém-emitidas são
+    consultadas com frequência e as que demoram passam a ser consultadas cada
+    vez menos. O total de consultas é limitado por um rate limiter próprio
+    (`rate` consultas/s), independente do limite geral do provedor, para que o
+    acompanhamento não consuma a cota usada na emissão.
+
+    Ao concluir, cada nota gera um evento
+    `{"invoice_id", "status", "flow_status", "invoice", "polls", "elapsed"}`,
+    com `status` "success" (Issued/Cancelled), "error" (falha na emissão,
+    cancelamento ou erro permanente na consulta) ou "timeout" (pendente por
+    mais de `max_age` segundos). Os eventos são entregues ao `on_complete`
+    (função ou corrotina) e/ou pelo iterador assíncrono `events()`.
+
+    Aceita o cliente síncrono ou o assíncrono da NFE.io; as consultas do
+    cliente síncrono rodam em threads.
+
+    Configuração (variáveis de ambiente):
+        - NFE_IO_POLL_RATE: consultas por segundo, somando todas as notas (default: 1)
+        - NFE_IO_POLL_CONCURRENCY: consultas simultâneas (default: 4)
+        - NFE_IO_POLL_MIN_INTERVAL / NFE_IO_POLL_MAX_INTERVAL: intervalo entre
+          consultas de uma mesma nota, em segundos (default: 2 / 120)
+        - NFE_IO_POLL_MAX_AGE: tempo máximo de acompanhamento, em segundos (default: 3600)
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        on_complete: Optional[StatusCallback] = None,
+        rate: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+        min_interval: Optional[float] = None,
+        max_interval: Optional[float] = None,
+        max_age: Optional[float] = None,
+        age_factor: float = 0.25,
+    ):
+        self.client = client
+        self.on_complete = on_complete
+        self.max_concurrency = max_concurrency or int(os.getenv("NFE_IO_POLL_CONCURRENCY", "4"))
+        self.min_interval = min_interval or float(os.getenv("NFE_IO_POLL_MIN_INTERVAL", "2"))
+        self.max_interval = max_interval or float(os.getenv("NFE_IO_POLL_MAX_INTERVAL", "120"))
+        self.max_age = max_age or float(os.getenv("NFE_IO_POLL_MAX_AGE", "3600"))
+        self.age_factor = age_factor
+
+        rate = rate or float(os.getenv("NFE_IO_POLL_RATE", "1"))
+        self._limiter = AdaptiveRateLimiter("nfe_io:poll", rate, burst=1)
+
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._heap: List[tuple] = []
+        self._sequence = 0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._queues: List[asyncio.Queue] = []
+        self._stopped = False
+        self._polls = 0
+        self._errors = 0
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def add(self, invoice_id: str, submitted_at: Optional[float] = None) -> None:
+        """
+        Passa a acompanhar uma nota.
+
+        Args:
+            invoice_id (str): ID da nota na NFE.io.
+            submitted_at (float): Momento da emissão (`time.monotonic()`); default: agora.
+        """
+        if invoice_id in self._pending:
+            return
+        now = time.monotonic()
+        entry = {"added_at": submitted_at or now, "polls": 0, "failures": 0, "due": 0.0}
+        self._pending[invoice_id] = entry
+        self._schedule(invoice_id, entry, now + self.min_interval)
+
+    def add_many(self, invoice_ids: Iterable[str]) -> None:
+        for invoice_id in invoice_ids:
+            self.add(invoice_id)
+
+    def discard(self, invoice_id: str) -> None:
+        """Deixa de acompanhar a nota, sem gerar evento."""
+        self._pending.pop(invoice_id, None)
+
+    def stop(self) -> None:
+        """Encerra `run`/`events` após as consultas em andamento."""
+        self._stopped = True
+        self._wake()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pending": len(self._pending),
+            "polls": self._polls,
+            "errors": self._errors,
+            "limiter": self._limiter.stats(),
+        }
+
+    async def run(self, until_idle: bool = True) -> Dict[str, Any]:
+        """
+        Consulta as notas pendentes até que todas terminem (ou até `stop()`, se
+        `until_idle=False`).
+
+        Returns:
+            Dict[str, Any]: Resumo com `status` ("success", "partial" ou "error"),
+            contadores, os eventos em `results` e os que não foram "success" em `failures`.
+        """
+        self._stopped = False
+        self._wakeup = asyncio.Event()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        in_flight: set = set()
+        results: List[Dict[str, Any]] = []
+
+        logger.info(
+            "NFE.io: acompanhando %d NFSE pendentes (até %.2f consultas/s).",
+            len(self._pending),
+            self._limiter.max_rate,
+        )
+
+        def on_done(task: asyncio.Task) -> None:
+            in_flight.discard(task)
+            semaphore.release()
+            self._wake()
+
+        while not self._stopped:
+            delay = self._next_delay()
+            if delay is None and not in_flight and until_idle:
+                break
+            if delay is None or delay > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            _, _, invoice_id = heapq.heappop(self._heap)
+            await semaphore.acquire()
+            task = asyncio.create_task(self._poll(invoice_id, results))
+            in_flight.add(task)
+            task.add_done_callback(on_done)
+
+        if in_flight:
+            await asyncio.gather(*in_flight)
+
+        failures = [event for event in results if event["status"] != "success"]
+        succeeded = len(results) - len(failures)
+        return {
+            "status": "success" if not failures else ("partial" if succeeded else "error"),
+            "total": len(results),
+            "succeeded": succeeded,
+            "failed": len(failures),
+            "results": results,
+            "failures": failures,
+        }
+
+    async def events(self, until_idle: bool = True) -> AsyncIterator[Dict[str, Any]]:
+        """Executa `run` e entrega cada evento de conclusão assim que ocorre."""
+        queue: asyncio.Queue = asyncio.Queue()
+        self._queues.append(queue)
+
+        async def runner() -> None:
+            try:
+                await self.run(until_idle)
+            finally:
+                queue.put_nowait(_DONE)
+
+        task = asyncio.create_task(runner())
+        try:
+            while True:
+                event = await queue.get()
+                if event is _DONE:
+                    break
+                yield event
+            await task
+        finally:
+            self._queues.remove(queue)
+            if not task.done():
+                self.stop()
+                await task
+
+    def _interval(self, age: float) -> float:
+        interval = min(self.max_interval, max(self.min_interval, age * self.age_factor))
+        return interval * random.uniform(0.9, 1.1)
+
+    def _schedule(self, invoice_id: str, entry: Dict[str, Any], due: Optional[float] = None) -> None:
+        now = time.monotonic()
+        if due is None:
+            due = now + self._interval(now - entry["added_at"])
+        entry["due"] = due
+        self._sequence += 1
+        heapq.heappush(self._heap, (due, self._sequence, invoice_id))
+        self._wake()
+
+    def _next_delay(self) -> Optional[float]:
+        """Segundos até a próxima consulta (None: nada agendado)."""
+        while self._heap:
+            due, _, invoice_id = self._heap[0]
+            entry = self._pending.get(invoice_id)
+            if entry is None or entry["due"] != due:
+                # Nota descartada ou reagendada: entrada obsoleta.
+                heapq.heappop(self._heap)
+                continue
+            return max(due - time.monotonic(), 0.0)
+        return None
+
+    def _wake(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _fetch(self, invoice_id: str) -> Dict[str, Any]:
+        if inspect.iscoroutinefunction(self.client.get_invoice_status):
+            return await self.client.get_invoice_status(invoice_id)
+        return await asyncio.to_thread(self.client.get_invoice_status, invoice_id)
+
+    async def _poll(self, invoice_id: str, results: List[Dict[str, Any]]) -> None:
+        entry = self._pending.get(invoice_id)
+        if entry is None:
+            return
+
+        await self._limiter.acquire_async()
+        self._polls += 1
+        entry["polls"] += 1
+        try:
+            invoice = await self._fetch(invoice_id)
+        except (httpx.HTTPError, requests.RequestException, CircuitOpenError) as e:
+            self._errors += 1
+            entry["failures"] += 1
+            status_code = getattr(getattr(e, "response", None), "status_code", None)
+            if status_code is not None and 400 <= status_code < 500 and status_code != 429:
+                await self._finish(invoice_id, entry, results, "error", error=str(e))
+            elif not await self._expire(invoice_id, entry, results):
+                logger.warning(
+                    "NFE.io: falha ao consultar a NFSE %s (%s); nova tentativa agendada.", invoice_id, e
+                )
+                self._schedule(invoice_id, entry)
+            return
+
+        flow_status = invoice.get("flowStatus")
+        if flow_status in TERMINAL_FLOW_STATUSES:
+            status = "success" if flow_status in SUCCESS_FLOW_STATUSES else "error"
+            await self._finish(invoice_id, entry, results, status, invoice=invoice)
+        elif not await self._expire(invoice_id, entry, results, invoice):
+            logger.debug("NFE.io: NFSE %s ainda em %s.", invoice_id, flow_status)
+            self._schedule(invoice_id, entry)
+
+    async def _expire(
+        self,
+        invoice_id: str,
+        entry: Dict[str, Any],
+        results: List[Dict[str, Any]],
+        invoice: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        if time.monotonic() - entry["added_at"] < self.max_age:
+            return False
+        await self._finish(invoice_id, entry, results, "timeout", invoice=invoice)
+        return True
+
+    async def _finish(
+        self,
+        invoice_id: str,
+        entry: Dict[str, Any],
+        results: List[Dict[str, Any]],
+        status: str,
+        invoice: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        if self._pending.pop(invoice_id, None) is None:
+            return
+
+        event = {
+            "invoice_id": invoice_id,
+            "status": status,
+            "flow_status": (invoice or {}).get("flowStatus"),
+            "invoice": invoice,
+            "polls": entry["polls"],
+            "elapsed": round(time.monotonic() - entry["added_at"], 3),
+        }
+        if error is not None:
+            event["error"] = error
+        results.append(event)
+
+        log = logger.info if status == "success" else logger.warning
+        log(
+            "NFE.io: NFSE %s finalizada (%s, %s) após %d consultas.",
+            invoice_id,
+            status,
+            event["flow_status"],
+            entry["polls"],
+        )
+
+        for queue in self._queues:
+            queue.put_nowait(event)
+        if self.on_complete is not None:
+            try:
+                outcome = self.on_complete(event)
+                if inspect.isawaitable(outcome):
+                    await outcome
+            except Exception:
+                logger.exception("NFE.io: erro no callback de conclusão da NFSE %s.", invoice_id)
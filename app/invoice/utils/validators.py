@@ -1,10 +1,11 @@
-from typing import Optional, Any
+from typing import Optional
 from app.invoice.constants.nfe_io_constants import (
     VALID_COUNTRIES_ISO_ALPHA3,
     VALID_BORROWER_TYPES,
     VALID_TAX_REGIMES,
     VALID_TAXATION_TYPES,
-) 
+)
+from app.utils.schema import Field, Schema, is_falsy
 
 def normalize_country_code(country: Optional[str]) -> str:
     """
@@ -33,37 +34,70 @@ def normalize_country_code(country: Optional[str]) -> str:
 
     return normalized
 
-def validate_borrower_type(b_type: Optional[str]) -> None:
-    """
-    Valida se o borrower.type está entre os valores permitidos.
-    """
-    if b_type and b_type not in VALID_BORROWER_TYPES:
-        raise ValueError(
-            f"'type' inválido em borrower: '{b_type}'. Valores válidos: {VALID_BORROWER_TYPES}"
-        )
-
-
-def validate_tax_regime(tax_regime: Optional[str]) -> None:
-    """
-    Valida se o borrower.taxRegime está entre os valores permitidos.
-    """
-    if tax_regime and tax_regime not in VALID_TAX_REGIMES:
-        raise ValueError(
-            f"'taxRegime' inválido em borrower: '{tax_regime}'. Valores válidos: {VALID_TAX_REGIMES}"
-        )
-        
-def validate_taxation_type(value: str) -> None:
-    if value and value not in VALID_TAXATION_TYPES:
-        raise ValueError(
-            f"'taxationType' inválido: '{value}'. Valores válidos: {VALID_TAXATION_TYPES}"
-        )
 
+REQUIRED_STRING_MESSAGE = "O campo obrigatório '{name}' está ausente ou inválido."
+SERVICES_AMOUNT_MESSAGE = "O campo 'servicesAmount' deve ser numérico e maior que zero."
+ADDRESS_MESSAGE = "'borrower.address' deve ser um dicionário."
 
-def validate_services_amount(value: Any) -> None:
-    if not isinstance(value, (int, float)) or value <= 0:
-        raise ValueError("O campo 'servicesAmount' deve ser numérico e maior que zero.")
+ADDRESS_SCHEMA = Schema(
+    [Field("country", default="BRA", normalize=normalize_country_code, missing=is_falsy)],
+    type_message=ADDRESS_MESSAGE,
+)
 
+BORROWER_SCHEMA = Schema(
+    [
+        Field("address", required=True, schema=ADDRESS_SCHEMA, required_message=ADDRESS_MESSAGE),
+        Field(
+            "type",
+            missing=is_falsy,
+            choices=VALID_BORROWER_TYPES,
+            message=lambda name, value: (
+                f"'type' inválido em borrower: '{value}'. Valores válidos: {VALID_BORROWER_TYPES}"
+            ),
+        ),
+        Field(
+            "taxRegime",
+            missing=is_falsy,
+            choices=VALID_TAX_REGIMES,
+            message=lambda name, value: (
+                f"'taxRegime' inválido em borrower: '{value}'. Valores válidos: {VALID_TAX_REGIMES}"
+            ),
+        ),
+    ],
+    type_message="'borrower' deve ser um dicionário.",
+)
 
-def validate_required_string(field_name: str, value: Any) -> None:
-    if not isinstance(value, str) or not value.strip():
-        raise ValueError(f"O campo obrigatório '{field_name}' está ausente ou inválido.")
\ No newline at end of file
+NFSE_SERVICE_SCHEMA = Schema(
+    [
+        Field(
+            "cityServiceCode",
+            required=True,
+            types=str,
+            message=REQUIRED_STRING_MESSAGE,
+            required_message=REQUIRED_STRING_MESSAGE,
+        ),
+        Field(
+            "description",
+            required=True,
+            types=str,
+            message=REQUIRED_STRING_MESSAGE,
+            required_message=REQUIRED_STRING_MESSAGE,
+        ),
+        Field(
+            "servicesAmount",
+            required=True,
+            positive=True,
+            message=SERVICES_AMOUNT_MESSAGE,
+            required_message=SERVICES_AMOUNT_MESSAGE,
+        ),
+        Field(
+            "taxationType",
+            missing=is_falsy,
+            choices=VALID_TAXATION_TYPES,
+            message=lambda name, value: (
+                f"'taxationType' inválido: '{value}'. Valores válidos: {VALID_TAXATION_TYPES}"
+            ),
+        ),
+    ],
+    type_message="O payload de emissão de NFSE deve ser um dicionário.",
+)
@@ -1,3 +1,9 @@
+from app.invoice.utils.borrower_index import (
+    index_by_federal_tax_number,
+    normalize_federal_tax_number,
+)
+
+
 class MockBorrower:
     mock_infos = [
         {
@@ -69,12 +75,13 @@ class MockBorrower:
         }
     ]
 
+    _index = None
+
     @classmethod
-    def get_by_federal_tax_number(cls, federal_tax_number: int) -> dict | None:
-        for info in cls.mock_infos:
-            if info.get("federalTaxNumber") == federal_tax_number:
-                return info
-        return None
+    def get_by_federal_tax_number(cls, federal_tax_number: int | str) -> dict | None:
+        if cls._index is None:
+            cls._index = index_by_federal_tax_number(cls.mock_infos)
+        return cls._index.get(normalize_federal_tax_number(federal_tax_number))
     
     @classmethod
     def get(cls, index: int = 0):
@@ -0,0 +1,130 @@
+import asyncio
+import math
+import os
+import random
+import time
+from typing import Optional
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+LATENCY_DISTRIBUTIONS = ("none", "fixed", "normal", "longtail")
+
+
+class MockProviderError(ConnectionError):
+    """
+    Falha simulada de provedor (503 ou 429) injetada pelo `LoadProfile`.
+
+    Herda de `ConnectionError` para ser tratada como falha transitória pelos
+    mesmos caminhos que tratam as integrações reais (outbox, faturamento).
+    """
+
+    def __init__(self, status_code: int, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class LoadProfile:
+    """
+    Comportamento dos mocks sob carga: latência, falhas e NFSE assíncrona.
+
+    O perfil padrão não injeta nada (os mocks respondem na hora e nunca falham).
+
+    Args:
+        distribution (str): "none", "fixed", "normal" ou "longtail".
+        latency (float): Latência em segundos. É o valor fixo ("fixed"), a média
+            ("normal") ou a mediana ("longtail").
+        latency_stddev (float): Desvio-padrão em segundos ("normal") ou sigma da
+            distribuição log-normal ("longtail"; 1.0 deixa o p99 ~10x a mediana).
+        error_rate (float): Probabilidade (0 a 1) de falha simulada 503.
+        throttle_rate (float): Probabilidade (0 a 1) de falha simulada 429.
+        retry_after (float): `retry_after` informado nas falhas 429, em segundos.
+        invoice_issue_delay (float): Segundos até uma NFSE emitida deixar de
+            estar "processing" e passar a "issued".
+        seed (int): Semente do gerador aleatório (resultados reprodutíveis).
+    """
+
+    def __init__(
+        self,
+        distribution: str = "none",
+        latency: float = 0.0,
+        latency_stddev: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: float = 1.0,
+        invoice_issue_delay: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        if distribution not in LATENCY_DISTRIBUTIONS:
+            options = ", ".join(LATENCY_DISTRIBUTIONS)
+            raise ValueError(f"Distribuição de latência '{distribution}' inválida; use {options}.")
+        self.distribution = distribution
+        self.latency = latency
+        self.latency_stddev = latency_stddev
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.invoice_issue_delay = invoice_issue_delay
+        self.random = random.Random(seed)
+
+    @classmethod
+    def from_env(cls) -> "LoadProfile":
+        """Perfil definido pelas variáveis MOCK_LOAD_* e MOCK_INVOICE_ISSUE_DELAY."""
+        seed = os.getenv("MOCK_LOAD_SEED")
+        return cls(
+            distribution=os.getenv("MOCK_LOAD_LATENCY_DISTRIBUTION", "none").lower(),
+            latency=float(os.getenv("MOCK_LOAD_LATENCY", "0")),
+            latency_stddev=float(os.getenv("MOCK_LOAD_LATENCY_STDDEV", "0")),
+            error_rate=float(os.getenv("MOCK_LOAD_ERROR_RATE", "0")),
+            throttle_rate=float(os.getenv("MOCK_LOAD_THROTTLE_RATE", "0")),
+            retry_after=float(os.getenv("MOCK_LOAD_RETRY_AFTER", "1")),
+            invoice_issue_delay=float(os.getenv("MOCK_INVOICE_ISSUE_DELAY", "0")),
+            seed=int(seed) if seed else None,
+        )
+
+    @property
+    def active(self) -> bool:
+        return self.distribution != "none" or self.error_rate > 0 or self.throttle_rate > 0
+
+    def sample_latency(self) -> float:
+        if self.distribution == "fixed":
+            return self.latency
+        if self.distribution == "normal":
+            return max(self.random.normalvariate(self.latency, self.latency_stddev), 0.0)
+        if self.distribution == "longtail" and self.latency > 0:
+            return self.random.lognormvariate(math.log(self.latency), self.latency_stddev)
+        return 0.0
+
+    def check_failure(self, operation: str) -> None:
+        """Levanta `MockProviderError` conforme as taxas de erro e de 429."""
+        if not (self.error_rate or self.throttle_rate):
+            return
+        draw = self.random.random()
+        if draw < self.throttle_rate:
+            logger.debug("Mock: 429 simulado em %s.", operation)
+            raise MockProviderError(
+                429, f"Limite de requisições simulado em {operation}.", self.retry_after
+            )
+        if draw < self.throttle_rate + self.error_rate:
+            logger.debug("Mock: 503 simulado em %s.", operation)
+            raise MockProviderError(503, f"Falha simulada do provedor em {operation}.")
+
+    def apply(self, operation: str) -> None:
+        """Aplica latência e falhas a uma chamada síncrona do mock."""
+        if not self.active:
+            return
+        delay = self.sample_latency()
+        if delay:
+            time.sleep(delay)
+        self.check_failure(operation)
+
+    async def apply_async(self, operation: str) -> None:
+        """Como `apply`, sem bloquear o event loop."""
+        if not self.active:
+            return
+        delay = self.sample_latency()
+        if delay:
+            await asyncio.sleep(delay)
+        self.check_failure(operation)
@@ -0,0 +1,265 @@
+import bisect
+import itertools
+import threading
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+Record = Dict[str, Any]
+KeyFunc = Callable[[Any], Any]
+
+
+def date_key(value: Any) -> Optional[date]:
+    """
+    Converte `date` ou texto no formato da Omie (`DD/MM/AAAA`) ou ISO
+    (`AAAA-MM-DD`, Asaas e NFE.io) em `date`; None se inválido.
+    """
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if not isinstance(value, str) or len(value) < 10:
+        return None
+    # Fatiamento direto: `strptime` custaria mais que o resto da gravação.
+    try:
+        if value[2] == "/" and value[5] == "/":
+            return date(int(value[6:10]), int(value[3:5]), int(value[:2]))
+        if value[4] == "-" and value[7] == "-":
+            return date(int(value[:4]), int(value[5:7]), int(value[8:10]))
+    except ValueError:
+        pass
+    return None
+
+
+class _Index:
+    """Índice secundário: valor normalizado -> IDs. Com `ordered`, aceita consultas por intervalo."""
+
+    def __init__(self, key: Optional[KeyFunc] = None, ordered: bool = False):
+        self.key = key
+        self.ordered = ordered
+        self.lock = threading.Lock()
+        self.ids: Dict[Any, Set[str]] = {}
+        self.sorted_keys: List[Any] = []
+
+    def normalize(self, value: Any) -> Any:
+        return self.key(value) if self.key is not None and value is not None else value
+
+    def add(self, key: Any, record_id: str) -> None:
+        if key is None:
+            return
+        with self.lock:
+            ids = self.ids.get(key)
+            if ids is None:
+                ids = self.ids[key] = set()
+                if self.ordered:
+                    bisect.insort(self.sorted_keys, key)
+            ids.add(record_id)
+
+    def remove(self, key: Any, record_id: str) -> None:
+        if key is None:
+            return
+        with self.lock:
+            ids = self.ids.get(key)
+            if ids is None:
+                return
+            ids.discard(record_id)
+            if not ids:
+                del self.ids[key]
+                if self.ordered:
+                    del self.sorted_keys[bisect.bisect_left(self.sorted_keys, key)]
+
+    def lookup(self, value: Any) -> Set[str]:
+        key = self.normalize(value)
+        with self.lock:
+            return set(self.ids.get(key, ()))
+
+    def between(self, start: Any = None, end: Any = None) -> Set[str]:
+        """IDs com valor em `[start, end]` (limites inclusivos; None deixa o lado aberto)."""
+        low = self.normalize(start)
+        high = self.normalize(end)
+        with self.lock:
+            first = bisect.bisect_left(self.sorted_keys, low) if low is not None else 0
+            last = (
+                bisect.bisect_right(self.sorted_keys, high)
+                if high is not None
+                else len(self.sorted_keys)
+            )
+            result: Set[str] = set()
+            for key in self.sorted_keys[first:last]:
+                result.update(self.ids[key])
+            return result
+
+
+class MockStore:
+    """
+    Armazenamento em memória dos mocks, seguro para uso por várias threads.
+
+    Os IDs vêm de um contador atômico (`<prefixo>-1`, `<prefixo>-2`, ...), então
+    nunca se repetem, mesmo com criações simultâneas. Os registros ficam
+    distribuídos em `stripes` partições, cada uma com seu próprio lock: as
+    operações de leitura-e-escrita (atualizar status, por exemplo) são atômicas
+    por registro e só disputam o lock com registros da mesma partição, o que
+    permite que a vazão acompanhe o número de threads.
+
+    Os campos em `indexes` (ex: status, cliente, `externalId`) e em
+    `range_indexes` (ex: vencimento, com a função que normaliza o valor) têm
+    índices secundários mantidos a cada gravação, e `find` os usa em vez de
+    percorrer todos os registros.
+
+    Os registros devolvidos são cópias; alterações devem passar por `update`
+    ou `modify`.
+    """
+
+    def __init__(
+        self,
+        prefix: str,
+        stripes: int = 16,
+        indexes: Iterable[str] = (),
+        range_indexes: Optional[Dict[str, KeyFunc]] = None,
+    ):
+        self.prefix = prefix
+        self._ids = itertools.count(1)
+        self._id_lock = threading.Lock()
+        self._stripes: List[Dict[str, Record]] = [{} for _ in range(stripes)]
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._indexes: Dict[str, _Index] = {field: _Index() for field in indexes}
+        for field, key in (range_indexes or {}).items():
+            self._indexes[field] = _Index(key, ordered=True)
+
+    def _stripe(self, record_id: str) -> int:
+        return hash(record_id) % len(self._stripes)
+
+    def _index_keys(self, record: Record) -> Dict[str, Any]:
+        return {field: index.normalize(record.get(field)) for field, index in self._indexes.items()}
+
+    def _reindex(self, record_id: str, before: Dict[str, Any], after: Dict[str, Any]) -> None:
+        for field, index in self._indexes.items():
+            if before.get(field) != after[field]:
+                index.remove(before.get(field), record_id)
+                index.add(after[field], record_id)
+
+    def next_id(self) -> str:
+        with self._id_lock:
+            return f"{self.prefix}-{next(self._ids)}"
+
+    def insert(self, data: Record, record_id: Optional[str] = None) -> Record:
+        """
+        Grava um novo registro (campo `id`) e devolve uma cópia. O ID é gerado,
+        a menos que venha de um `next_id()` anterior.
+        """
+        record_id = record_id or self.next_id()
+        record = {**data, "id": record_id}
+        index = self._stripe(record_id)
+        with self._locks[index]:
+            self._stripes[index][record_id] = record
+            self._reindex(record_id, {}, self._index_keys(record))
+            return dict(record)
+
+    def get(self, record_id: str) -> Optional[Record]:
+        index = self._stripe(record_id)
+        with self._locks[index]:
+            record = self._stripes[index].get(record_id)
+            return dict(record) if record is not None else None
+
+    def update(self, record_id: str, changes: Record) -> Optional[Record]:
+        """Aplica `changes` ao registro; devolve a versão nova ou None se ele não existir."""
+        return self.modify(record_id, lambda record: record.update(changes))
+
+    def modify(self, record_id: str, func: Callable[[Record], Any]) -> Optional[Record]:
+        """
+        Executa `func(registro)` sob o lock da partição, permitindo alterações
+        condicionais atômicas. Devolve uma cópia do registro após a alteração,
+        ou None se ele não existir.
+        """
+        index = self._stripe(record_id)
+        with self._locks[index]:
+            record = self._stripes[index].get(record_id)
+            if record is None:
+                return None
+            before = self._index_keys(record) if self._indexes else None
+            func(record)
+            if before is not None:
+                self._reindex(record_id, before, self._index_keys(record))
+            return dict(record)
+
+    def find(
+        self,
+        ranges: Optional[Dict[str, Tuple[Any, Any]]] = None,
+        limit: Optional[int] = None,
+        **equals: Any,
+    ) -> List[Record]:
+        """
+        Registros com `campo == valor` para cada item de `equals` e, para cada
+        item de `ranges` (`campo: (início, fim)`, inclusivos, None deixa o lado
+        aberto), valor dentro do intervalo. Em ordem de criação.
+
+        Os campos indexados restringem os candidatos pelos índices; os demais
+        são conferidos registro a registro. Campos de `ranges` precisam estar
+        em `range_indexes`.
+        """
+        ranges = ranges or {}
+        candidates: List[Set[str]] = []
+        for field, (start, end) in ranges.items():
+            index = self._indexes.get(field)
+            if index is None or not index.ordered:
+                raise ValueError(f"Campo '{field}' não tem índice por intervalo.")
+            for bound in (start, end):
+                if bound is not None and index.normalize(bound) is None:
+                    raise ValueError(f"Limite inválido para '{field}': {bound!r}.")
+            candidates.append(index.between(start, end))
+        for field, value in equals.items():
+            if field in self._indexes:
+                candidates.append(self._indexes[field].lookup(value))
+
+        if candidates:
+            candidates.sort(key=len)
+            ids = candidates[0].intersection(*candidates[1:])
+            records = (self.get(record_id) for record_id in ids)
+        else:
+            records = self.values()
+
+        # Confere de novo: um registro pode ter mudado entre o índice e a leitura.
+        matches = [
+            record
+            for record in records
+            if record is not None and self._matches(record, ranges, equals)
+        ]
+        matches.sort(key=self._sequence)
+        return matches[:limit] if limit is not None else matches
+
+    def _matches(
+        self, record: Record, ranges: Dict[str, Tuple[Any, Any]], equals: Dict[str, Any]
+    ) -> bool:
+        for field, value in equals.items():
+            index = self._indexes.get(field)
+            if index is not None:
+                if index.normalize(record.get(field)) != index.normalize(value):
+                    return False
+            elif record.get(field) != value:
+                return False
+        for field, (start, end) in ranges.items():
+            index = self._indexes[field]
+            key = index.normalize(record.get(field))
+            if key is None:
+                return False
+            if start is not None and key < index.normalize(start):
+                return False
+            if end is not None and key > index.normalize(end):
+                return False
+        return True
+
+    @staticmethod
+    def _sequence(record: Record) -> int:
+        return int(record["id"].rsplit("-", 1)[1])
+
+    def __contains__(self, record_id: object) -> bool:
+        return isinstance(record_id, str) and record_id in self._stripes[self._stripe(record_id)]
+
+    def __len__(self) -> int:
+        return sum(len(stripe) for stripe in self._stripes)
+
+    def values(self) -> Iterator[Record]:
+        """Cópias de todos os registros, partição por partição."""
+        for lock, stripe in zip(self._locks, self._stripes):
+            with lock:
+                records = [dict(record) for record in stripe.values()]
+            yield from records
@@ -0,0 +1,35 @@
+from typing import Any, AsyncIterator, Dict, Optional
+from app.payables.payables_client_async_interface import AsyncPayablesClientInterface
+from app.payables.payables_client_mock import PayablesClientMock
+from app.mocks.load_profile import LoadProfile
+from app.utils.metrics import instrument_client
+
+
+@instrument_client("mock")
+class AsyncPayablesClientMock(AsyncPayablesClientInterface):
+    """Mock assíncrono de contas a pagar; delega o armazenamento ao `PayablesClientMock`."""
+
+    def __init__(self):
+        # A latência e as falhas são aplicadas aqui, sem bloquear o event loop;
+        # o mock síncrono interno só guarda os dados.
+        self._load = LoadProfile.from_env()
+        self._client = PayablesClientMock(LoadProfile())
+
+    async def create_payable(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        await self._load.apply_async("create_payable")
+        return self._client.create_payable(data)
+
+    async def settle_payable(self, payable_id: str) -> Dict[str, Any]:
+        await self._load.apply_async("settle_payable")
+        return self._client.settle_payable(payable_id)
+
+    async def cancel_payable(self, payable_id: str) -> Dict[str, Any]:
+        await self._load.apply_async("cancel_payable")
+        return self._client.cancel_payable(payable_id)
+
+    async def list_payables(
+        self, status: Optional[str] = None, condominium_id: Optional[str] = None, **filters: Any
+    ) -> AsyncIterator[Dict[str, Any]]:
+        await self._load.apply_async("list_payables")
+        for payable in self._client.list_payables(status, condominium_id, **filters):
+            yield payable
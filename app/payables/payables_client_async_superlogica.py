@@ -0,0 +1,133 @@
+import asyncio
+from typing import Dict, Any, List, Optional
+
+import httpx
+
+from app.payables.payables_client_async_interface import AsyncPayablesClientInterface
+from app.payables.utils.superlogica_base import SuperlogicaClientBase
+from app.payables.utils.uploads import (
+    group_by_digest,
+    safe_sha256,
+    summarize_uploads,
+    upload_success,
+)
+from app.utils.async_http_transport import AsyncProviderTransport, get_async_transport
+from app.utils.circuit_breaker import CircuitOpenError
+from app.utils.logger import get_logger
+from app.utils.metrics import instrument_client
+from app.utils.multipart import MultipartFileBody
+
+logger = get_logger(__name__)
+
+
+@instrument_client("superlogica", include=("upload_attachment", "upload_attachments"))
+class AsyncSuperlogicaPayablesClient(SuperlogicaClientBase, AsyncPayablesClientInterface):
+    """Versão assíncrona de `SuperlogicaPayablesClient`."""
+
+    @property
+    def _http(self) -> AsyncProviderTransport:
+        return get_async_transport().for_provider("superlogica")
+
+    async def create_payable(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        url = self._create_url(data)
+        response = await self._http.post(url, headers=self._headers(), data=data)
+        return self._create_result(response)
+
+    async def settle_payable(self, payable_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        logger.info(f"Superlógica: liquidando contas a pagar ID {payable_id}...")
+
+        response = await self._http.put(self._movement_url(), headers=self._headers(), params=data)
+        return self._handle_response(response, "liquidar contas a pagar")
+
+    async def cancel_payable(self, payable_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        logger.info(f"Superlógica: cancelando contas a pagar ID {payable_id}...")
+
+        response = await self._http.put(self._movement_url(), headers=self._headers(), params=data)
+        return self._handle_response(response, "cancelar contas a pagar")
+
+    async def upload_attachment(self, file_path: str, condominium_id: str, publish: int = 4) -> Dict[str, Any]:
+        """
+        Envia um anexo (ex: nota fiscal ou boleto) ao Superlógica.
+
+        O arquivo é enviado em streaming, sem ser carregado em memória. Um arquivo
+        com o mesmo conteúdo (SHA-256) já enviado ao mesmo condomínio não é
+        reenviado: a resposta registrada no envio anterior é retornada.
+
+        Args:
+            file_path (str): Caminho do arquivo local.
+            condominium_id (str): ID do condomínio.
+            publish (int): Regra de publicação (1 a 4). Default: 4 (não publicar).
+
+        Returns:
+            dict: Resposta da API com ID do documento enviado.
+        """
+        digest = await asyncio.to_thread(safe_sha256, file_path)
+        if digest is None:
+            raise FileNotFoundError(f"Arquivo não pôde ser lido: {file_path}")
+        return await self._upload(file_path, condominium_id, publish, digest)
+
+    async def _upload(
+        self, file_path: str, condominium_id: str, publish: int, digest: str
+    ) -> Dict[str, Any]:
+        document_key = self._document_key(condominium_id, digest)
+        stored = await self._idempotency.get_async("superlogica:document", document_key)
+        if stored is not None:
+            self._log_stored_upload(file_path, condominium_id)
+            return stored
+
+        url = self._upload_url(condominium_id, publish)
+        with MultipartFileBody(file_path) as body:
+            response = await self._http.post(url, headers=self._upload_headers(body), content=body)
+
+        result = self._handle_response(response, "enviar anexo")
+        await self._idempotency.put_async("superlogica:document", document_key, result)
+        return result
+
+    async def upload_attachments(
+        self,
+        file_paths: List[str],
+        condominium_id: str,
+        publish: int = 4,
+        max_concurrency: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Envia vários anexos ao mesmo condomínio, com envios simultâneos limitados.
+
+        Arquivos com conteúdo idêntico (no lote ou já enviados antes) são
+        enviados uma única vez.
+
+        Args:
+            file_paths (List[str]): Caminhos dos arquivos locais.
+            condominium_id (str): ID do condomínio.
+            publish (int): Regra de publicação (1 a 4). Default: 4 (não publicar).
+            max_concurrency (int): Envios simultâneos (default: SUPERLOGICA_UPLOAD_WORKERS ou 4).
+
+        Returns:
+            Dict[str, Any]: Resumo com `status` ("success", "partial" ou "error"),
+            contadores, o resultado de cada arquivo em `results` e as falhas em `failures`.
+        """
+        max_concurrency = self._upload_concurrency(file_paths, condominium_id, max_concurrency)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def hash_one(file_path: str) -> Optional[str]:
+            async with semaphore:
+                return await asyncio.to_thread(safe_sha256, file_path)
+
+        async def upload_one(digest: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._safe_upload(unique[digest], condominium_id, publish, digest)
+
+        digests = await asyncio.gather(*(hash_one(file_path) for file_path in file_paths))
+        unique = group_by_digest(file_paths, digests)
+        uploads = dict(zip(unique, await asyncio.gather(*(upload_one(d) for d in unique))))
+
+        return summarize_uploads(file_paths, digests, unique, uploads)
+
+    async def _safe_upload(
+        self, file_path: str, condominium_id: str, publish: int, digest: str
+    ) -> Dict[str, Any]:
+        try:
+            return upload_success(await self._upload(file_path, condominium_id, publish, digest))
+        except (httpx.HTTPError, CircuitOpenError, OSError, ValueError) as e:
+            return self._upload_failure(file_path, e)
@@ -1,28 +1,45 @@
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, Optional
+from app.mocks.load_profile import LoadProfile
+from app.mocks.store import MockStore
 from app.payables.payables_client_interface import PayablesClientInterface
 from app.utils.logger import get_logger
+from app.utils.metrics import instrument_client
 
 logger = get_logger(__name__)
 
+@instrument_client("mock")
 class PayablesClientMock(PayablesClientInterface):
-    def __init__(self):
-        self._payables = {}
+    def __init__(self, load_profile: Optional[LoadProfile] = None):
+        self._payables = MockStore("payable", indexes=("status", "ID_CONDOMINIO_COND"))
+        self._load = load_profile or LoadProfile.from_env()
 
     def create_payable(self, data: Dict[str, Any]) -> Dict[str, Any]:
         logger.info("MockPayables: criando conta a pagar.")
-        payable_id = f"payable-{len(self._payables) + 1}"
-        self._payables[payable_id] = {**data, "status": "open", "id": payable_id}
+        self._load.apply("create_payable")
+        payable_id = self._payables.insert({**data, "status": "open"})["id"]
         return {"status": "success", "payable_id": payable_id}
 
     def settle_payable(self, payable_id: str) -> Dict[str, Any]:
-        if payable_id not in self._payables:
+        self._load.apply("settle_payable")
+        if self._payables.update(payable_id, {"status": "settled"}) is None:
             return {"status": "not_found"}
-        self._payables[payable_id]["status"] = "settled"
         return {"status": "success", "payable_id": payable_id}
 
     def cancel_payable(self, payable_id: str) -> Dict[str, Any]:
-        if payable_id not in self._payables:
+        self._load.apply("cancel_payable")
+        if self._payables.update(payable_id, {"status": "cancelled"}) is None:
             return {"status": "not_found"}
-        self._payables[payable_id]["status"] = "cancelled"
         return {"status": "success", "payable_id": payable_id}
+
+    def list_payables(
+        self, status: Optional[str] = None, condominium_id: Optional[str] = None, **filters: Any
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Consulta as contas a pagar do mock por status ("open", "settled" ou
+        "cancelled"), condomínio (`ID_CONDOMINIO_COND`) e igualdade em outros campos.
+        """
+        self._load.apply("list_payables")
+        query = {"status": status, "ID_CONDOMINIO_COND": condominium_id, **filters}
+        query = {field: value for field, value in query.items() if value is not None}
+        return iter(self._payables.find(**query))
@@ -1,82 +1,56 @@
-import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
+
 import requests
-from typing import Dict, Any
 
 from app.payables.payables_client_interface import PayablesClientInterface
-from app.payables.utils.validators import validate_create_payable_payload
+from app.payables.utils.superlogica_base import SuperlogicaClientBase
+from app.payables.utils.uploads import (
+    group_by_digest,
+    safe_sha256,
+    summarize_uploads,
+    upload_success,
+)
+from app.utils.circuit_breaker import CircuitOpenError
+from app.utils.http_transport import get_transport
 from app.utils.logger import get_logger
+from app.utils.metrics import instrument_client
+from app.utils.multipart import MultipartFileBody, file_sha256
 
 logger = get_logger(__name__)
 
 
-class SuperlogicaPayablesClient(PayablesClientInterface):
+@instrument_client("superlogica", include=("upload_attachment", "upload_attachments"))
+class SuperlogicaPayablesClient(SuperlogicaClientBase, PayablesClientInterface):
     def __init__(self):
-        self.base_url = os.getenv("SUPERLOGICA_BASE_URL")
-        self.app_token = os.getenv("SUPERLOGICA_APP_TOKEN")
-        self.access_token = os.getenv("SUPERLOGICA_ACCESS_TOKEN")
-
-        if not all([self.base_url, self.app_token, self.access_token]):
-            raise EnvironmentError("Superlógica: credenciais não configuradas corretamente.")
-
-    def _headers(self):
-        return {
-            "Content-Type": "application/x-www-form-urlencoded",
-            "app_token": self.app_token,
-            "access_token": self.access_token,
-        }
+        super().__init__()
+        self._http = get_transport().for_provider("superlogica")
 
     def create_payable(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        logger.info("Superlógica: criando contas a pagar...")
-        validate_create_payable_payload(data)
-
-        url = f"{self.base_url}/v2/condor/MovimentacoesDiretas/"
-        logger.debug(f"POST {url}")
-        logger.debug(f"Payload: {data}")
-
-        response = requests.post(url, headers=self._headers(), data=data)
-
-        if response.status_code != 200:
-            logger.error(f"Erro ao criar contas a pagar: {response.status_code} - {response.text}")
-            response.raise_for_status()
-
-        try:
-            result = response.json()
-        except ValueError:
-            logger.warning("Resposta não está em JSON. Retornando texto puro.")
-            result = {"raw_response": response.text}
-
-        logger.info("Superlógica: contas a pagar criada com sucesso.")
-        return result
-
+        url = self._create_url(data)
+        response = self._http.post(url, headers=self._headers(), data=data)
+        return self._create_result(response)
 
     def settle_payable(self, payable_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
         logger.info(f"Superlógica: liquidando contas a pagar ID {payable_id}...")
 
-        url = f"{self.base_url}/v2/condor/MovimentacoesDiretas/post"
-        response = requests.put(url, headers=self._headers(), params=data)
-
-        if response.status_code != 200:
-            logger.error(f"Erro ao liquidar contas a pagar: {response.status_code} - {response.text}")
-            response.raise_for_status()
-
-        return response.json()
+        response = self._http.put(self._movement_url(), headers=self._headers(), params=data)
+        return self._handle_response(response, "liquidar contas a pagar")
 
     def cancel_payable(self, payable_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
         logger.info(f"Superlógica: cancelando contas a pagar ID {payable_id}...")
 
-        url = f"{self.base_url}/v2/condor/MovimentacoesDiretas/post"
-        response = requests.put(url, headers=self._headers(), params=data)
-
-        if response.status_code != 200:
-            logger.error(f"Erro ao cancelar contas a pagar: {response.status_code} - {response.text}")
-            response.raise_for_status()
-
-        return response.json()
+        response = self._http.put(self._movement_url(), headers=self._headers(), params=data)
+        return self._handle_response(response, "cancelar contas a pagar")
 
     def upload_attachment(self, file_path: str, condominium_id: str, publish: int = 4) -> Dict[str, Any]:
         """
         Envia um anexo (ex: nota fiscal ou boleto) ao Superlógica.
 
+        O arquivo é enviado em streaming, sem ser carregado em memória. Um arquivo
+        com o mesmo conteúdo (SHA-256) já enviado ao mesmo condomínio não é
+        reenviado: a resposta registrada no envio anterior é retornada.
+
         Args:
             file_path (str): Caminho do arquivo local.
             condominium_id (str): ID do condomínio.
@@ -85,20 +59,71 @@ class SuperlogicaPayablesClient(PayablesClientInterface):
         Returns:
             dict: Resposta da API com ID do documento enviado.
         """
-        logger.info(f"Superlógica: enviando anexo para o condomínio {condominium_id}...")
+        return self._upload(file_path, condominium_id, publish, file_sha256(file_path))
+
+    def _upload(
+        self, file_path: str, condominium_id: str, publish: int, digest: str
+    ) -> Dict[str, Any]:
+        document_key = self._document_key(condominium_id, digest)
+        stored = self._idempotency.get("superlogica:document", document_key)
+        if stored is not None:
+            self._log_stored_upload(file_path, condominium_id)
+            return stored
+
+        url = self._upload_url(condominium_id, publish)
+        with MultipartFileBody(file_path) as body:
+            response = self._http.post(url, headers=self._upload_headers(body), data=body)
+
+        result = self._handle_response(response, "enviar anexo")
+        self._idempotency.put("superlogica:document", document_key, result)
+        return result
 
-        url = f"{self.base_url}/v2/condor/documentos?idEmpresa={condominium_id}&publicar={publish}"
-        headers = {
-            "app_token": self.app_token,
-            "access_token": self.access_token,
-        }
+    def upload_attachments(
+        self,
+        file_paths: List[str],
+        condominium_id: str,
+        publish: int = 4,
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Envia vários anexos ao mesmo condomínio, com envios simultâneos limitados.
 
-        with open(file_path, "rb") as f:
-            files = {"arquivo": (os.path.basename(file_path), f)}
-            response = requests.post(url, headers=headers, files=files)
+        Arquivos com conteúdo idêntico (no lote ou já enviados antes) são
+        enviados uma única vez.
 
-        if response.status_code != 200:
-            logger.error(f"Erro ao enviar anexo: {response.status_code} - {response.text}")
-            response.raise_for_status()
+        Args:
+            file_paths (List[str]): Caminhos dos arquivos locais.
+            condominium_id (str): ID do condomínio.
+            publish (int): Regra de publicação (1 a 4). Default: 4 (não publicar).
+            max_workers (int): Envios simultâneos (default: SUPERLOGICA_UPLOAD_WORKERS ou 4).
 
-        return response.json()
+        Returns:
+            Dict[str, Any]: Resumo com `status` ("success", "partial" ou "error"),
+            contadores, o resultado de cada arquivo em `results` e as falhas em `failures`.
+        """
+        max_workers = self._upload_concurrency(file_paths, condominium_id, max_workers)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            digests = list(executor.map(safe_sha256, file_paths))
+            unique = group_by_digest(file_paths, digests)
+            uploads = dict(
+                zip(
+                    unique,
+                    executor.map(
+                        lambda digest: self._safe_upload(
+                            unique[digest], condominium_id, publish, digest
+                        ),
+                        unique,
+                    ),
+                )
+            )
+
+        return summarize_uploads(file_paths, digests, unique, uploads)
+
+    def _safe_upload(
+        self, file_path: str, condominium_id: str, publish: int, digest: str
+    ) -> Dict[str, Any]:
+        try:
+            return upload_success(self._upload(file_path, condominium_id, publish, digest))
+        except (requests.RequestException, CircuitOpenError, OSError, ValueError) as e:
+            return self._upload_failure(file_path, e)
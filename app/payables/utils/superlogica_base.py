@@ -0,0 +1,112 @@
+import os
+from typing import Any, Dict, List, Optional
+
+from app.payables.utils.uploads import upload_error
+from app.payables.utils.validators import validate_create_payable_payload
+from app.utils.idempotency_store import get_idempotency_store
+from app.utils.json_codec import decode_response
+from app.utils.logger import get_logger
+from app.utils.multipart import MultipartFileBody
+
+logger = get_logger(__name__)
+
+
+class SuperlogicaClientBase:
+    """
+    Configuração, URLs, cabeçalhos e leitura das respostas do Superlógica
+    (contas a pagar e anexos).
+
+    Não faz I/O de rede, e por isso é compartilhado pelos clientes síncrono
+    (`SuperlogicaPayablesClient`) e assíncrono (`AsyncSuperlogicaPayablesClient`),
+    que só enviam as requisições. As respostas podem vir do `requests` ou do `httpx`.
+    """
+
+    def __init__(self):
+        self.base_url = os.getenv("SUPERLOGICA_BASE_URL")
+        self.app_token = os.getenv("SUPERLOGICA_APP_TOKEN")
+        self.access_token = os.getenv("SUPERLOGICA_ACCESS_TOKEN")
+
+        if not all([self.base_url, self.app_token, self.access_token]):
+            raise EnvironmentError("Superlógica: credenciais não configuradas corretamente.")
+
+        self._idempotency = get_idempotency_store()
+
+    def _headers(self):
+        return {
+            "Content-Type": "application/x-www-form-urlencoded",
+            "app_token": self.app_token,
+            "access_token": self.access_token,
+        }
+
+    def _raise_for_status(self, response: Any, action: str) -> None:
+        if response.status_code != 200:
+            logger.error(f"Erro ao {action}: {response.status_code} - {response.text}")
+            response.raise_for_status()
+
+    def _handle_response(self, response: Any, action: str) -> Dict[str, Any]:
+        self._raise_for_status(response, action)
+        return decode_response(response)
+
+    # --- Contas a pagar -----------------------------------------------------
+
+    def _create_url(self, data: Dict[str, Any]) -> str:
+        """Valida o payload de criação e devolve a URL do envio."""
+        logger.info("Superlógica: criando contas a pagar...")
+        validate_create_payable_payload(data)
+
+        url = f"{self.base_url}/v2/condor/MovimentacoesDiretas/"
+        logger.debug(f"POST {url}")
+        logger.debug("Payload: %s", data)
+        return url
+
+    def _create_result(self, response: Any) -> Dict[str, Any]:
+        self._raise_for_status(response, "criar contas a pagar")
+
+        try:
+            result = decode_response(response)
+        except ValueError:
+            logger.warning("Resposta não está em JSON. Retornando texto puro.")
+            result = {"raw_response": response.text}
+
+        logger.info("Superlógica: contas a pagar criada com sucesso.")
+        return result
+
+    def _movement_url(self) -> str:
+        return f"{self.base_url}/v2/condor/MovimentacoesDiretas/post"
+
+    # --- Anexos ---------------------------------------------------------------
+
+    def _document_key(self, condominium_id: str, digest: str) -> str:
+        return f"{condominium_id}:{digest}"
+
+    def _log_stored_upload(self, file_path: str, condominium_id: str) -> None:
+        logger.info(
+            f"Superlógica: {os.path.basename(file_path)} já enviado ao condomínio "
+            f"{condominium_id}; retornando resposta registrada."
+        )
+
+    def _upload_url(self, condominium_id: str, publish: int) -> str:
+        logger.info(f"Superlógica: enviando anexo para o condomínio {condominium_id}...")
+        return f"{self.base_url}/v2/condor/documentos?idEmpresa={condominium_id}&publicar={publish}"
+
+    def _upload_headers(self, body: MultipartFileBody) -> Dict[str, str]:
+        return {
+            "app_token": self.app_token,
+            "access_token": self.access_token,
+            "Content-Type": body.content_type,
+            "Content-Length": str(len(body)),
+        }
+
+    def _upload_concurrency(
+        self, file_paths: List[str], condominium_id: str, limit: Optional[int]
+    ) -> int:
+        limit = limit or int(os.getenv("SUPERLOGICA_UPLOAD_WORKERS", "4"))
+        logger.info(
+            f"Superlógica: enviando {len(file_paths)} anexos ao condomínio {condominium_id} "
+            f"({limit} simultâneos)."
+        )
+        return limit
+
+    def _upload_failure(self, file_path: str, error: Exception) -> Dict[str, Any]:
+        logger.error(f"Superlógica: falha ao enviar {file_path}: {error}")
+        return upload_error(str(error))
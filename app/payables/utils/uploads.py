@@ -0,0 +1,64 @@
+from typing import Any, Dict, List, Optional
+
+from app.utils.multipart import file_sha256
+
+
+def safe_sha256(file_path: str) -> Optional[str]:
+    """SHA-256 do arquivo, ou None se ele não puder ser lido."""
+    try:
+        return file_sha256(file_path)
+    except OSError:
+        return None
+
+
+def group_by_digest(file_paths: List[str], digests: List[Optional[str]]) -> Dict[str, str]:
+    """Retorna `{hash: primeiro arquivo com esse conteúdo}`, ignorando arquivos ilegíveis."""
+    unique: Dict[str, str] = {}
+    for file_path, digest in zip(file_paths, digests):
+        if digest is not None:
+            unique.setdefault(digest, file_path)
+    return unique
+
+
+def upload_success(response: Dict[str, Any]) -> Dict[str, Any]:
+    return {"status": "success", "response": response}
+
+
+def upload_error(error: str) -> Dict[str, Any]:
+    return {"status": "error", "error": error}
+
+
+def summarize_uploads(
+    file_paths: List[str],
+    digests: List[Optional[str]],
+    unique: Dict[str, str],
+    uploads: Dict[str, Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    Consolida os envios em um resumo por arquivo.
+
+    Arquivos repetidos recebem o resultado do envio do primeiro arquivo com o
+    mesmo conteúdo, indicado em `duplicate_of`.
+    """
+    results: List[Dict[str, Any]] = []
+    for file_path, digest in zip(file_paths, digests):
+        if digest is None:
+            results.append({"file_path": file_path, **upload_error("Arquivo não pôde ser lido.")})
+            continue
+
+        result = {"file_path": file_path, "sha256": digest, **uploads[digest]}
+        if unique[digest] != file_path:
+            result["duplicate_of"] = unique[digest]
+        results.append(result)
+
+    failures = [result for result in results if result["status"] != "success"]
+    succeeded = len(results) - len(failures)
+    return {
+        "status": "success" if not failures else ("partial" if succeeded else "error"),
+        "total": len(results),
+        "succeeded": succeeded,
+        "failed": len(failures),
+        "unique_files": len(unique),
+        "results": results,
+        "failures": failures,
+    }
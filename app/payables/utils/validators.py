@@ -1,5 +1,6 @@
 from typing import Dict
 from app.utils.logger import get_logger
+from app.utils.schema import Field, Schema, is_falsy
 
 logger = get_logger(__name__)
 
@@ -12,8 +13,14 @@ REQUIRED_FIELDS_CREATE_PAYABLE = [
     "ID_CONDOMINIO_COND",    # ID do condomínio
 ]
 
+# Schema da criação de contas a pagar (use com `validate_many` para lotes).
+# Como na validação original, qualquer valor falso (inclusive 0) é ausente.
+CREATE_PAYABLE_SCHEMA = Schema(
+    [Field(field, required=True, missing=is_falsy) for field in REQUIRED_FIELDS_CREATE_PAYABLE]
+)
 
-def validate_create_payable_payload(data: Dict[str, str]) -> None:
+
+def validate_create_payable_payload(data: Dict[str, str]) -> Dict[str, str]:
     """
     Valida os campos obrigatórios exigidos pela Superlógica
     para criação de uma nova movimentação bancária (contas a pagar).
@@ -21,13 +28,13 @@ def validate_create_payable_payload(data: Dict[str, str]) -> None:
     Args:
         data (Dict[str, str]): Dados enviados no corpo da requisição.
 
+    Returns:
+        Dict[str, str]: Cópia validada dos dados.
+
     Raises:
-        ValueError: Se algum campo obrigatório estiver ausente.
+        ValueError: Com todos os campos obrigatórios ausentes.
     """
     logger.debug("Validando payload de criação de contas a pagar...")
-
-    for field in REQUIRED_FIELDS_CREATE_PAYABLE:
-        if not data.get(field):
-            raise ValueError(f"O campo obrigatório '{field}' está ausente.")
-
+    normalized = CREATE_PAYABLE_SCHEMA.check(data)
     logger.info("Payload de criação de contas a pagar validado com sucesso.")
+    return normalized
@@ -1,136 +1,137 @@
-import json
-import os
-import requests
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Iterator, Optional
 
-from app.payment.constants.asaas_constants import WEBHOOK_PAYMENT_FIELDS
 from app.payment.payment_client_interface import PaymentClientInterface
-from app.payment.utils.validators import validate_payment_payload
+from app.payment.utils.asaas_base import AsaasClientBase
+from app.payment.utils.payment_listing import MAX_PAGE_SIZE, DateLike, page_params
+from app.utils.http_transport import get_transport
 from app.utils.logger import get_logger
+from app.utils.metrics import instrument_client
+from app.utils.pagination import iter_pages
 
 logger = get_logger(__name__)
 
 
-class PaymentClientAsaas(PaymentClientInterface):
+@instrument_client("asaas", include=("reconcile_payments",))
+class PaymentClientAsaas(AsaasClientBase, PaymentClientInterface):
     def __init__(self):
-        self.base_url = os.getenv("ASAAS_BASE_URL")
-        self.api_key = os.getenv("ASAAS_API_KEY")
-
-        if not self.api_key:
-            raise EnvironmentError("Asaas: chave de API não configurada.")
-
-    def _headers(self):
-        return {"Content-Type": "application/json", "access_token": self.api_key}
+        super().__init__()
+        self._http = get_transport().for_provider("asaas")
 
     def create_payment(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        logger.debug("Asaas: criando pagamento com os dados:")
-        logger.debug(data)
-
-        validate_payment_payload(data, context="create")
-
-        url = f"{self.base_url}/payments"
-        response = requests.post(url, headers=self._headers(), json=data)
+        data = self._payment_data(data)
 
-        if response.status_code not in (200, 201):
-            logger.error(
-                f"Asaas: erro ao criar pagamento: {response.status_code} - {response.text}"
+        external_reference = data.get("externalReference")
+        stored = self._idempotency.get("asaas:payment", external_reference)
+        if stored is not None:
+            logger.info(
+                f"Asaas: pagamento {external_reference} já criado; retornando resposta registrada."
             )
-            response.raise_for_status()
+            return stored
 
-        return response.json()
+        url = f"{self.base_url}/payments"
+        # Sem `idempotency_key`: a Asaas não recusa `externalReference` repetido,
+        # então repetir após uma resposta perdida criaria uma segunda cobrança.
+        response = self._http.post(
+            url,
+            headers=self._headers(),
+            json=data,
+        )
+
+        result = self._handle_response(response, "criar pagamento", (200, 201))
+        self._idempotency.put("asaas:payment", external_reference, result)
+        return result
 
     def cancel_payment(self, payment_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Cancela uma cobrança existente (altera status para CANCELLED)."""
-        logger.debug(f"Asaas: cancelando pagamento {payment_id}...")
-        
-        data["status"] = "CANCELLED"          
-        validate_payment_payload(data, context="update")
+        data = self._cancel_data(payment_id, data)
 
         url = f"{self.base_url}/payments/{payment_id}"
-        response = requests.put(url, headers=self._headers(), json=data)
-
-        if response.status_code != 200:
-            logger.error(
-                f"Asaas: erro ao cancelar pagamento: {response.status_code} - {response.text}"
-            )
-            response.raise_for_status()
-
-        return response.json()
+        response = self._http.put(
+            url, headers=self._headers(), json=data, idempotent=True
+        )
+        return self._handle_response(response, "cancelar pagamento")
 
     def get_payment_status(self, payment_id: str) -> Dict[str, Any]:
         """Consulta o status de um pagamento."""
         logger.debug(f"Asaas: consultando status do pagamento {payment_id}...")
 
         url = f"{self.base_url}/payments/{payment_id}/status"
-        response = requests.get(url, headers=self._headers())
-
-        if response.status_code != 200:
-            logger.error(
-                f"Asaas: erro ao consultar status: {response.status_code} - {response.text}"
-            )
-            response.raise_for_status()
-
-        return response.json()
+        response = self._http.get(url, headers=self._headers())
+        return self._handle_response(response, "consultar status")
+
+    def list_payments(
+        self,
+        status: Optional[str] = None,
+        customer: Optional[str] = None,
+        due_date_from: Optional[DateLike] = None,
+        due_date_to: Optional[DateLike] = None,
+        billing_type: Optional[str] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: Optional[int] = None,
+        **filters: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Percorre `GET /payments` página a página, entregando um pagamento por vez.
 
+        As páginas seguintes à primeira são buscadas em paralelo (até `prefetch`
+        à frente; default: ASAAS_LIST_PREFETCH ou 4) e os pagamentos são
+        entregues sob demanda, sem carregar a listagem inteira em memória.
 
-    def handle_payment_webhook(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Processa o webhook de pagamento recebido da Asaas,
-        extraindo apenas os campos relevantes definidos em WEBHOOK_PAYMENT_FIELDS.
+        Como a paginação é por offset, registros criados ou alterados durante a
+        leitura podem aparecer deslocados entre páginas.
 
         Args:
-            payload (dict): Payload completo enviado pela Asaas.
-
-        Returns:
-            dict: Dados filtrados com os campos mais relevantes para processamento interno.
+            status (str): Ex: "PENDING", "RECEIVED", "OVERDUE".
+            customer (str): ID do cliente na Asaas.
+            due_date_from (date | str): Vencimento a partir de (inclusive).
+            due_date_to (date | str): Vencimento até (inclusive).
+            billing_type (str): Ex: "PIX", "BOLETO".
+            page_size (int): Registros por página (máximo 100).
+            filters: Outros filtros da API, com o nome original.
         """
-        logger.info("Asaas: processando payload do webhook de pagamento...")
+        query, page_size, prefetch = self._list_query(
+            status, customer, due_date_from, due_date_to, billing_type,
+            page_size, prefetch, filters,
+        )
+        url = f"{self.base_url}/payments"
 
-        flat_data = {}
-        for field in WEBHOOK_PAYMENT_FIELDS:
-            value = self._extract_nested_field(payload, field)
-            flat_data[field] = value
-            logger.debug(f"Asaas Webhook: {field} = {value}")
+        def fetch_page(index: int):
+            params = page_params(query, index, page_size)
+            response = self._http.get(url, headers=self._headers(), params=params)
+            return self._parse_list_response(response, page_size)
 
-        logger.info("Asaas: extração do webhook concluída com sucesso.")
-        return flat_data
+        for page in iter_pages(fetch_page, prefetch):
+            for payment in page:
+                yield payment
 
-    def _extract_nested_field(self, payload: Dict[str, Any], field: str) -> Any:
+    def reconcile_payments(
+        self, payment_ids: Iterable[str], **filters: Any
+    ) -> Dict[str, Any]:
         """
-        Extrai o valor de um campo aninhado do payload, como 'payment.id'.
+        Obtém o status de vários pagamentos a partir da listagem, em vez de uma
+        consulta por ID.
 
-        Args:
-            payload (dict): Dicionário de origem.
-            field (str): Caminho no formato 'a.b.c'.
+        Os `filters` (os mesmos de `list_payments`, ex: intervalo de vencimento)
+        devem cobrir os pagamentos procurados; quanto mais restritos, menos
+        páginas são lidas. A leitura termina assim que todos forem encontrados.
 
         Returns:
-            Any: Valor extraído ou None se não encontrado.
+            Dict[str, Any]: `statuses` (`{id: status}`) dos encontrados e
+            `missing` com os IDs que não apareceram na listagem.
         """
-        parts = field.split(".")
-        value = payload
-        for part in parts:
-            if not isinstance(value, dict) or part not in value:
-                return None
-            value = value[part]
-        return value
-    
-    def get_payment_link(self, payment_data: Dict[str, Any]) -> str:
-        """
-        Retorna o link do boleto bancário, se disponível.
+        wanted = set(payment_ids)
+        statuses: Dict[str, str] = {}
+        if not wanted:
+            return {"statuses": statuses, "missing": []}
 
-        Args:
-            payment_data (dict): Resposta completa da API após criação ou consulta do pagamento.
+        for payment in self.list_payments(**filters):
+            if payment["id"] in wanted:
+                statuses[payment["id"]] = payment.get("status")
+                if len(statuses) == len(wanted):
+                    break
+
+        return self._reconcile_result(wanted, statuses)
 
-        Returns:
-            str: URL do boleto (`bankSlipUrl`), ou uma string vazia se não encontrado.
-        """
-        link = payment_data.get("bankSlipUrl")
-        if link:
-            logger.info(f"Asaas: link do boleto encontrado: {link}")
-        else:
-            logger.warning("Asaas: link do boleto não disponível no response.")
-        return link or ""
-    
     def create_customer(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Cria um novo cliente na plataforma Asaas.
@@ -139,7 +140,7 @@ class PaymentClientAsaas(PaymentClientInterface):
             data (dict): Dados obrigatórios e opcionais do cliente. Campos mínimos:
                 - name (str): Nome ou razão social
                 - cpfCnpj (str): CPF ou CNPJ (somente números)
-            
+
             Campos adicionais recomendados:
                 - email, phone, mobilePhone, postalCode, addressNumber
                 - address, complement, province, externalReference, etc.
@@ -147,25 +148,28 @@ class PaymentClientAsaas(PaymentClientInterface):
         Returns:
             dict: Resposta completa da API do Asaas com ID do cliente criado.
         """
-        logger.info("Asaas: criando cliente...")
+        data = self._customer_data(data)
 
-        required_fields = ["name", "cpfCnpj"]
-        for field in required_fields:
-            if not data.get(field):
-                logger.error(f"Asaas: campo obrigatório '{field}' ausente.")
-                raise ValueError(f"O campo obrigatório '{field}' está ausente.")
+        external_reference = data.get("externalReference")
+        stored = self._idempotency.get("asaas:customer", external_reference)
+        if stored is not None:
+            logger.info(
+                f"Asaas: cliente {external_reference} já criado; retornando resposta registrada."
+            )
+            return stored
 
         url = f"{self.base_url}/customers"
-        logger.debug(f"POST {url}")
-        logger.debug(f"Payload: {json.dumps(data, indent=2, ensure_ascii=False)}")
-
-        response = requests.post(url, headers=self._headers(), json=data)
-
-        if response.status_code not in (200, 201):
-            logger.error(f"Asaas: erro ao criar cliente: {response.status_code} - {response.text}")
-            response.raise_for_status()
-
-        result = response.json()
+        self._log_customer_request(url, data)
+
+        # Sem `idempotency_key`: a Asaas não recusa `externalReference` repetido,
+        # então repetir após uma resposta perdida criaria um segundo cliente.
+        response = self._http.post(
+            url,
+            headers=self._headers(),
+            json=data,
+        )
+
+        result = self._handle_response(response, "criar cliente", (200, 201))
+        self._idempotency.put("asaas:customer", external_reference, result)
         logger.info(f"Asaas: cliente criado com sucesso: {result.get('id')}")
         return result
-
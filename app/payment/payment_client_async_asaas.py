@@ -0,0 +1,179 @@
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Dict, Iterable, Optional
+
+from app.payment.payment_client_async_interface import AsyncPaymentClientInterface
+from app.payment.utils.asaas_base import AsaasClientBase
+from app.payment.utils.payment_listing import MAX_PAGE_SIZE, DateLike, page_params
+from app.utils.async_http_transport import AsyncProviderTransport, get_async_transport
+from app.utils.logger import get_logger
+from app.utils.metrics import instrument_client
+from app.utils.pagination import aiter_pages
+
+logger = get_logger(__name__)
+
+
+@instrument_client("asaas", include=("reconcile_payments",))
+class AsyncPaymentClientAsaas(AsaasClientBase, AsyncPaymentClientInterface):
+    """Versão assíncrona de `PaymentClientAsaas`."""
+
+    @property
+    def _http(self) -> AsyncProviderTransport:
+        return get_async_transport().for_provider("asaas")
+
+    async def create_payment(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        data = self._payment_data(data)
+
+        external_reference = data.get("externalReference")
+        stored = await self._idempotency.get_async("asaas:payment", external_reference)
+        if stored is not None:
+            logger.info(
+                f"Asaas: pagamento {external_reference} já criado; retornando resposta registrada."
+            )
+            return stored
+
+        url = f"{self.base_url}/payments"
+        # Sem `idempotency_key`: a Asaas não recusa `externalReference` repetido,
+        # então repetir após uma resposta perdida criaria uma segunda cobrança.
+        response = await self._http.post(
+            url,
+            headers=self._headers(),
+            json=data,
+        )
+
+        result = self._handle_response(response, "criar pagamento", (200, 201))
+        await self._idempotency.put_async("asaas:payment", external_reference, result)
+        return result
+
+    async def cancel_payment(self, payment_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Cancela uma cobrança existente (altera status para CANCELLED)."""
+        data = self._cancel_data(payment_id, data)
+
+        url = f"{self.base_url}/payments/{payment_id}"
+        response = await self._http.put(
+            url, headers=self._headers(), json=data, idempotent=True
+        )
+        return self._handle_response(response, "cancelar pagamento")
+
+    async def get_payment_status(self, payment_id: str) -> Dict[str, Any]:
+        """Consulta o status de um pagamento."""
+        logger.debug(f"Asaas: consultando status do pagamento {payment_id}...")
+
+        url = f"{self.base_url}/payments/{payment_id}/status"
+        response = await self._http.get(url, headers=self._headers())
+        return self._handle_response(response, "consultar status")
+
+    async def list_payments(
+        self,
+        status: Optional[str] = None,
+        customer: Optional[str] = None,
+        due_date_from: Optional[DateLike] = None,
+        due_date_to: Optional[DateLike] = None,
+        billing_type: Optional[str] = None,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: Optional[int] = None,
+        **filters: Any,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Percorre `GET /payments` página a página, entregando um pagamento por vez.
+
+        As páginas seguintes à primeira são buscadas em paralelo (até `prefetch`
+        à frente; default: ASAAS_LIST_PREFETCH ou 4) e os pagamentos são
+        entregues sob demanda, sem carregar a listagem inteira em memória.
+
+        Como a paginação é por offset, registros criados ou alterados durante a
+        leitura podem aparecer deslocados entre páginas.
+
+        Args:
+            status (str): Ex: "PENDING", "RECEIVED", "OVERDUE".
+            customer (str): ID do cliente na Asaas.
+            due_date_from (date | str): Vencimento a partir de (inclusive).
+            due_date_to (date | str): Vencimento até (inclusive).
+            billing_type (str): Ex: "PIX", "BOLETO".
+            page_size (int): Registros por página (máximo 100).
+            filters: Outros filtros da API, com o nome original.
+        """
+        query, page_size, prefetch = self._list_query(
+            status, customer, due_date_from, due_date_to, billing_type,
+            page_size, prefetch, filters,
+        )
+        url = f"{self.base_url}/payments"
+
+        async def fetch_page(index: int):
+            params = page_params(query, index, page_size)
+            response = await self._http.get(url, headers=self._headers(), params=params)
+            return self._parse_list_response(response, page_size)
+
+        async for page in aiter_pages(fetch_page, prefetch):
+            for payment in page:
+                yield payment
+
+    async def reconcile_payments(
+        self, payment_ids: Iterable[str], **filters: Any
+    ) -> Dict[str, Any]:
+        """
+        Obtém o status de vários pagamentos a partir da listagem, em vez de uma
+        consulta por ID.
+
+        Os `filters` (os mesmos de `list_payments`, ex: intervalo de vencimento)
+        devem cobrir os pagamentos procurados; quanto mais restritos, menos
+        páginas são lidas. A leitura termina assim que todos forem encontrados.
+
+        Returns:
+            Dict[str, Any]: `statuses` (`{id: status}`) dos encontrados e
+            `missing` com os IDs que não apareceram na listagem.
+        """
+        wanted = set(payment_ids)
+        statuses: Dict[str, str] = {}
+        if not wanted:
+            return {"statuses": statuses, "missing": []}
+
+        async with aclosing(self.list_payments(**filters)) as payments:
+            async for payment in payments:
+                if payment["id"] in wanted:
+                    statuses[payment["id"]] = payment.get("status")
+                    if len(statuses) == len(wanted):
+                        break
+
+        return self._reconcile_result(wanted, statuses)
+
+    async def create_customer(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Cria um novo cliente na plataforma Asaas.
+
+        Args:
+            data (dict): Dados obrigatórios e opcionais do cliente. Campos mínimos:
+                - name (str): Nome ou razão social
+                - cpfCnpj (str): CPF ou CNPJ (somente números)
+
+            Campos adicionais recomendados:
+                - email, phone, mobilePhone, postalCode, addressNumber
+                - address, complement, province, externalReference, etc.
+
+        Returns:
+            dict: Resposta completa da API do Asaas com ID do cliente criado.
+        """
+        data = self._customer_data(data)
+
+        external_reference = data.get("externalReference")
+        stored = await self._idempotency.get_async("asaas:customer", external_reference)
+        if stored is not None:
+            logger.info(
+                f"Asaas: cliente {external_reference} já criado; retornando resposta registrada."
+            )
+            return stored
+
+        url = f"{self.base_url}/customers"
+        self._log_customer_request(url, data)
+
+        # Sem `idempotency_key`: a Asaas não recusa `externalReference` repetido,
+        # então repetir após uma resposta perdida criaria um segundo cliente.
+        response = await self._http.post(
+            url,
+            headers=self._headers(),
+            json=data,
+        )
+
+        result = self._handle_response(response, "criar cliente", (200, 201))
+        await self._idempotency.put_async("asaas:customer", external_reference, result)
+        logger.info(f"Asaas: cliente criado com sucesso: {result.get('id')}")
+        return result
@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict
+
+
+class AsyncPaymentClientInterface(ABC):
+    """
+    Contraparte assíncrona (asyncio) de `PaymentClientInterface`.
+
+    `handle_payment_webhook` e `get_payment_link` não fazem I/O de rede
+    e por isso permanecem síncronos.
+    """
+
+    @abstractmethod
+    async def create_payment(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Gera um novo pagamento (ex: boleto, pix, cartão)."""
+        pass
+
+    @abstractmethod
+    async def cancel_payment(self, payment_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Cancela um pagamento existente."""
+        pass
+
+    @abstractmethod
+    async def get_payment_status(self, payment_id: str) -> Dict[str, Any]:
+        """Consulta o status de um pagamento."""
+        pass
+
+    @abstractmethod
+    def handle_payment_webhook(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Processa um webhook recebido da plataforma de pagamento."""
+        pass
+
+    @abstractmethod
+    def get_payment_link(self, payment_data: Dict[str, Any]) -> str:
+        """Extrai e retorna o link do boleto (caso exista) a partir dos dados da cobrança."""
+        pass
+
+    @abstractmethod
+    async def create_customer(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Cria um novo cliente no provedor de pagamento (ex: Asaas)."""
+        pass
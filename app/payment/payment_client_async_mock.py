@@ -0,0 +1,55 @@
+from typing import Any, AsyncIterator, Dict, Optional
+from app.payment.payment_client_async_interface import AsyncPaymentClientInterface
+from app.payment.payment_client_mock import PaymentClientMock
+from app.payment.utils.payment_listing import DateLike
+from app.mocks.load_profile import LoadProfile
+from app.utils.metrics import instrument_client
+
+
+@instrument_client("mock")
+class AsyncPaymentClientMock(AsyncPaymentClientInterface):
+    """Mock assíncrono de pagamentos; delega o armazenamento em memória ao `PaymentClientMock`."""
+
+    def __init__(self):
+        # A latência e as falhas são aplicadas aqui, sem bloquear o event loop;
+        # o mock síncrono interno só guarda os dados.
+        self._load = LoadProfile.from_env()
+        self._client = PaymentClientMock(LoadProfile())
+
+    def get_access_token(self) -> str:
+        return self._client.get_access_token()
+
+    async def create_payment(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        await self._load.apply_async("create_payment")
+        return self._client.create_payment(data)
+
+    async def cancel_payment(self, payment_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        await self._load.apply_async("cancel_payment")
+        return self._client.cancel_payment(payment_id, data)
+
+    async def get_payment_status(self, payment_id: str) -> Dict[str, Any]:
+        await self._load.apply_async("get_payment_status")
+        return self._client.get_payment_status(payment_id)
+
+    async def list_payments(
+        self,
+        status: Optional[str] = None,
+        customer: Optional[str] = None,
+        due_date_from: Optional[DateLike] = None,
+        due_date_to: Optional[DateLike] = None,
+        **filters: Any,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        await self._load.apply_async("list_payments")
+        payments = self._client.list_payments(status, customer, due_date_from, due_date_to, **filters)
+        for payment in payments:
+            yield payment
+
+    def handle_payment_webhook(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return self._client.handle_payment_webhook(payload)
+
+    def get_payment_link(self, payment_data: Dict[str, Any]) -> str:
+        return self._client.get_payment_link(payment_data)
+
+    async def create_customer(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        await self._load.apply_async("create_customer")
+        return self._client.create_customer(data)
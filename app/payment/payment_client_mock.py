@@ -1,15 +1,26 @@
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, Optional
+from app.mocks.load_profile import LoadProfile
+from app.mocks.store import MockStore, date_key
 from app.payment.payment_client_interface import PaymentClientInterface
+from app.payment.utils.payment_listing import DateLike
 from app.utils.logger import get_logger
+from app.utils.metrics import instrument_client
 
 logger = get_logger(__name__)
 
 
+@instrument_client("mock")
 class PaymentClientMock(PaymentClientInterface):
-    def __init__(self):
+    def __init__(self, load_profile: Optional[LoadProfile] = None):
         self._token = None
-        self._payments = {}
+        self._payments = MockStore(
+            "pay",
+            indexes=("status", "customer_id", "externalReference"),
+            range_indexes={"due_date": date_key},
+        )
+        self._customers = MockStore("cus-mock")
+        self._load = load_profile or LoadProfile.from_env()
 
     def get_config(self) -> Dict[str, Any]:
         logger.debug("MockPayment: carregando configurações do ambiente.")
@@ -28,6 +39,7 @@ class PaymentClientMock(PaymentClientInterface):
         return self._token
 
     def create_payment(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        self._load.apply("create_payment")
         token = data.get("token")
         if token != self._token:
             logger.error("MockPayment: token inválido ou ausente ao gerar pagamento.")
@@ -41,30 +53,30 @@ class PaymentClientMock(PaymentClientInterface):
 
         logger.info(f"MockPayment: token {token} validado com sucesso.")
 
-        payment_id = f"pay-{len(self._payments) + 1}"
-        self._payments[payment_id] = {
-            "id": payment_id,
+        payment_id = self._payments.next_id()
+        self._payments.insert({
             "customer_id": data["customer_id"],
             "amount": data["amount"],
             "due_date": data["due_date"],
+            "externalReference": data.get("externalReference"),
             "status": "pending",
             "bank_slip_url": f"https://mock.boleto/{payment_id}.pdf",
-        }
+        }, record_id=payment_id)
 
         logger.info(f"MockPayment: pagamento criado com ID {payment_id}")
         return {"status": "success", "payment_id": payment_id}
 
     def cancel_payment(self, payment_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
-        payment = self._payments.get(payment_id)
-        if not payment:
+        self._load.apply("cancel_payment")
+        if self._payments.update(payment_id, {"status": "cancelled"}) is None:
             logger.warning(f"MockPayment: pagamento {payment_id} não encontrado.")
             return {"status": "not_found"}
 
-        payment["status"] = "cancelled"
         logger.info(f"MockPayment: pagamento {payment_id} cancelado.")
         return {"status": "success", "cancelled_id": payment_id}
 
     def get_payment_status(self, payment_id: str) -> Dict[str, Any]:
+        self._load.apply("get_payment_status")
         payment = self._payments.get(payment_id)
         if not payment:
             logger.warning(f"MockPayment: pagamento {payment_id} não encontrado.")
@@ -73,6 +85,33 @@ class PaymentClientMock(PaymentClientInterface):
         logger.info(f"MockPayment: status do pagamento {payment_id} = {payment['status']}")
         return {"status": "success", "payment_status": payment["status"]}
 
+    def list_payments(
+        self,
+        status: Optional[str] = None,
+        customer: Optional[str] = None,
+        due_date_from: Optional[DateLike] = None,
+        due_date_to: Optional[DateLike] = None,
+        **filters: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Consulta os pagamentos do mock pelos índices, com os filtros equivalentes
+        aos de `PaymentClientAsaas.list_payments`.
+
+        Args:
+            status (str): "pending", "paid", "failed" ou "cancelled".
+            customer (str): `customer_id` do pagamento.
+            due_date_from (date | str): Vencimento a partir de (inclusive).
+            due_date_to (date | str): Vencimento até (inclusive).
+            filters: Igualdade em outros campos (ex: `externalReference`).
+        """
+        self._load.apply("list_payments")
+        query = {"status": status, "customer_id": customer, **filters}
+        query = {field: value for field, value in query.items() if value is not None}
+        ranges = {}
+        if due_date_from or due_date_to:
+            ranges["due_date"] = (due_date_from, due_date_to)
+        return iter(self._payments.find(ranges, **query))
+
     def handle_payment_webhook(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         logger.info("MockPayment: processando webhook de pagamento...")
 
@@ -83,22 +122,20 @@ class PaymentClientMock(PaymentClientInterface):
             logger.error("MockPayment: webhook inválido, campos obrigatórios ausentes.")
             return {"status": "error", "message": "Campos obrigatórios ausentes."}
 
-        payment = self._payments.get(payment_id)
-        if not payment:
-            logger.warning(f"MockPayment: pagamento {payment_id} não encontrado.")
-            return {"status": "not_found"}
-
-        if event_type == "payment_confirmed":
-            payment["status"] = "paid"
-            logger.info(f"MockPayment: pagamento {payment_id} marcado como pago.")
-        elif event_type == "payment_failed":
-            payment["status"] = "failed"
-            logger.info(f"MockPayment: pagamento {payment_id} marcado como falhou.")
-        else:
+        new_status = {"payment_confirmed": "paid", "payment_failed": "failed"}.get(event_type)
+        if new_status is None:
+            if payment_id not in self._payments:
+                logger.warning(f"MockPayment: pagamento {payment_id} não encontrado.")
+                return {"status": "not_found"}
             logger.warning(f"MockPayment: tipo de evento desconhecido: {event_type}")
             return {"status": "ignored", "message": f"Evento não tratado: {event_type}"}
 
-        return {"status": "success", "payment_id": payment_id, "new_status": payment["status"]}
+        if self._payments.update(payment_id, {"status": new_status}) is None:
+            logger.warning(f"MockPayment: pagamento {payment_id} não encontrado.")
+            return {"status": "not_found"}
+
+        logger.info(f"MockPayment: pagamento {payment_id} marcado como {new_status}.")
+        return {"status": "success", "payment_id": payment_id, "new_status": new_status}
 
     def get_payment_link(self, payment_data: Dict[str, Any]) -> str:
         """
@@ -122,6 +159,7 @@ class PaymentClientMock(PaymentClientInterface):
             dict: Dados simulados do cliente criado
         """
         logger.info("MockPayment: criando novo cliente...")
+        self._load.apply("create_customer")
 
         required_fields = ["name", "email", "cpfCnpj"]
         for field in required_fields:
@@ -129,15 +167,12 @@ class PaymentClientMock(PaymentClientInterface):
                 logger.error(f"MockPayment: campo obrigatório '{field}' ausente.")
                 raise ValueError(f"O campo obrigatório '{field}' está ausente.")
 
-        customer_id = f"cus-mock-{len(self._payments) + 1}"  # Reutiliza contador de pagamentos
+        customer = {field: data[field] for field in required_fields}
+        customer_id = self._customers.insert(customer)["id"]
 
         logger.info(f"MockPayment: cliente criado com ID {customer_id}")
         return {
             "status": "success",
             "customer_id": customer_id,
-            "data": {
-                "name": data["name"],
-                "email": data["email"],
-                "cpfCnpj": data["cpfCnpj"]
-            }
+            "data": customer,
         }
\ No newline at end of file
@@ -0,0 +1,180 @@
+import logging
+import os
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.payment.constants.asaas_constants import WEBHOOK_PAYMENT_FIELDS
+from app.payment.utils.payment_listing import (
+    MAX_PAGE_SIZE,
+    DateLike,
+    build_payment_filters,
+    parse_payment_page,
+)
+from app.payment.utils.validators import validate_payment_payload
+from app.payment.utils.webhook import WebhookFieldExtractor
+from app.utils.idempotency_store import get_idempotency_store
+from app.utils.json_codec import decode_response, dumps_text
+from app.utils.logger import get_logger
+from app.utils.pagination import Page
+
+logger = get_logger(__name__)
+
+WEBHOOK_EXTRACTOR = WebhookFieldExtractor(WEBHOOK_PAYMENT_FIELDS)
+
+
+class AsaasClientBase:
+    """
+    Configuração, validação dos payloads, leitura das respostas e webhooks da Asaas.
+
+    Não faz I/O de rede, e por isso é compartilhado pelos clientes síncrono
+    (`PaymentClientAsaas`) e assíncrono (`AsyncPaymentClientAsaas`), que só
+    enviam as requisições. As respostas podem vir do `requests` ou do `httpx`.
+    """
+
+    def __init__(self):
+        self.base_url = os.getenv("ASAAS_BASE_URL")
+        self.api_key = os.getenv("ASAAS_API_KEY")
+
+        if not self.api_key:
+            raise EnvironmentError("Asaas: chave de API não configurada.")
+
+        self._idempotency = get_idempotency_store()
+
+    def _headers(self):
+        return {"Content-Type": "application/json", "access_token": self.api_key}
+
+    def _handle_response(
+        self, response: Any, action: str, expected: Tuple[int, ...] = (200,)
+    ) -> Dict[str, Any]:
+        """Decodifica a resposta; status fora de `expected` é registrado e levantado."""
+        if response.status_code not in expected:
+            logger.error(
+                f"Asaas: erro ao {action}: {response.status_code} - {response.text}"
+            )
+            response.raise_for_status()
+
+        return decode_response(response)
+
+    def _payment_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        logger.debug("Asaas: criando pagamento com os dados:")
+        logger.debug(data)
+
+        return validate_payment_payload(data, context="create")
+
+    def _cancel_data(self, payment_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        logger.debug(f"Asaas: cancelando pagamento {payment_id}...")
+
+        return validate_payment_payload({**data, "status": "CANCELLED"}, context="update")
+
+    def _customer_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        logger.info("Asaas: criando cliente...")
+
+        required_fields = ["name", "cpfCnpj"]
+        for field in required_fields:
+            if not data.get(field):
+                logger.error(f"Asaas: campo obrigatório '{field}' ausente.")
+                raise ValueError(f"O campo obrigatório '{field}' está ausente.")
+
+        return data
+
+    def _log_customer_request(self, url: str, data: Dict[str, Any]) -> None:
+        logger.debug("POST %s", url)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Payload: %s", dumps_text(data, indent=True))
+
+    # --- Listagem e conciliação ---------------------------------------------
+
+    def _list_query(
+        self,
+        status: Optional[str],
+        customer: Optional[str],
+        due_date_from: Optional[DateLike],
+        due_date_to: Optional[DateLike],
+        billing_type: Optional[str],
+        page_size: int,
+        prefetch: Optional[int],
+        filters: Dict[str, Any],
+    ) -> Tuple[Dict[str, Any], int, int]:
+        """Filtros da listagem, tamanho de página e páginas buscadas à frente."""
+        page_size = min(page_size, MAX_PAGE_SIZE)
+        prefetch = prefetch or int(os.getenv("ASAAS_LIST_PREFETCH", "4"))
+        query = build_payment_filters(
+            status, customer, due_date_from, due_date_to, billing_type, **filters
+        )
+        logger.info("Asaas: listando pagamentos com filtros %s.", query)
+        return query, page_size, prefetch
+
+    def _parse_list_response(self, response: Any, page_size: int) -> Page:
+        body = self._handle_response(response, "listar pagamentos")
+        return parse_payment_page(body, page_size)
+
+    def _reconcile_result(
+        self, wanted: Set[str], statuses: Dict[str, str]
+    ) -> Dict[str, Any]:
+        missing = sorted(wanted - statuses.keys())
+        logger.info(
+            "Asaas: conciliação de %d pagamentos — %d encontrados, %d ausentes.",
+            len(wanted),
+            len(statuses),
+            len(missing),
+        )
+        return {"statuses": statuses, "missing": missing}
+
+    # --- Webhooks e links ----------------------------------------------------
+
+    def handle_payment_webhook(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Processa o webhook de pagamento recebido da Asaas,
+        extraindo apenas os campos relevantes definidos em WEBHOOK_PAYMENT_FIELDS.
+
+        Args:
+            payload (dict): Payload completo enviado pela Asaas.
+
+        Returns:
+            dict: Dados filtrados com os campos mais relevantes para processamento interno.
+        """
+        logger.info("Asaas: processando payload do webhook de pagamento...")
+
+        flat_data = WEBHOOK_EXTRACTOR.extract(payload)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Asaas Webhook: %s", flat_data)
+
+        logger.info("Asaas: extração do webhook concluída com sucesso.")
+        return flat_data
+
+    def handle_payment_webhooks(
+        self, payloads: Iterable[Dict[str, Any]]
+    ) -> Dict[str, List[Any]]:
+        """
+        Processa um lote de webhooks de pagamento da Asaas em formato colunar.
+
+        Usa o mesmo extrator compilado de `handle_payment_webhook`, sem log por
+        evento, para absorver rajadas de milhares de eventos.
+
+        Args:
+            payloads (Iterable[dict]): Payloads completos enviados pela Asaas.
+
+        Returns:
+            Dict[str, List[Any]]: Para cada campo de WEBHOOK_PAYMENT_FIELDS, a lista
+            de valores na ordem dos payloads.
+        """
+        columns = WEBHOOK_EXTRACTOR.extract_many(payloads)
+        count = len(columns[WEBHOOK_EXTRACTOR.fields[0]]) if WEBHOOK_EXTRACTOR.fields else 0
+        logger.info("Asaas: %s webhooks de pagamento processados em lote.", count)
+        return columns
+
+    def get_payment_link(self, payment_data: Dict[str, Any]) -> str:
+        """
+        Retorna o link do boleto bancário, se disponível.
+
+        Args:
+            payment_data (dict): Resposta completa da API após criação ou consulta do pagamento.
+
+        Returns:
+            str: URL do boleto (`bankSlipUrl`), ou uma string vazia se não encontrado.
+        """
+        link = payment_data.get("bankSlipUrl")
+        if link:
+            logger.info(f"Asaas: link do boleto encontrado: {link}")
+        else:
+            logger.warning("Asaas: link do boleto não disponível no response.")
+        return link or ""
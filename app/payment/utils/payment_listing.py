@@ -0,0 +1,51 @@
+import math
+from datetime import date
+from typing import Any, Dict, Optional, Union
+
+from app.utils.pagination import Page
+
+# Limite de registros por página aceito por `GET /payments`.
+MAX_PAGE_SIZE = 100
+
+DateLike = Union[str, date]
+
+
+def _format_date(value: DateLike) -> str:
+    return value.isoformat() if isinstance(value, date) else value
+
+
+def build_payment_filters(
+    status: Optional[str] = None,
+    customer: Optional[str] = None,
+    due_date_from: Optional[DateLike] = None,
+    due_date_to: Optional[DateLike] = None,
+    billing_type: Optional[str] = None,
+    **extra: Any,
+) -> Dict[str, Any]:
+    """
+    Monta os parâmetros de filtro de `GET /payments`.
+
+    Datas aceitam `date` ou texto no formato `AAAA-MM-DD`; o intervalo de
+    vencimento é inclusivo. Filtros adicionais da API (ex: `externalReference`,
+    `paymentDate[ge]`) podem ser passados em `extra` com o nome original.
+    """
+    filters: Dict[str, Any] = {
+        "status": status,
+        "customer": customer,
+        "billingType": billing_type,
+        "dueDate[ge]": _format_date(due_date_from) if due_date_from else None,
+        "dueDate[le]": _format_date(due_date_to) if due_date_to else None,
+        **extra,
+    }
+    return {key: value for key, value in filters.items() if value is not None}
+
+
+def page_params(filters: Dict[str, Any], index: int, page_size: int) -> Dict[str, Any]:
+    return {**filters, "offset": index * page_size, "limit": page_size}
+
+
+def parse_payment_page(body: Dict[str, Any], page_size: int) -> Page:
+    """Converte a resposta da listagem em `(itens, total de páginas)`."""
+    total_count = body.get("totalCount")
+    total_pages = math.ceil(total_count / page_size) if total_count is not None else None
+    return body.get("data", []), total_pages
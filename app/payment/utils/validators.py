@@ -1,39 +1,68 @@
-from typing import Dict
+from typing import Any, Dict
 from app.payment.constants.asaas_constants import BillingType
 from app.utils.logger import get_logger
+from app.utils.schema import Field, Schema, is_absent, is_falsy
 
 logger = get_logger(__name__)
 
 
-def validate_payment_payload(data: Dict[str, any], context: str = "create") -> None:
+def _billing_type_message(name: str, value: Any) -> str:
+    return f"Tipo de pagamento inválido: {value}. Use um dos: {BillingType.ALL}"
+
+
+# Como na validação original, qualquer valor falso (inclusive `value` 0) é ausente.
+_PAYMENT_BASE_SCHEMA = Schema(
+    [
+        Field("value", required=True, missing=is_falsy),
+        Field("dueDate", required=True, missing=is_falsy),
+    ]
+)
+
+# Schemas de cobrança por contexto (use com `validate_many` para lotes).
+PAYMENT_SCHEMAS = {
+    "create": _PAYMENT_BASE_SCHEMA.extend(
+        Field("customer", required=True, missing=is_falsy),
+        # O padrão só vale quando o campo não veio; None ou "" são inválidos.
+        Field(
+            "billingType",
+            choices=BillingType.ALL,
+            default=BillingType.BOLETO,
+            message=_billing_type_message,
+            missing=is_absent,
+        ),
+    ),
+    "update": _PAYMENT_BASE_SCHEMA.extend(
+        Field(
+            "billingType",
+            required=True,
+            choices=BillingType.ALL,
+            message=_billing_type_message,
+            missing=is_falsy,
+        ),
+    ),
+}
+
+
+def validate_payment_payload(data: Dict[str, Any], context: str = "create") -> Dict[str, Any]:
     """
     Valida os campos obrigatórios para criação ou atualização de cobranças.
 
     Args:
-        data (Dict): Dados da cobrança.
+        data (Dict): Dados da cobrança (não são alterados).
         context (str): "create" ou "update".
 
+    Returns:
+        Dict[str, Any]: Cópia normalizada dos dados; na criação, `billingType`
+        ausente vira "BOLETO".
+
     Raises:
-        ValueError: se qualquer campo obrigatório estiver ausente ou inválido.
+        ValueError: com todos os campos ausentes ou inválidos.
     """
-    required_fields_base = ["value", "dueDate"]
-
-    if context == "create":
-        required_fields = required_fields_base + ["customer"]
-        if "billingType" not in data:
-            data["billingType"] = "BOLETO"
-            logger.info("Asaas: 'billingType' não fornecido. Usando valor padrão: 'BOLETO'.")
-    elif context == "update":
-        required_fields = required_fields_base + ["billingType"]
-    else:
+    schema = PAYMENT_SCHEMAS.get(context)
+    if schema is None:
         raise ValueError(f"Contexto desconhecido para validação: {context}")
 
-    for field in required_fields:
-        if not data.get(field):
-            raise ValueError(f"O campo obrigatório '{field}' está ausente.")
-
-    billing_type = data.get("billingType")
-    if billing_type not in BillingType.ALL:
-        raise ValueError(
-            f"Tipo de pagamento inválido: {billing_type}. Use um dos: {BillingType.ALL}"
-        )
+    normalized = schema.check(data)
+    if context == "create" and "billingType" not in data:
+        logger.info("Asaas: 'billingType' não fornecido. Usando valor padrão: 'BOLETO'.")
+    return normalized
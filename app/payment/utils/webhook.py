@@ -0,0 +1,105 @@
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+Row = Dict[str, Any]
+_Extractor = Callable[[Any, Row], None]
+
+
+def _build_trie(fields: Iterable[str]) -> Dict[str, Any]:
+    """Agrupa caminhos como 'payment.id' em uma árvore: {'payment': {'id': 'payment.id'}}."""
+    trie: Dict[str, Any] = {}
+    for field in fields:
+        node = trie
+        parts = field.split(".")
+        for part in parts[:-1]:
+            child = node.setdefault(part, {})
+            if not isinstance(child, dict):
+                # Campo folha e prefixo ao mesmo tempo (ex: 'payment' e 'payment.id').
+                child = node[part] = {"": child}
+            node = child
+        leaf = parts[-1]
+        if isinstance(node.get(leaf), dict):
+            node[leaf][""] = field
+        else:
+            node[leaf] = field
+    return trie
+
+
+def _fields_under(node: Dict[str, Any]) -> Tuple[str, ...]:
+    fields: List[str] = []
+    for value in node.values():
+        if isinstance(value, dict):
+            fields.extend(_fields_under(value))
+        else:
+            fields.append(value)
+    return tuple(fields)
+
+
+def _compile_node(node: Dict[str, Any]) -> _Extractor:
+    leaves = tuple(
+        (key, field)
+        for key, field in node.items()
+        if key and not isinstance(field, dict)
+    )
+    children = tuple(
+        (key, _compile_node(child), child.get(""))
+        for key, child in node.items()
+        if isinstance(child, dict)
+    )
+    missing = _fields_under(node)
+
+    def extract(value: Any, row: Row) -> None:
+        if not isinstance(value, dict):
+            for field in missing:
+                row[field] = None
+            return
+
+        get = value.get
+        for key, field in leaves:
+            row[field] = get(key)
+        for key, child, own_field in children:
+            child_value = get(key)
+            child(child_value, row)
+            if own_field is not None:
+                row[own_field] = child_value
+
+    return extract
+
+
+class WebhookFieldExtractor:
+    """
+    Extrator de campos aninhados ('a.b.c') compilado uma única vez.
+
+    Os caminhos são agrupados por prefixo, de modo que cada sub-dicionário do
+    payload (ex: `payment`) é acessado uma vez por evento, independentemente de
+    quantos campos são lidos dele. Campos ausentes (ou cujo pai não é um
+    dicionário) resultam em `None`.
+    """
+
+    def __init__(self, fields: Iterable[str]):
+        self.fields: Tuple[str, ...] = tuple(sorted(set(fields)))
+        self._root = _compile_node(_build_trie(self.fields))
+
+    def extract(self, payload: Dict[str, Any]) -> Row:
+        """Extrai os campos de um único payload."""
+        row: Row = {}
+        self._root(payload, row)
+        return row
+
+    def extract_many(self, payloads: Iterable[Dict[str, Any]]) -> Dict[str, List[Any]]:
+        """
+        Extrai os campos de vários payloads em formato colunar.
+
+        Returns:
+            Dict[str, List[Any]]: Para cada campo, a lista de valores na ordem dos payloads.
+        """
+        columns: Dict[str, List[Any]] = {field: [] for field in self.fields}
+        appenders = tuple((field, columns[field].append) for field in self.fields)
+        root = self._root
+
+        row: Row = {}
+        for payload in payloads:
+            root(payload, row)
+            for field, append in appenders:
+                append(row[field])
+
+        return columns
@@ -0,0 +1,197 @@
+import json
+import logging
+import os
+from typing import Any, Callable, Dict
+
+from app.tests.benchmarks.noop_transport import NoopProviderTransport
+from app.utils.idempotency_store import IdempotencyStore
+
+BENCHMARK_ENV = {
+    "OMIE_APP_KEY": "benchmark",
+    "OMIE_APP_SECRET": "benchmark",
+    "OMIE_BASE_URL": "http://omie.local/api/v1/",
+    "ASAAS_API_KEY": "benchmark",
+    "ASAAS_BASE_URL": "http://asaas.local/v3",
+    "NFE_IO_API_KEY": "benchmark",
+    "NFE_IO_COMPANY_ID": "benchmark",
+    "NFE_IO_BASE_URL": "http://nfe.local/v1",
+    "SUPERLOGICA_BASE_URL": "http://superlogica.local",
+    "SUPERLOGICA_APP_TOKEN": "benchmark",
+    "SUPERLOGICA_ACCESS_TOKEN": "benchmark",
+}
+
+RECEIVABLE = {
+    "codigo_lancamento_integracao": "bench-0001",
+    "codigo_cliente_fornecedor": 6823222813,
+    "data_vencimento": "04/04/2025",
+    "valor_documento": 1234.00,
+    "codigo_categoria": "1.01.02",
+    "data_previsao": "04/04/2025",
+    "id_conta_corrente": 6823222790,
+    "observacao": "Benchmark",
+}
+
+PAYMENT = {
+    "customer": "cus_000000000001",
+    "billingType": "PIX",
+    "value": 150.0,
+    "dueDate": "2025-05-10",
+    "description": "Benchmark",
+}
+
+WEBHOOK = {
+    "event": "PAYMENT_RECEIVED",
+    "payment": {
+        "object": "payment",
+        "id": "pay_000000000001",
+        "customer": "cus_000000000001",
+        "value": 150.0,
+        "netValue": 148.01,
+        "billingType": "PIX",
+        "status": "RECEIVED",
+        "paymentDate": "2025-05-10",
+        "invoiceUrl": "https://sandbox.asaas.com/i/000000000001",
+        "bankSlipUrl": None,
+        "transactionReceiptUrl": "https://sandbox.asaas.com/comprovantes/1",
+        "description": "Benchmark",
+        "externalReference": "bench-0001",
+    },
+}
+
+PAYABLE = {
+    "DT_ENTRADA_MD": "05/10/2025",
+    "ST_CONTA_CONT": "2.1.1",
+    "VL_VALOR_MD": "100.00",
+    "ID_CONTABANCO_CB": "1",
+    "ID_CONDOMINIO_COND": "1",
+    "ST_HISTORICO_MD": "Benchmark",
+}
+
+Case = Callable[[], Any]
+
+
+def _disabled_idempotency(client: Any) -> Any:
+    client._idempotency = IdempotencyStore(enabled=False)
+    return client
+
+
+def _omie_cases() -> Dict[str, Case]:
+    from app.erp.erp_client_omie import ERPClientOmie
+
+    client = _disabled_idempotency(ERPClientOmie())
+    batch = [
+        {**RECEIVABLE, "codigo_lancamento_integracao": f"bench-{i:04d}"} for i in range(50)
+    ]
+    client._http = NoopProviderTransport(
+        [
+            (
+                "POST",
+                "contareceber",
+                200,
+                {
+                    "codigo_lancamento_omie": 1,
+                    "codigo_lancamento_integracao": "bench-0001",
+                    "codigo_status": "0",
+                    "descricao_status": "Lançamento cadastrado com sucesso!",
+                    "status_lote": [
+                        {
+                            "codigo_lancamento_integracao": item["codigo_lancamento_integracao"],
+                            "codigo_status": "0",
+                        }
+                        for item in batch
+                    ],
+                },
+            )
+        ]
+    )
+
+    return {
+        "omie.create_accounts_receivable": lambda: client.create_accounts_receivable(
+            dict(RECEIVABLE)
+        ),
+        "omie.create_accounts_receivable_batch[50]": lambda: client.create_accounts_receivable_batch(
+            batch
+        ),
+    }
+
+
+def _nfe_io_cases() -> Dict[str, Case]:
+    from app.invoice.invoice_client_nfe_io import InvoiceClientNFEio
+
+    client = _disabled_idempotency(InvoiceClientNFEio())
+    client._http = NoopProviderTransport(
+        [("POST", "serviceinvoices", 202, {"id": "nfe-1", "status": "Created"})]
+    )
+
+    def create_data() -> Dict[str, Any]:
+        return client.create_data(
+            origem="mock",
+            identificador="59696922000128",
+            city_service_code="101",
+            description="Benchmark",
+            services_amount=100.0,
+            externalId="bench-0001",
+            issuedOn="2025-05-10T00:00:00Z",
+        )
+
+    invoice = create_data()
+    return {
+        "nfe_io.create_data": create_data,
+        "nfe_io.issue_invoice": lambda: client.issue_invoice(invoice),
+    }
+
+
+def _asaas_cases() -> Dict[str, Case]:
+    from app.payment.payment_client_asaas import PaymentClientAsaas
+    from app.payment.utils.validators import validate_payment_payload
+
+    client = _disabled_idempotency(PaymentClientAsaas())
+    client._http = NoopProviderTransport(
+        [("POST", "/payments", 200, {"id": "pay_000000000001", **PAYMENT, "status": "PENDING"})]
+    )
+    webhooks = [WEBHOOK] * 100
+
+    return {
+        "asaas.validate_payment_payload": lambda: validate_payment_payload(
+            dict(PAYMENT), context="create"
+        ),
+        "asaas.create_payment": lambda: client.create_payment(dict(PAYMENT)),
+        "asaas.handle_payment_webhook": lambda: client.handle_payment_webhook(WEBHOOK),
+        "asaas.handle_payment_webhooks[100]": lambda: client.handle_payment_webhooks(webhooks),
+    }
+
+
+def _superlogica_cases() -> Dict[str, Case]:
+    from app.payables.payables_client_superlogica import SuperlogicaPayablesClient
+
+    client = SuperlogicaPayablesClient()
+    client._http = NoopProviderTransport(
+        [("POST", "MovimentacoesDiretas", 200, [{"status": "200", "data": {"id_movimentacao": 1}}])]
+    )
+    return {"superlogica.create_payable": lambda: client.create_payable(dict(PAYABLE))}
+
+
+def _infra_cases() -> Dict[str, Case]:
+    from app.utils.logger import get_logger
+
+    logger = get_logger("benchmark")
+    encoded = json.dumps(WEBHOOK).encode()
+
+    return {
+        "logging.debug_disabled": lambda: logger.debug("Payload: %s", WEBHOOK),
+        "logging.debug_guarded_dumps": lambda: logger.isEnabledFor(logging.DEBUG)
+        and logger.debug("Payload: %s", json.dumps(WEBHOOK, indent=2)),
+        "json.encode_webhook": lambda: json.dumps(WEBHOOK),
+        "json.decode_webhook": lambda: json.loads(encoded),
+    }
+
+
+def build_cases() -> Dict[str, Case]:
+    """Monta os casos de benchmark; cada caso é uma chamada sem argumentos."""
+    for name, value in BENCHMARK_ENV.items():
+        os.environ.setdefault(name, value)
+
+    cases: Dict[str, Case] = {}
+    for group in (_omie_cases, _nfe_io_cases, _asaas_cases, _superlogica_cases, _infra_cases):
+        cases.update(group())
+    return cases
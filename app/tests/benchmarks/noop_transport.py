@@ -0,0 +1,79 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.utils.json_codec import dumps, loads
+
+
+class NoopResponse:
+    """Resposta pré-montada com a mesma interface usada pelos clientes (`requests.Response`)."""
+
+    def __init__(self, status_code: int, content: bytes):
+        self.status_code = status_code
+        self.content = content
+        self.headers: Dict[str, str] = {"Content-Type": "application/json"}
+
+    @property
+    def text(self) -> str:
+        return self.content.decode()
+
+    def json(self) -> Any:
+        return loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise RuntimeError(f"NoopResponse: HTTP {self.status_code}")
+
+
+class NoopProviderTransport:
+    """
+    Substituto de `ProviderTransport` que não faz I/O.
+
+    Serializa o corpo como o `ProviderTransport` faria (`json=`) e devolve
+    respostas pré-codificadas, de modo que o benchmark mede apenas o custo do cliente:
+    montagem de payload, validação, logs e codificação/decodificação JSON.
+
+    Args:
+        routes: Lista de (método, trecho da URL, status, corpo da resposta); a
+            primeira rota cujo método coincide e cujo trecho aparece na URL é usada.
+    """
+
+    def __init__(self, routes: List[Tuple[str, str, int, Any]]):
+        self._routes = [
+            (method, fragment, status, self._encode(body))
+            for method, fragment, status, body in routes
+        ]
+        self.calls = 0
+
+    @staticmethod
+    def _encode(body: Any) -> bytes:
+        return body if isinstance(body, bytes) else dumps(body)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        json: Optional[Any] = None,
+        data: Optional[Any] = None,
+        idempotent: Optional[bool] = None,
+        idempotency_key: Optional[str] = None,
+        **kwargs: Any,
+    ) -> NoopResponse:
+        self.calls += 1
+        if json is not None:
+            self._encode(json)
+
+        for route_method, fragment, status, content in self._routes:
+            if route_method == method and fragment in url:
+                return NoopResponse(status, content)
+        return NoopResponse(404, b"{}")
+
+    def get(self, url: str, **kwargs: Any) -> NoopResponse:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> NoopResponse:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> NoopResponse:
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> NoopResponse:
+        return self.request("DELETE", url, **kwargs)
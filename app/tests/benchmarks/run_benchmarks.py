@@ -0,0 +1,190 @@
+"""
+Microbenchmarks dos caminhos críticos dos clientes, sem I/O de rede.
+
+Cada caso chama um método real (montagem de payload, validação, logs e
+codificação/decodificação JSON) contra um transporte no-op e mede o custo por
+chamada. Os resultados são gravados em JSON e podem ser comparados com uma
+execução de referência (baseline):
+
+    python -m app.tests.benchmarks.run_benchmarks run --output baseline.json
+    python -m app.tests.benchmarks.run_benchmarks run --output atual.json --baseline baseline.json
+    python -m app.tests.benchmarks.run_benchmarks compare baseline.json atual.json --threshold 0.10
+
+`compare` (e `run --baseline`) termina com código 1 quando algum caso ficou
+mais lento que o limite.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+
+def measure(func: Callable[[], Any], min_time: float = 0.2, repeats: int = 5) -> Dict[str, Any]:
+    """
+    Mede `func` em `repeats` rodadas de pelo menos `min_time` segundos cada.
+
+    Returns:
+        Dict[str, Any]: Tempo por chamada em nanossegundos (mediana, mínimo e
+        desvio-padrão entre as rodadas) e o número de chamadas por rodada.
+    """
+    func()  # aquecimento (caches, imports tardios)
+
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time / 10:
+            break
+        number *= 10
+    number = max(int(number * min_time / elapsed), 1)
+
+    samples: List[float] = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number * 1e9)
+
+    return {
+        "ns_per_op": round(statistics.median(samples), 1),
+        "min_ns": round(min(samples), 1),
+        "stdev_ns": round(statistics.stdev(samples), 1) if len(samples) > 1 else 0.0,
+        "ops_per_round": number,
+        "repeats": repeats,
+    }
+
+
+def run(
+    selected: Optional[List[str]] = None, min_time: float = 0.2, repeats: int = 5
+) -> Dict[str, Any]:
+    from app.tests.benchmarks.cases import build_cases
+
+    cases = build_cases()
+    if selected:
+        cases = {name: case for name, case in cases.items() if any(s in name for s in selected)}
+
+    results = {}
+    for name, case in cases.items():
+        results[name] = measure(case, min_time=min_time, repeats=repeats)
+        print(f"{name:<45} {results[name]['ns_per_op'] / 1000:>12.2f} µs/op", flush=True)
+
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "log_level": os.getenv("LOG_LEVEL"),
+        },
+        "results": results,
+    }
+
+
+def compare(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 0.10
+) -> List[Dict[str, Any]]:
+    """
+    Compara duas execuções caso a caso.
+
+    Um caso é marcado como regressão quando `atual / baseline - 1 > threshold`.
+    """
+    rows = []
+    for name, result in current["results"].items():
+        reference = baseline["results"].get(name)
+        if reference is None:
+            rows.append({"name": name, "status": "new", "current": result["ns_per_op"]})
+            continue
+
+        change = result["ns_per_op"] / reference["ns_per_op"] - 1
+        if change > threshold:
+            status = "regression"
+        elif change < -threshold:
+            status = "improvement"
+        else:
+            status = "ok"
+        rows.append(
+            {
+                "name": name,
+                "status": status,
+                "baseline": reference["ns_per_op"],
+                "current": result["ns_per_op"],
+                "change": round(change, 4),
+            }
+        )
+    return rows
+
+
+def print_comparison(rows: List[Dict[str, Any]], threshold: float) -> bool:
+    """Imprime a comparação e retorna True se houver alguma regressão."""
+    print(f"\n{'caso':<45} {'baseline µs':>12} {'atual µs':>12} {'variação':>9}")
+    for row in rows:
+        if row["status"] == "new":
+            print(f"{row['name']:<45} {'-':>12} {row['current'] / 1000:>12.2f} {'novo':>9}")
+            continue
+        flag = {"regression": "  <-- REGRESSÃO", "improvement": "  (melhora)"}.get(row["status"], "")
+        print(
+            f"{row['name']:<45} {row['baseline'] / 1000:>12.2f} {row['current'] / 1000:>12.2f} "
+            f"{row['change']:>+9.1%}{flag}"
+        )
+
+    regressions = [row for row in rows if row["status"] == "regression"]
+    if regressions:
+        print(f"\n{len(regressions)} caso(s) acima do limite de {threshold:.0%}.")
+    else:
+        print(f"\nNenhuma regressão acima de {threshold:.0%}.")
+    return bool(regressions)
+
+
+def _load(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Microbenchmarks dos clientes.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Executa os benchmarks.")
+    run_parser.add_argument("--output", default="benchmark_results.json")
+    run_parser.add_argument("--baseline", help="Compara com um resultado anterior.")
+    run_parser.add_argument("--threshold", type=float, default=0.10)
+    run_parser.add_argument("--min-time", type=float, default=0.2, help="Duração mínima de cada rodada (s).")
+    run_parser.add_argument("--repeats", type=int, default=5)
+    run_parser.add_argument("--only", nargs="*", help="Executa apenas os casos que contêm estes trechos.")
+    run_parser.add_argument("--log-level", default="WARNING", help="LOG_LEVEL durante a medição.")
+
+    compare_parser = commands.add_parser("compare", help="Compara dois resultados.")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.10)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        rows = compare(_load(args.baseline), _load(args.current), args.threshold)
+        return 1 if print_comparison(rows, args.threshold) else 0
+
+    # Precisa ser definido antes de os módulos da aplicação criarem seus loggers.
+    os.environ["LOG_LEVEL"] = args.log_level
+    results = run(args.only, min_time=args.min_time, repeats=args.repeats)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+    print(f"\nResultados gravados em {args.output}.")
+
+    if args.baseline:
+        rows = compare(_load(args.baseline), results, args.threshold)
+        return 1 if print_comparison(rows, args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
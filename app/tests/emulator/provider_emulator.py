@@ -0,0 +1,787 @@
+"""
+Emulador local dos provedores (Omie, Asaas, NFE.io e Superlógica).
+
+Sobe um servidor HTTP que responde às rotas usadas pelos clientes reais, para
+rodar testes manuais e benchmarks ponta a ponta sem credenciais nem acesso à
+rede. Latência, taxa de erros 5xx e respostas 429 são configuráveis.
+
+Cada provedor fica sob um prefixo próprio; `ProviderEmulator.env()` retorna as
+variáveis de ambiente que apontam os clientes para o emulador:
+
+    with ProviderEmulator(EmulatorConfig(latency=0.05, error_rate=0.01)) as emulator:
+        os.environ.update(emulator.env())
+        client = ERPClientOmie()
+
+Também pode ser executado como script:
+
+    python -m app.tests.emulator.provider_emulator --port 8089 --latency 0.05
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+
+class EmulatorConfig:
+    """
+    Comportamento do emulador.
+
+    Args:
+        latency (float): Atraso base de cada resposta, em segundos.
+        latency_jitter (float): Variação aleatória (uniforme) somada à latência.
+        error_rate (float): Probabilidade (0 a 1) de responder 503.
+        throttle_rate (float): Probabilidade (0 a 1) de responder 429.
+        rate_limit (float): Requisições por segundo aceitas por provedor antes de
+            responder 429 (0 desliga o limite).
+        retry_after (float): Valor do cabeçalho `Retry-After` nas respostas 429.
+        invoice_issue_delay (float): Segundos até uma NFSE emitida passar a "Issued".
+        pdf_size (int): Tamanho, em bytes, do PDF servido para cada NFSE.
+        seed (int): Semente do gerador aleatório (resultados reprodutíveis).
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        rate_limit: float = 0.0,
+        retry_after: float = 1.0,
+        invoice_issue_delay: float = 0.0,
+        pdf_size: int = 64 * 1024,
+        seed: Optional[int] = None,
+    ):
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.rate_limit = rate_limit
+        self.retry_after = retry_after
+        self.invoice_issue_delay = invoice_issue_delay
+        self.pdf_size = pdf_size
+        self.seed = seed
+
+
+class _ProviderState:
+    """Dados em memória compartilhados pelas threads do servidor."""
+
+    def __init__(self, config: EmulatorConfig):
+        self.config = config
+        self.lock = threading.Lock()
+        self.random = random.Random(config.seed)
+        self.ids = itertools.count(1)
+
+        self.receivables: Dict[str, Dict[str, Any]] = {}
+        self.payments: Dict[str, Dict[str, Any]] = {}
+        self.customers: Dict[str, Dict[str, Any]] = {}
+        self.invoices: Dict[str, Dict[str, Any]] = {}
+        self.payables: Dict[str, Dict[str, Any]] = {}
+        self.documents: Dict[str, Dict[str, Any]] = {}
+
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self.requests: Dict[str, Dict[int, int]] = {}
+
+    def next_id(self) -> int:
+        with self.lock:
+            return next(self.ids)
+
+    def chance(self, probability: float) -> bool:
+        if probability <= 0:
+            return False
+        with self.lock:
+            return self.random.random() < probability
+
+    def delay(self) -> float:
+        jitter = self.config.latency_jitter
+        if jitter <= 0:
+            return self.config.latency
+        with self.lock:
+            return self.config.latency + self.random.uniform(0, jitter)
+
+    def allow(self, provider: str) -> bool:
+        """Token bucket por provedor (capacidade igual a `rate_limit`)."""
+        rate = self.config.rate_limit
+        if rate <= 0:
+            return True
+        with self.lock:
+            now = time.monotonic()
+            tokens, updated = self._buckets.get(provider, (rate, now))
+            tokens = min(rate, tokens + (now - updated) * rate)
+            allowed = tokens >= 1
+            self._buckets[provider] = (tokens - 1 if allowed else tokens, now)
+            return allowed
+
+    def record(self, provider: str, status: int) -> None:
+        with self.lock:
+            by_status = self.requests.setdefault(provider, {})
+            by_status[status] = by_status.get(status, 0) + 1
+
+
+Response = Tuple[int, Any, Dict[str, str]]
+
+
+def _json(status: int, body: Any, headers: Optional[Dict[str, str]] = None) -> Response:
+    return status, body, headers or {}
+
+
+def _not_found(path: str) -> Response:
+    return _json(404, {"errors": [{"code": "not_found", "description": f"Rota {path} não emulada."}]})
+
+
+class _OmieRoutes:
+    """`financas/contareceber/`: chamadas JSON no formato {"call", "param": [...]}."""
+
+    def __init__(self, state: _ProviderState):
+        self.state = state
+
+    def handle(self, method: str, path: str, body: Any) -> Response:
+        if method != "POST" or not path.rstrip("/").endswith("financas/contareceber"):
+            return _not_found(path)
+
+        call = body.get("call")
+        param = (body.get("param") or [{}])[0]
+        handler = {
+            "IncluirContaReceber": self._create,
+            "IncluirContaReceberPorLote": self._create_batch,
+            "AlterarContaReceber": self._update,
+            "LancarRecebimento": self._settle,
+            "ExcluirContaReceber": self._delete,
+            "ConsultarContaReceber": self._get,
+            "ListarContasReceber": self._list,
+        }.get(call)
+        if handler is None:
+            return self._fault(f"Método {call} não emulado.")
+        return handler(param)
+
+    @staticmethod
+    def _fault(message: str) -> Response:
+        # A Omie responde erros de negócio com HTTP 500 e `faultstring`.
+        return _json(500, {"faultstring": f"ERROR: {message}", "faultcode": "SOAP-ENV:Client-1"})
+
+    def _insert(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        key = str(data.get("codigo_lancamento_integracao") or "")
+        with self.state.lock:
+            if key and key in self.state.receivables:
+                return {
+                    "codigo_lancamento_integracao": key,
+                    "codigo_status": "1",
+                    "descricao_status": "Lançamento já cadastrado para o código de integração informado.",
+                }
+            codigo = next(self.state.ids)
+            self.state.receivables[key or str(codigo)] = {
+                **data,
+                "codigo_lancamento_omie": codigo,
+                "status_titulo": "A VENCER",
+            }
+        return {
+            "codigo_lancamento_omie": codigo,
+            "codigo_lancamento_integracao": key,
+            "codigo_status": "0",
+            "descricao_status": "Lançamento cadastrado com sucesso!",
+        }
+
+    def _find(self, codigo: Any) -> Optional[Tuple[str, Dict[str, Any]]]:
+        for key, receivable in self.state.receivables.items():
+            if str(receivable["codigo_lancamento_omie"]) == str(codigo):
+                return key, receivable
+        return None
+
+    def _create(self, param: Dict[str, Any]) -> Response:
+        result = self._insert(param)
+        if result["codigo_status"] != "0":
+            return self._fault(result["descricao_status"])
+        return _json(200, result)
+
+    def _create_batch(self, param: Dict[str, Any]) -> Response:
+        items = param.get("conta_receber_cadastro") or []
+        if len(items) > 50:
+            return self._fault("O lote deve conter no máximo 50 registros.")
+
+        details = [self._insert(item) for item in items]
+        return _json(
+            200,
+            {
+                "lote": param.get("lote"),
+                "codigo_status": "0",
+                "descricao_status": f"Lote processado ({len(items)} registros).",
+                "status_lote": details,
+            },
+        )
+
+    def _update(self, param: Dict[str, Any]) -> Response:
+        with self.state.lock:
+            found = self._find(param.get("codigo_lancamento_omie"))
+            if found is None:
+                return self._fault("Lançamento não cadastrado.")
+            found[1].update(param)
+        return _json(
+            200,
+            {
+                "codigo_lancamento_omie": param.get("codigo_lancamento_omie"),
+                "codigo_status": "0",
+                "descricao_status": "Lançamento alterado com sucesso!",
+            },
+        )
+
+    def _settle(self, param: Dict[str, Any]) -> Response:
+        with self.state.lock:
+            found = self._find(param.get("codigo_lancamento"))
+            if found is None:
+                return self._fault("Lançamento não cadastrado.")
+            found[1]["status_titulo"] = "RECEBIDO"
+            codigo_baixa = next(self.state.ids)
+        return _json(
+            200,
+            {
+                "codigo_lancamento": param.get("codigo_lancamento"),
+                "codigo_baixa": codigo_baixa,
+                "liquidado": "S",
+                "valor_baixado": param.get("valor"),
+                "codigo_status": "0",
+                "descricao_status": "Recebimento lançado com sucesso!",
+            },
+        )
+
+    def _delete(self, param: Dict[str, Any]) -> Response:
+        with self.state.lock:
+            found = self._find(param.get("codigo_lancamento_omie"))
+            if found is None:
+                return self._fault("Lançamento não cadastrado.")
+            del self.state.receivables[found[0]]
+        return _json(
+            200,
+            {
+                "codigo_lancamento_omie": param.get("codigo_lancamento_omie"),
+                "codigo_status": "0",
+                "descricao_status": "Lançamento excluído com sucesso!",
+            },
+        )
+
+    def _get(self, param: Dict[str, Any]) -> Response:
+        with self.state.lock:
+            key = param.get("codigo_lancamento_integracao")
+            receivable = self.state.receivables.get(str(key)) if key else None
+            if receivable is None:
+                found = self._find(param.get("codigo_lancamento_omie"))
+                receivable = found[1] if found else None
+        if receivable is None:
+            return self._fault("Lançamento não cadastrado.")
+        return _json(200, receivable)
+
+    @staticmethod
+    def _matches(receivable: Dict[str, Any], param: Dict[str, Any]) -> bool:
+        """Filtros de status, cliente e vencimento de `ListarContasReceber`."""
+
+        def as_date(value: Any) -> Optional[datetime]:
+            try:
+                return datetime.strptime(str(value), "%d/%m/%Y")
+            except ValueError:
+                return None
+
+        status = param.get("filtrar_por_status")
+        if status and receivable.get("status_titulo") != status:
+            return False
+        customer = param.get("filtrar_cliente")
+        if customer and str(receivable.get("codigo_cliente_fornecedor")) != str(customer):
+            return False
+
+        due_date = as_date(receivable.get("data_vencimento"))
+        start = as_date(param.get("filtrar_por_data_de"))
+        end = as_date(param.get("filtrar_por_data_ate"))
+        if (start or end) and due_date is None:
+            return False
+        if start and due_date < start:
+            return False
+        if end and due_date > end:
+            return False
+        return True
+
+    def _list(self, param: Dict[str, Any]) -> Response:
+        page = max(int(param.get("pagina", 1)), 1)
+        per_page = max(int(param.get("registros_por_pagina", 20)), 1)
+        with self.state.lock:
+            receivables = [
+                receivable
+                for receivable in self.state.receivables.values()
+                if self._matches(receivable, param)
+            ]
+
+        total_pages = max((len(receivables) + per_page - 1) // per_page, 1)
+        records = receivables[(page - 1) * per_page : page * per_page]
+        return _json(
+            200,
+            {
+                "pagina": page,
+                "total_de_paginas": total_pages,
+                "registros": len(records),
+                "total_de_registros": len(receivables),
+                "conta_receber_cadastro": records,
+            },
+        )
+
+
+class _AsaasRoutes:
+    """`/payments` e `/customers` da API v3."""
+
+    def __init__(self, state: _ProviderState):
+        self.state = state
+
+    def handle(self, method: str, path: str, body: Any, query: Dict[str, str]) -> Response:
+        parts = [part for part in path.split("/") if part]
+        if parts and parts[0] == "v3":
+            parts = parts[1:]
+        if not parts:
+            return _not_found(path)
+
+        resource, rest = parts[0], parts[1:]
+        if resource == "customers" and method == "POST" and not rest:
+            return self._create("customers", "cus", body)
+        if resource != "payments":
+            return _not_found(path)
+
+        if method == "POST" and not rest:
+            return self._create("payments", "pay", body)
+        if method == "GET" and not rest:
+            return self._list(query)
+        if method == "GET" and len(rest) == 2 and rest[1] == "status":
+            return self._status(rest[0])
+        if method in ("PUT", "POST") and len(rest) == 1:
+            return self._update(rest[0], body)
+        if method == "GET" and len(rest) == 1:
+            return self._get(rest[0])
+        return _not_found(path)
+
+    def _create(self, collection: str, prefix: str, data: Dict[str, Any]) -> Response:
+        record_id = f"{prefix}_{self.state.next_id():012d}"
+        record = {"object": collection[:-1], "id": record_id, **data}
+        if collection == "payments":
+            record.setdefault("status", "PENDING")
+            record["invoiceUrl"] = f"https://sandbox.asaas.com/i/{record_id}"
+        with self.state.lock:
+            getattr(self.state, collection)[record_id] = record
+        return _json(200, record)
+
+    def _get(self, payment_id: str) -> Response:
+        with self.state.lock:
+            payment = self.state.payments.get(payment_id)
+        if payment is None:
+            return _json(404, {"errors": [{"code": "invalid_action", "description": "Cobrança não encontrada."}]})
+        return _json(200, payment)
+
+    def _status(self, payment_id: str) -> Response:
+        status, payment, headers = self._get(payment_id)
+        if status != 200:
+            return status, payment, headers
+        return _json(200, {"status": payment["status"]})
+
+    def _update(self, payment_id: str, data: Dict[str, Any]) -> Response:
+        with self.state.lock:
+            payment = self.state.payments.get(payment_id)
+            if payment is not None:
+                payment.update(data)
+        if payment is None:
+            return self._get(payment_id)
+        return _json(200, payment)
+
+    @staticmethod
+    def _matches(payment: Dict[str, Any], key: str, value: str) -> bool:
+        """Filtro exato ou de intervalo (`campo[ge]`/`campo[le]`, ex: `dueDate[ge]`)."""
+        range_match = re.match(r"^(\w+)\[(ge|le)\]$", key)
+        if range_match is None:
+            return str(payment.get(key)) == value
+        field, operator = range_match.groups()
+        current = payment.get(field)
+        if current is None:
+            return False
+        return current >= value if operator == "ge" else current <= value
+
+    def _list(self, query: Dict[str, str]) -> Response:
+        offset = int(query.get("offset", 0))
+        limit = min(int(query.get("limit", 10)), 100)
+        filters = {
+            key: value for key, value in query.items() if key not in ("offset", "limit")
+        }
+        with self.state.lock:
+            payments = [
+                payment
+                for payment in self.state.payments.values()
+                if all(self._matches(payment, key, value) for key, value in filters.items())
+            ]
+        page = payments[offset : offset + limit]
+        return _json(
+            200,
+            {
+                "object": "list",
+                "hasMore": offset + limit < len(payments),
+                "totalCount": len(payments),
+                "limit": limit,
+                "offset": offset,
+                "data": page,
+            },
+        )
+
+
+class _NFEioRoutes:
+    """`/v1/companies/{company_id}/serviceinvoices` e o download dos PDFs."""
+
+    INVOICE_PATH = re.compile(r"^/(?:v1/)?companies/([^/]+)/serviceinvoices(?:/([^/]+))?(/pdf)?/?$")
+    FILE_PATH = re.compile(r"^/files/([^/]+)\.pdf$")
+
+    def __init__(self, state: _ProviderState, public_url: str):
+        self.state = state
+        self.public_url = public_url
+
+    def handle(self, method: str, path: str, body: Any, headers: Any) -> Response:
+        file_match = self.FILE_PATH.match(path)
+        if file_match and method == "GET":
+            return self._pdf_file(file_match.group(1), headers.get("Range"))
+
+        match = self.INVOICE_PATH.match(path)
+        if match is None:
+            return _not_found(path)
+
+        company_id, invoice_id, pdf = match.groups()
+        if invoice_id is None:
+            return self._issue(company_id, body) if method == "POST" else _not_found(path)
+        if pdf:
+            return self._pdf_link(invoice_id) if method == "GET" else _not_found(path)
+        if method == "GET":
+            return self._get(invoice_id)
+        if method == "DELETE":
+            return self._cancel(invoice_id)
+        return _not_found(path)
+
+    def _issue(self, company_id: str, data: Dict[str, Any]) -> Response:
+        invoice_id = hashlib.sha1(f"{company_id}:{self.state.next_id()}".encode()).hexdigest()[:24]
+        invoice = {
+            "id": invoice_id,
+            "environment": "Development",
+            "externalId": data.get("externalId"),
+            "borrower": data.get("borrower"),
+            "servicesAmount": data.get("servicesAmount"),
+            "description": data.get("description"),
+            "createdOn": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "_created_at": time.monotonic(),
+            "_cancelled": False,
+        }
+        with self.state.lock:
+            self.state.invoices[invoice_id] = invoice
+        return _json(202, self._public(invoice))
+
+    def _public(self, invoice: Dict[str, Any]) -> Dict[str, Any]:
+        if invoice["_cancelled"]:
+            status, flow_status = "Cancelled", "Cancelled"
+        elif time.monotonic() - invoice["_created_at"] >= self.state.config.invoice_issue_delay:
+            status, flow_status = "Issued", "Issued"
+        else:
+            status, flow_status = "Created", "WaitingSend"
+        public = {key: value for key, value in invoice.items() if not key.startswith("_")}
+        public.update(status=status, flowStatus=flow_status)
+        return public
+
+    def _lookup(self, invoice_id: str) -> Optional[Dict[str, Any]]:
+        with self.state.lock:
+            return self.state.invoices.get(invoice_id)
+
+    def _get(self, invoice_id: str) -> Response:
+        invoice = self._lookup(invoice_id)
+        if invoice is None:
+            return _json(404, {"message": "Nota fiscal não encontrada."})
+        return _json(200, self._public(invoice))
+
+    def _cancel(self, invoice_id: str) -> Response:
+        with self.state.lock:
+            invoice = self.state.invoices.get(invoice_id)
+            if invoice is not None:
+                invoice["_cancelled"] = True
+        if invoice is None:
+            return _json(404, {"message": "Nota fiscal não encontrada."})
+        return _json(200, self._public(invoice))
+
+    def _pdf_link(self, invoice_id: str) -> Response:
+        if self._lookup(invoice_id) is None:
+            return _json(404, {"message": "Nota fiscal não encontrada."})
+        # A API real devolve a URL do PDF como uma string JSON (entre aspas).
+        return _json(200, f"{self.public_url}/nfe_io/files/{invoice_id}.pdf")
+
+    def _pdf_file(self, invoice_id: str, range_header: Optional[str]) -> Response:
+        if self._lookup(invoice_id) is None:
+            return _json(404, {"message": "Nota fiscal não encontrada."})
+
+        content = _fake_pdf(invoice_id, self.state.config.pdf_size)
+        headers = {"Content-Type": "application/pdf", "Accept-Ranges": "bytes"}
+
+        match = re.match(r"bytes=(\d+)-(\d*)$", range_header or "")
+        if match is None:
+            return 200, content, headers
+
+        start = int(match.group(1))
+        end = int(match.group(2)) if match.group(2) else len(content) - 1
+        if start >= len(content):
+            headers["Content-Range"] = f"bytes */{len(content)}"
+            return 416, b"", headers
+
+        end = min(end, len(content) - 1)
+        headers["Content-Range"] = f"bytes {start}-{end}/{len(content)}"
+        return 206, content[start : end + 1], headers
+
+
+def _fake_pdf(invoice_id: str, size: int) -> bytes:
+    header = f"%PDF-1.4\n% NFSE {invoice_id}\n".encode()
+    filler = hashlib.sha256(invoice_id.encode()).hexdigest().encode()
+    body = (filler * (size // len(filler) + 1))[: max(size - len(header) - 6, 0)]
+    return header + body + b"\n%%EOF"
+
+
+class _SuperlogicaRoutes:
+    """`/v2/condor/MovimentacoesDiretas` e `/v2/condor/documentos`."""
+
+    def __init__(self, state: _ProviderState):
+        self.state = state
+
+    def handle(self, method: str, path: str, form: Dict[str, str]) -> Response:
+        normalized = path.rstrip("/")
+        if normalized.endswith("/condor/MovimentacoesDiretas") and method == "POST":
+            payable_id = self.state.next_id()
+            with self.state.lock:
+                self.state.payables[str(payable_id)] = {**form, "id_movimentacao": payable_id}
+            return _json(
+                200,
+                [{"status": "200", "msg": "Movimentação cadastrada com sucesso.", "data": {"id_movimentacao": payable_id}}],
+            )
+        if normalized.endswith("/condor/MovimentacoesDiretas/post") and method == "PUT":
+            return _json(200, [{"status": "200", "msg": "Movimentação atualizada com sucesso.", "data": form}])
+        if normalized.endswith("/condor/documentos") and method == "POST":
+            document_id = self.state.next_id()
+            with self.state.lock:
+                self.state.documents[str(document_id)] = {"id_documento": document_id}
+            return _json(200, {"status": "200", "msg": "Documento enviado.", "data": {"id_documento": document_id}})
+        return _not_found(path)
+
+
+def _flatten_query(raw: str) -> Dict[str, str]:
+    return {key: values[-1] for key, values in parse_qs(raw).items()}
+
+
+class _EmulatorHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "_EmulatorServer"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def do_PUT(self) -> None:
+        self._dispatch("PUT")
+
+    def do_DELETE(self) -> None:
+        self._dispatch("DELETE")
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _dispatch(self, method: str) -> None:
+        raw_body = self._read_body()
+        split = urlsplit(self.path)
+        provider, _, path = split.path.lstrip("/").partition("/")
+        path = "/" + path
+        query = _flatten_query(split.query)
+
+        state = self.server.state
+        delay = state.delay()
+        if delay > 0:
+            time.sleep(delay)
+
+        if provider not in self.server.routes:
+            response = _not_found(split.path)
+        elif not state.allow(provider) or state.chance(state.config.throttle_rate):
+            response = _json(
+                429,
+                {"errors": [{"code": "too_many_requests", "description": "Limite de requisições excedido."}]},
+                {"Retry-After": f"{state.config.retry_after:g}"},
+            )
+        elif state.chance(state.config.error_rate):
+            response = _json(503, {"errors": [{"code": "unavailable", "description": "Serviço indisponível."}]})
+        else:
+            try:
+                response = self._route(provider, method, path, raw_body, query)
+            except (ValueError, KeyError, TypeError) as e:
+                response = _json(400, {"errors": [{"code": "invalid_request", "description": str(e)}]})
+
+        state.record(provider, response[0])
+        self._send(*response)
+
+    def _route(
+        self, provider: str, method: str, path: str, raw_body: bytes, query: Dict[str, str]
+    ) -> Response:
+        routes = self.server.routes[provider]
+        content_type = self.headers.get("Content-Type", "")
+
+        if provider == "superlogica":
+            form = query.copy()
+            if "x-www-form-urlencoded" in content_type:
+                form.update(_flatten_query(raw_body.decode()))
+            return routes.handle(method, path, form)
+
+        body = json.loads(raw_body) if raw_body and "json" in content_type else {}
+        if provider == "omie":
+            return routes.handle(method, path, body)
+        if provider == "asaas":
+            return routes.handle(method, path, body, query)
+        return routes.handle(method, path, body, self.headers)
+
+    def _send(self, status: int, body: Any, headers: Dict[str, str]) -> None:
+        if isinstance(body, bytes):
+            payload = body
+        else:
+            payload = json.dumps(body, ensure_ascii=False).encode()
+            headers = {"Content-Type": "application/json", **headers}
+
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class _EmulatorServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], config: EmulatorConfig):
+        super().__init__(address, _EmulatorHandler)
+        self.state = _ProviderState(config)
+        host, port = self.server_address[:2]
+        self.url = f"http://{host}:{port}"
+        self.routes = {
+            "omie": _OmieRoutes(self.state),
+            "asaas": _AsaasRoutes(self.state),
+            "nfe_io": _NFEioRoutes(self.state, self.url),
+            "superlogica": _SuperlogicaRoutes(self.state),
+        }
+
+
+class ProviderEmulator:
+    """
+    Servidor do emulador rodando em uma thread em segundo plano.
+
+    Pode ser usado como context manager ou com `start()`/`stop()`.
+    """
+
+    def __init__(
+        self,
+        config: Optional[EmulatorConfig] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.config = config or EmulatorConfig()
+        self._server = _EmulatorServer((host, port), self.config)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return self._server.url
+
+    def env(self) -> Dict[str, str]:
+        """Variáveis de ambiente que apontam os clientes reais para o emulador."""
+        return {
+            "OMIE_BASE_URL": f"{self.url}/omie/api/v1/",
+            "OMIE_APP_KEY": "emulator",
+            "OMIE_APP_SECRET": "emulator",
+            "OMIE_DEFAULT_ACCOUNT_ID": "1",
+            "ASAAS_BASE_URL": f"{self.url}/asaas/v3",
+            "ASAAS_API_KEY": "emulator",
+            "NFE_IO_BASE_URL": f"{self.url}/nfe_io/v1",
+            "NFE_IO_API_KEY": "emulator",
+            "NFE_IO_COMPANY_ID": "emulator-company",
+            "SUPERLOGICA_BASE_URL": f"{self.url}/superlogica",
+            "SUPERLOGICA_APP_TOKEN": "emulator",
+            "SUPERLOGICA_ACCESS_TOKEN": "emulator",
+        }
+
+    def stats(self) -> Dict[str, Dict[int, int]]:
+        """Quantidade de respostas enviadas por provedor e status HTTP."""
+        state = self._server.state
+        with state.lock:
+            return {provider: dict(by_status) for provider, by_status in state.requests.items()}
+
+    def start(self) -> "ProviderEmulator":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="provider-emulator", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def serve_forever(self) -> None:
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def __enter__(self) -> "ProviderEmulator":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Emulador local dos provedores.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency", type=float, default=0.0, help="Latência base (s).")
+    parser.add_argument("--latency-jitter", type=float, default=0.0, help="Variação da latência (s).")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probabilidade de 503 (0 a 1).")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Probabilidade de 429 (0 a 1).")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="Req/s por provedor antes de 429.")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After das respostas 429 (s).")
+    parser.add_argument("--invoice-issue-delay", type=float, default=0.0, help="Tempo até a NFSE ser emitida (s).")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    config = EmulatorConfig(
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        rate_limit=args.rate_limit,
+        retry_after=args.retry_after,
+        invoice_issue_delay=args.invoice_issue_delay,
+        seed=args.seed,
+    )
+    emulator = ProviderEmulator(config, host=args.host, port=args.port)
+
+    print(f"Emulador ouvindo em {emulator.url}. Variáveis de ambiente:")
+    for name, value in emulator.env().items():
+        print(f"{name}={value}")
+
+    try:
+        emulator.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
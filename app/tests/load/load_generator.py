@@ -0,0 +1,245 @@
+"""
+Gerador de carga para os clientes do `ClientFactory`.
+
+Dispara chamadas a uma taxa alvo (RPS) durante um tempo fixo e relata
+throughput, latência (p50/p95/p99) e falhas. A carga é de laço aberto: cada
+chamada tem um horário agendado e a latência é medida a partir dele, então o
+tempo de fila quando o cliente não acompanha a taxa entra no resultado em vez
+de ser escondido.
+
+O cliente é o que o `ClientFactory` devolver para o domínio (ERP_CLIENT,
+INVOICE_CLIENT, ...). Com os mocks, o perfil de carga (`MOCK_LOAD_*`) define
+latência e falhas simuladas; as opções `--latency*`, `--error-rate` e
+`--throttle-rate` o sobrescrevem:
+
+    python -m app.tests.load.load_generator --domain erp --rps 500 --duration 10 \\
+        --latency-distribution longtail --latency 0.05 --latency-stddev 0.8 --error-rate 0.01
+    python -m app.tests.load.load_generator --domain payment --async --rps 1000
+"""
+
+import argparse
+import asyncio
+import inspect
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+# Operação exercitada em cada domínio.
+OPERATIONS = {
+    "erp": "create_accounts_receivable",
+    "invoice": "issue_invoice",
+    "payment": "create_payment",
+    "payables": "create_payable",
+}
+
+# Variáveis exigidas pelos mocks (valores de exemplo do `.env.example`).
+MOCK_ENV = {
+    "MOCK_ERP_APP_KEY": "mock_app_key_123",
+    "MOCK_ERP_APP_SECRET": "mock_app_secret_456",
+    "MOCK_INVOICE_API_KEY": "mock_invoice_key_789",
+    "MOCK_PAYMENT_API_KEY": "mock_payment_key_321",
+}
+
+Call = Callable[[int], Any]
+
+
+def percentile(sorted_values: List[float], q: float) -> Optional[float]:
+    """Percentil pelo método do posto mais próximo (`sorted_values` já ordenado)."""
+    if not sorted_values:
+        return None
+    rank = min(max(math.ceil(q * len(sorted_values)) - 1, 0), len(sorted_values) - 1)
+    return sorted_values[rank]
+
+
+def summarize(
+    latencies: List[float], errors: Dict[str, int], elapsed: float, rps: float
+) -> Dict[str, Any]:
+    """Relatório de uma execução; latências em milissegundos."""
+    latencies = sorted(latencies)
+    failed = sum(errors.values())
+    total = len(latencies) + failed
+
+    def ms(value: Optional[float]) -> Optional[float]:
+        return round(value * 1000, 3) if value is not None else None
+
+    return {
+        "target_rps": rps,
+        "elapsed": round(elapsed, 3),
+        "total": total,
+        "succeeded": len(latencies),
+        "failed": failed,
+        "throughput": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "achieved_rps": round(total / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": {
+            "p50": ms(percentile(latencies, 0.50)),
+            "p95": ms(percentile(latencies, 0.95)),
+            "p99": ms(percentile(latencies, 0.99)),
+            "max": ms(latencies[-1] if latencies else None),
+        },
+        "errors": errors,
+    }
+
+
+def _error_label(error: BaseException) -> str:
+    status = getattr(error, "status_code", None)
+    return f"{type(error).__name__}({status})" if status else type(error).__name__
+
+
+async def run_load(
+    call: Call,
+    rps: float,
+    duration: float,
+    max_concurrency: int = 100,
+) -> Dict[str, Any]:
+    """
+    Executa `call(i)` a `rps` chamadas por segundo durante `duration` segundos.
+
+    `call` pode ser uma função síncrona (executada em um pool de
+    `max_concurrency` threads) ou uma corrotina (até `max_concurrency` chamadas
+    em voo). Qualquer exceção conta como falha, agrupada por tipo.
+    """
+    if rps <= 0 or duration <= 0:
+        raise ValueError("rps e duration devem ser maiores que zero.")
+
+    is_async = inspect.iscoroutinefunction(call)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    executor = None if is_async else ThreadPoolExecutor(max_workers=max_concurrency)
+    loop = asyncio.get_running_loop()
+    latencies: List[float] = []
+    errors: Dict[str, int] = {}
+
+    async def one(index: int, scheduled: float) -> None:
+        async with semaphore:
+            try:
+                if is_async:
+                    await call(index)
+                else:
+                    await loop.run_in_executor(executor, call, index)
+            except Exception as e:
+                label = _error_label(e)
+                errors[label] = errors.get(label, 0) + 1
+                return
+        latencies.append(time.perf_counter() - scheduled)
+
+    total = int(rps * duration)
+    interval = 1.0 / rps
+    started = time.perf_counter()
+    tasks = []
+    try:
+        for index in range(total):
+            scheduled = started + index * interval
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(one(index, scheduled)))
+        await asyncio.gather(*tasks)
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    return summarize(latencies, errors, time.perf_counter() - started, rps)
+
+
+def _payload(domain: str, client_type: str, client: Any, index: int) -> Dict[str, Any]:
+    from app.tests.benchmarks.cases import PAYABLE, PAYMENT, RECEIVABLE
+
+    key = f"load-{os.getpid()}-{index:08d}"
+    if domain == "erp":
+        return {**RECEIVABLE, "codigo_lancamento_integracao": key}
+    if domain == "payables":
+        return dict(PAYABLE)
+    if domain == "payment":
+        if client_type == "mock":
+            return {"customer_id": "cus-1", "amount": 150.0, "due_date": "2025-05-10"}
+        return {**PAYMENT, "externalReference": key}
+    if client_type == "mock":
+        return {"customer_id": "cus-1", "amount": 100.0, "service_description": "Carga"}
+    return client.create_data(
+        origem="mock",
+        identificador="59696922000128",
+        city_service_code="101",
+        description="Carga",
+        services_amount=100.0,
+        externalId=key,
+    )
+
+
+def build_call(domain: str, is_async: bool = False) -> Call:
+    """Chamada de `OPERATIONS[domain]` no cliente do `ClientFactory`, com payload por índice."""
+    from app.core.client_factory import CLIENT_ENV_VARS, ClientFactory
+
+    getter = f"get_async_{domain}_client" if is_async else f"get_{domain}_client"
+    client = getattr(ClientFactory, getter)()
+    client_type = os.getenv(CLIENT_ENV_VARS[domain], "mock").lower()
+    # Os mocks de NFSE e de pagamentos exigem o token no payload.
+    token = None
+    if client_type == "mock" and hasattr(client, "get_access_token"):
+        token = client.get_access_token()
+    method = getattr(client, OPERATIONS[domain])
+
+    def payload(index: int) -> Dict[str, Any]:
+        data = _payload(domain, client_type, client, index)
+        if token:
+            data["token"] = token
+        return data
+
+    if is_async:
+
+        async def async_call(index: int) -> Any:
+            return await method(payload(index))
+
+        return async_call
+    return lambda index: method(payload(index))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Gerador de carga dos clientes.")
+    parser.add_argument("--domain", choices=sorted(OPERATIONS), default="erp")
+    parser.add_argument("--async", dest="is_async", action="store_true", help="Usa o cliente assíncrono.")
+    parser.add_argument("--rps", type=float, default=100.0, help="Chamadas por segundo.")
+    parser.add_argument("--duration", type=float, default=10.0, help="Duração (s).")
+    parser.add_argument("--concurrency", type=int, default=100, help="Máximo de chamadas em voo.")
+    parser.add_argument("--latency-distribution", choices=["none", "fixed", "normal", "longtail"])
+    parser.add_argument("--latency", type=float, help="Latência dos mocks (s).")
+    parser.add_argument("--latency-stddev", type=float, help="Desvio-padrão (normal) ou sigma (longtail).")
+    parser.add_argument("--error-rate", type=float, help="Probabilidade de 503 simulado (0 a 1).")
+    parser.add_argument("--throttle-rate", type=float, help="Probabilidade de 429 simulado (0 a 1).")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--output", help="Grava o relatório em JSON.")
+    parser.add_argument("--log-level", default="WARNING", help="LOG_LEVEL durante a carga.")
+    args = parser.parse_args(argv)
+
+    # Precisa ser definido antes de os módulos da aplicação criarem seus loggers.
+    os.environ["LOG_LEVEL"] = args.log_level
+    for name, value in MOCK_ENV.items():
+        os.environ.setdefault(name, value)
+    overrides = {
+        "MOCK_LOAD_LATENCY_DISTRIBUTION": args.latency_distribution,
+        "MOCK_LOAD_LATENCY": args.latency,
+        "MOCK_LOAD_LATENCY_STDDEV": args.latency_stddev,
+        "MOCK_LOAD_ERROR_RATE": args.error_rate,
+        "MOCK_LOAD_THROTTLE_RATE": args.throttle_rate,
+        "MOCK_LOAD_SEED": args.seed,
+    }
+    for name, value in overrides.items():
+        if value is not None:
+            os.environ[name] = str(value)
+
+    async def run() -> Dict[str, Any]:
+        call = build_call(args.domain, args.is_async)
+        return await run_load(call, args.rps, args.duration, args.concurrency)
+
+    report = {"domain": args.domain, "async": args.is_async, **asyncio.run(run())}
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,235 @@
+import asyncio
+import os
+import threading
+import time
+import weakref
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.config.settings import env_bool
+from app.utils.circuit_breaker import CircuitBreaker, get_circuit_breaker
+from app.utils.json_codec import encode_json_kwargs
+from app.utils.logger import get_logger
+from app.utils.metrics import content_length, record_http, record_rate_limit_wait, record_retry
+from app.utils.rate_limiter import AdaptiveRateLimiter, get_rate_limiter
+from app.utils.retry import RetryPolicy
+
+logger = get_logger(__name__)
+
+
+class AsyncHttpTransport:
+    """
+    Versão assíncrona da camada HTTP compartilhada, baseada em `httpx.AsyncClient`.
+
+    Permite manter várias chamadas em voo na mesma thread, reaproveitando
+    conexões keep-alive. Usa as mesmas variáveis de ambiente de `HttpTransport`
+    (HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, HTTP_KEEP_ALIVE, HTTP_TIMEOUT).
+
+    Um `httpx.AsyncClient` pertence a um único event loop; por isso a instância
+    compartilhada é obtida via `get_async_transport()`, que mantém uma por loop.
+    """
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = None,
+        keep_alive: Optional[bool] = None,
+        timeout: Optional[float] = None,
+    ):
+        pool_connections = int(os.getenv("HTTP_POOL_CONNECTIONS", "10"))
+        pool_maxsize = int(os.getenv("HTTP_POOL_MAXSIZE", "20"))
+        self.max_connections = max_connections or pool_connections * pool_maxsize
+        self.keep_alive = (
+            keep_alive if keep_alive is not None else env_bool("HTTP_KEEP_ALIVE", True)
+        )
+        self.timeout = timeout or float(os.getenv("HTTP_TIMEOUT", "30"))
+
+        limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_connections if self.keep_alive else 0,
+        )
+        self.client = httpx.AsyncClient(limits=limits, timeout=self.timeout)
+        self._requests_by_host: Dict[str, int] = {}
+        self._providers: Dict[Tuple[str, RetryPolicy], "AsyncProviderTransport"] = {}
+
+        logger.debug(
+            "AsyncHttpTransport: pool configurado (max_connections=%s, keep_alive=%s).",
+            self.max_connections,
+            self.keep_alive,
+        )
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        host = urlsplit(url).netloc
+        self._requests_by_host[host] = self._requests_by_host.get(host, 0) + 1
+        return await self.client.request(method, url, **kwargs)
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("PUT", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("DELETE", url, **kwargs)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Retorna a quantidade de requisições enviadas por host."""
+        return {
+            host: {"requests": count} for host, count in self._requests_by_host.items()
+        }
+
+    def for_provider(
+        self, provider: str, retry_policy: Optional[RetryPolicy] = None
+    ) -> "AsyncProviderTransport":
+        """
+        Retorna uma visão do transporte vinculada ao provedor, com seu rate limiter,
+        circuit breaker e política de novas tentativas.
+
+        As visões ficam guardadas por provedor e política; como esta instância é
+        única por event loop, os clientes podem chamar este método a cada
+        requisição sem recriá-las.
+        """
+        retry_policy = retry_policy or RetryPolicy()
+        key = (provider, retry_policy)
+        view = self._providers.get(key)
+        if view is None:
+            view = AsyncProviderTransport(
+                self,
+                provider,
+                get_rate_limiter(provider),
+                get_circuit_breaker(provider),
+                retry_policy,
+            )
+            self._providers[key] = view
+        return view
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+
+class AsyncProviderTransport:
+    """
+    Versão assíncrona de `ProviderTransport`: mesmo rate limiter, circuit breaker
+    e política de novas tentativas (compartilhados com os clientes síncronos),
+    aguardando sem bloquear o event loop.
+    """
+
+    def __init__(
+        self,
+        transport: AsyncHttpTransport,
+        provider: str,
+        rate_limiter: AdaptiveRateLimiter,
+        circuit_breaker: CircuitBreaker,
+        retry_policy: RetryPolicy,
+    ):
+        self.transport = transport
+        self.provider = provider
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.retry_policy = retry_policy
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        idempotent: Optional[bool] = None,
+        idempotency_key: Optional[str] = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        attempts = self.retry_policy.attempts_for(method, idempotent, idempotency_key)
+        kwargs = encode_json_kwargs(kwargs, "content")
+
+        for attempt in range(1, attempts + 1):
+            self.circuit_breaker.before_call()
+            record_rate_limit_wait(self.provider, await self.rate_limiter.acquire_async())
+
+            started = time.perf_counter()
+            try:
+                response = await self.transport.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                record_http(self.provider, "error", time.perf_counter() - started)
+                self.circuit_breaker.record_failure()
+                if attempt == attempts:
+                    raise
+                await self._wait_before_retry(method, url, attempt, attempts, str(e))
+                continue
+            except Exception:
+                record_http(self.provider, "error", time.perf_counter() - started)
+                self.circuit_breaker.record_failure()
+                raise
+
+            self._record_response(response, time.perf_counter() - started)
+            self.rate_limiter.observe(response.status_code, response.headers)
+            transient = self.retry_policy.should_retry_status(response.status_code)
+            if transient and response.status_code >= 500:
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
+
+            if transient and attempt < attempts:
+                await self._wait_before_retry(
+                    method, url, attempt, attempts, f"HTTP {response.status_code}"
+                )
+                continue
+
+            return response
+
+    def _record_response(self, response: httpx.Response, duration: float) -> None:
+        bytes_in = content_length(response.headers) or len(response.content)
+        record_http(
+            self.provider,
+            str(response.status_code),
+            duration,
+            bytes_out=content_length(response.request.headers),
+            bytes_in=bytes_in,
+        )
+
+    async def _wait_before_retry(
+        self, method: str, url: str, attempt: int, attempts: int, reason: str
+    ) -> None:
+        delay = self.retry_policy.backoff(attempt)
+        record_retry(self.provider)
+        logger.warning(
+            "%s: %s %s falhou (%s); tentativa %s/%s em %.2fs.",
+            self.provider,
+            method,
+            url,
+            reason,
+            attempt + 1,
+            attempts,
+            delay,
+        )
+        await asyncio.sleep(delay)
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("PUT", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("DELETE", url, **kwargs)
+
+
+_transports: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncHttpTransport]" = (
+    weakref.WeakKeyDictionary()
+)
+_transports_lock = threading.Lock()
+
+
+def get_async_transport() -> AsyncHttpTransport:
+    """Retorna o `AsyncHttpTransport` compartilhado do event loop em execução."""
+    loop = asyncio.get_running_loop()
+    with _transports_lock:
+        transport = _transports.get(loop)
+        if transport is None:
+            transport = AsyncHttpTransport()
+            _transports[loop] = transport
+    return transport
@@ -0,0 +1,136 @@
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class CircuitOpenError(ConnectionError):
+    """Levantada quando o circuito do provedor está aberto e a chamada é recusada."""
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker por provedor.
+
+    - closed: chamadas passam normalmente; falhas consecutivas são contadas.
+    - open: após `failure_threshold` falhas seguidas, as chamadas falham na hora
+      com `CircuitOpenError` durante `recovery_timeout` segundos.
+    - half_open: passado o tempo de recuperação, uma única chamada de teste é
+      liberada; sucesso fecha o circuito, falha o reabre.
+
+    Contam como falha apenas erros de conexão/timeout e status 5xx, nunca
+    respostas 4xx (o provedor está no ar, o problema é a requisição).
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._rejected = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if (
+            self._state == self.OPEN
+            and time.monotonic() - self._opened_at >= self.recovery_timeout
+        ):
+            self._state = self.HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def before_call(self) -> None:
+        """Verifica se a chamada pode seguir; levanta `CircuitOpenError` caso contrário."""
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return
+            if state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return
+            self._rejected += 1
+
+        raise CircuitOpenError(
+            f"{self.name}: circuito aberto, provedor indisponível. Tente novamente mais tarde."
+        )
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info("CircuitBreaker[%s]: provedor respondeu, circuito fechado.", self.name)
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    logger.error(
+                        "CircuitBreaker[%s]: circuito aberto após %s falhas seguidas.",
+                        self.name,
+                        self._failures,
+                    )
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probe_in_flight = False
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self._current_state(),
+                "consecutive_failures": self._failures,
+                "rejected": self._rejected,
+            }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(provider: str) -> CircuitBreaker:
+    """
+    Retorna o circuit breaker compartilhado do provedor.
+
+    Configuração:
+        - <PROVEDOR>_CB_FAILURE_THRESHOLD: falhas seguidas para abrir (default: 5)
+        - <PROVEDOR>_CB_RECOVERY_TIMEOUT: segundos em aberto antes do teste (default: 30)
+    """
+    breaker: Optional[CircuitBreaker] = _breakers.get(provider)
+    if breaker is not None:
+        return breaker
+
+    with _breakers_lock:
+        breaker = _breakers.get(provider)
+        if breaker is None:
+            prefix = provider.upper()
+            breaker = CircuitBreaker(
+                provider,
+                failure_threshold=int(os.getenv(f"{prefix}_CB_FAILURE_THRESHOLD", "5")),
+                recovery_timeout=float(os.getenv(f"{prefix}_CB_RECOVERY_TIMEOUT", "30")),
+            )
+            _breakers[provider] = breaker
+    return breaker
+
+
+def circuit_breaker_stats() -> Dict[str, Dict[str, Any]]:
+    """Retorna o estado de todos os circuit breakers já criados."""
+    return {name: breaker.stats() for name, breaker in list(_breakers.items())}
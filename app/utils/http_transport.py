@@ -0,0 +1,271 @@
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.config.settings import env_bool
+from app.utils.circuit_breaker import CircuitBreaker, get_circuit_breaker
+from app.utils.json_codec import encode_json_kwargs
+from app.utils.logger import get_logger
+from app.utils.metrics import content_length, record_http, record_rate_limit_wait, record_retry
+from app.utils.rate_limiter import AdaptiveRateLimiter, get_rate_limiter
+from app.utils.retry import RetryPolicy
+
+logger = get_logger(__name__)
+
+
+class HttpTransport:
+    """
+    Camada HTTP compartilhada por todos os clientes de provedores.
+
+    Mantém uma única `requests.Session` com pool de conexões por host
+    (via `HTTPAdapter`), reaproveitando conexões TCP/TLS entre chamadas
+    em vez de abrir um novo handshake a cada requisição.
+
+    Configuração (variáveis de ambiente):
+        - HTTP_POOL_CONNECTIONS: quantidade de hosts mantidos em pool (default: 10)
+        - HTTP_POOL_MAXSIZE: conexões simultâneas por host (default: 20)
+        - HTTP_POOL_BLOCK: bloqueia quando o pool do host está cheio (default: false)
+        - HTTP_KEEP_ALIVE: mantém conexões abertas entre chamadas (default: true)
+        - HTTP_TIMEOUT: timeout padrão em segundos (default: 30)
+    """
+
+    def __init__(
+        self,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        pool_block: Optional[bool] = None,
+        keep_alive: Optional[bool] = None,
+        timeout: Optional[float] = None,
+    ):
+        self.pool_connections = pool_connections or int(
+            os.getenv("HTTP_POOL_CONNECTIONS", "10")
+        )
+        self.pool_maxsize = pool_maxsize or int(os.getenv("HTTP_POOL_MAXSIZE", "20"))
+        self.pool_block = (
+            pool_block if pool_block is not None else env_bool("HTTP_POOL_BLOCK", False)
+        )
+        self.keep_alive = (
+            keep_alive if keep_alive is not None else env_bool("HTTP_KEEP_ALIVE", True)
+        )
+        self.timeout = timeout or float(os.getenv("HTTP_TIMEOUT", "30"))
+
+        self._adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        self.session = requests.Session()
+        self.session.mount("https://", self._adapter)
+        self.session.mount("http://", self._adapter)
+        if not self.keep_alive:
+            self.session.headers["Connection"] = "close"
+
+        logger.debug(
+            "HttpTransport: pool configurado (hosts=%s, maxsize=%s, keep_alive=%s).",
+            self.pool_connections,
+            self.pool_maxsize,
+            self.keep_alive,
+        )
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("DELETE", url, **kwargs)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Retorna estatísticas de reaproveitamento de conexões por host.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Para cada host, a quantidade de requisições,
+            conexões abertas, conexões reaproveitadas e a taxa de reuso.
+        """
+        pools = self._adapter.poolmanager.pools
+        stats: Dict[str, Dict[str, Any]] = {}
+
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            host = f"{pool.host}:{pool.port}"
+            entry = stats.setdefault(
+                host, {"requests": 0, "connections": 0, "reused": 0, "reuse_ratio": 0.0}
+            )
+            entry["requests"] += pool.num_requests
+            entry["connections"] += pool.num_connections
+
+        for entry in stats.values():
+            entry["reused"] = max(entry["requests"] - entry["connections"], 0)
+            if entry["requests"]:
+                entry["reuse_ratio"] = round(entry["reused"] / entry["requests"], 4)
+
+        return stats
+
+    def for_provider(
+        self, provider: str, retry_policy: Optional[RetryPolicy] = None
+    ) -> "ProviderTransport":
+        """
+        Retorna uma visão do transporte vinculada ao provedor, com seu rate limiter,
+        circuit breaker e política de novas tentativas.
+        """
+        return ProviderTransport(
+            self,
+            provider,
+            get_rate_limiter(provider),
+            get_circuit_breaker(provider),
+            retry_policy or RetryPolicy(),
+        )
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class ProviderTransport:
+    """
+    Transporte vinculado a um provedor (ex: "omie", "asaas").
+
+    Compartilha o pool de conexões do `HttpTransport` e, para cada chamada:
+        - recusa na hora se o circuit breaker do provedor estiver aberto;
+        - aguarda o rate limiter do provedor, que se ajusta aos 429/`Retry-After`;
+        - repete falhas transitórias (conexão, timeout, 5xx, 429) com backoff e
+          jitter, somente quando a operação é segura de repetir (ver `RetryPolicy`).
+
+    Os métodos aceitam, além dos argumentos do `requests`:
+        - idempotent (bool): força a operação como repetível (ou não);
+        - idempotency_key (str): chave natural da criação; quando presente,
+          a criação pode ser repetida. Use apenas se o provedor recusar a chave
+          repetida (ex: `codigo_lancamento_integracao` da Omie).
+
+    O `json=` é codificado pelo `json_codec` (orjson, se instalado) uma única
+    vez, antes das tentativas; bytes já codificados também são aceitos.
+    """
+
+    def __init__(
+        self,
+        transport: HttpTransport,
+        provider: str,
+        rate_limiter: AdaptiveRateLimiter,
+        circuit_breaker: CircuitBreaker,
+        retry_policy: RetryPolicy,
+    ):
+        self.transport = transport
+        self.provider = provider
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.retry_policy = retry_policy
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        idempotent: Optional[bool] = None,
+        idempotency_key: Optional[str] = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        attempts = self.retry_policy.attempts_for(method, idempotent, idempotency_key)
+        kwargs = encode_json_kwargs(kwargs, "data")
+
+        for attempt in range(1, attempts + 1):
+            self.circuit_breaker.before_call()
+            record_rate_limit_wait(self.provider, self.rate_limiter.acquire())
+
+            started = time.perf_counter()
+            try:
+                response = self.transport.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                record_http(self.provider, "error", time.perf_counter() - started)
+                self.circuit_breaker.record_failure()
+                if attempt == attempts:
+                    raise
+                self._wait_before_retry(method, url, attempt, attempts, str(e))
+                continue
+            except Exception:
+                record_http(self.provider, "error", time.perf_counter() - started)
+                self.circuit_breaker.record_failure()
+                raise
+
+            self._record_response(response, time.perf_counter() - started, kwargs.get("stream"))
+            self.rate_limiter.observe(response.status_code, response.headers)
+            transient = self.retry_policy.should_retry_status(response.status_code)
+            if transient and response.status_code >= 500:
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
+
+            if transient and attempt < attempts:
+                self._wait_before_retry(
+                    method, url, attempt, attempts, f"HTTP {response.status_code}"
+                )
+                continue
+
+            return response
+
+    def _record_response(self, response: Any, duration: float, streamed: Optional[bool]) -> None:
+        bytes_in = content_length(response.headers)
+        if not bytes_in and not streamed:
+            bytes_in = len(response.content)
+        record_http(
+            self.provider,
+            str(response.status_code),
+            duration,
+            bytes_out=content_length(response.request.headers),
+            bytes_in=bytes_in,
+        )
+
+    def _wait_before_retry(
+        self, method: str, url: str, attempt: int, attempts: int, reason: str
+    ) -> None:
+        delay = self.retry_policy.backoff(attempt)
+        record_retry(self.provider)
+        logger.warning(
+            "%s: %s %s falhou (%s); tentativa %s/%s em %.2fs.",
+            self.provider,
+            method,
+            url,
+            reason,
+            attempt + 1,
+            attempts,
+            delay,
+        )
+        time.sleep(delay)
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("DELETE", url, **kwargs)
+
+
+_transport: Optional[HttpTransport] = None
+_transport_lock = threading.Lock()
+
+
+def get_transport() -> HttpTransport:
+    """Retorna a instância compartilhada de `HttpTransport` (criada sob demanda)."""
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                _transport = HttpTransport()
+    return _transport
@@ -0,0 +1,164 @@
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.config.settings import data_path, env_bool
+from app.utils.json_codec import dumps_text, loads
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class IdempotencyStore:
+    """
+    Registro local de chaves de idempotência e das respostas dos provedores.
+
+    Cada criação bem-sucedida é gravada com sua chave natural
+    (`codigo_lancamento_integracao` na Omie, `externalId` na NFE.io,
+    `externalReference` na Asaas). Uma nova chamada com a mesma chave devolve
+    a resposta gravada sem ir à rede, evitando títulos duplicados em
+    retentativas e reprocessamentos de lotes.
+
+    As respostas ficam em SQLite (modo WAL), com um cache LRU em memória na
+    frente para as chaves mais recentes. O banco só é aberto (e o arquivo
+    criado) no primeiro uso. Nos clientes assíncronos, use `get_async` e
+    `put_async`, que fazem o acesso ao SQLite fora do event loop.
+
+    Configuração (variáveis de ambiente):
+        - IDEMPOTENCY_ENABLED: liga/desliga o registro (default: true)
+        - IDEMPOTENCY_DB_PATH: arquivo SQLite (default: <DATA_DIR>/idempotency.sqlite3;
+          caminhos relativos partem da raiz do projeto, não do diretório atual)
+        - IDEMPOTENCY_CACHE_SIZE: chaves mantidas em memória (default: 10000)
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        cache_size: Optional[int] = None,
+        enabled: Optional[bool] = None,
+    ):
+        self.enabled = enabled if enabled is not None else env_bool("IDEMPOTENCY_ENABLED", True)
+        self.path = path or str(data_path("IDEMPOTENCY_DB_PATH", "idempotency.sqlite3"))
+        self.cache_size = cache_size or int(os.getenv("IDEMPOTENCY_CACHE_SIZE", "10000"))
+
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[tuple, str]" = OrderedDict()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @property
+    def _db(self) -> sqlite3.Connection:
+        # Chamado sob `self._lock`.
+        if self._conn is None:
+            self._conn = self._connect()
+        return self._conn
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS idempotency_keys (
+                provider TEXT NOT NULL,
+                key TEXT NOT NULL,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (provider, key)
+            )
+            """
+        )
+        logger.debug("IdempotencyStore: usando banco %s.", self.path)
+        return conn
+
+    def _remember(self, cache_key: tuple, raw: str) -> None:
+        self._cache[cache_key] = raw
+        self._cache.move_to_end(cache_key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def get(self, provider: str, key: Optional[Any]) -> Optional[Dict[str, Any]]:
+        """Retorna a resposta gravada para a chave, ou None se ela ainda não foi usada."""
+        if not self.enabled or not key:
+            return None
+
+        cache_key = (provider, str(key))
+        with self._lock:
+            raw = self._cache.get(cache_key)
+            if raw is not None:
+                self._cache.move_to_end(cache_key)
+            else:
+                row = self._db.execute(
+                    "SELECT response FROM idempotency_keys WHERE provider = ? AND key = ?",
+                    cache_key,
+                ).fetchone()
+                if row is None:
+                    return None
+                raw = row[0]
+                self._remember(cache_key, raw)
+
+        return loads(raw)
+
+    def put(self, provider: str, key: Optional[Any], response: Dict[str, Any]) -> None:
+        """Grava a resposta de uma criação bem-sucedida."""
+        if not self.enabled or not key:
+            return
+
+        cache_key = (provider, str(key))
+        raw = dumps_text(response, default=str)
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO idempotency_keys (provider, key, response, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (*cache_key, raw, time.time()),
+            )
+            self._remember(cache_key, raw)
+
+    async def get_async(self, provider: str, key: Optional[Any]) -> Optional[Dict[str, Any]]:
+        """Equivalente assíncrono de `get`, sem bloquear o event loop com o SQLite."""
+        if not self.enabled or not key:
+            return None
+        return await asyncio.to_thread(self.get, provider, key)
+
+    async def put_async(self, provider: str, key: Optional[Any], response: Dict[str, Any]) -> None:
+        """Equivalente assíncrono de `put`, sem bloquear o event loop com o SQLite."""
+        if not self.enabled or not key:
+            return
+        await asyncio.to_thread(self.put, provider, key, response)
+
+    def delete(self, provider: str, key: Any) -> None:
+        if not self.enabled or not key:
+            return
+
+        cache_key = (provider, str(key))
+        with self._lock:
+            self._db.execute(
+                "DELETE FROM idempotency_keys WHERE provider = ? AND key = ?", cache_key
+            )
+            self._cache.pop(cache_key, None)
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+_store: Optional[IdempotencyStore] = None
+_store_lock = threading.Lock()
+
+
+def get_idempotency_store() -> IdempotencyStore:
+    """Retorna o `IdempotencyStore` compartilhado (criado sob demanda)."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = IdempotencyStore()
+    return _store
@@ -0,0 +1,107 @@
+import json
+import os
+from typing import Any, Callable, Dict, Optional, Union
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSON_CONTENT_TYPE = "application/json"
+
+Default = Optional[Callable[[Any], Any]]
+
+
+def _select_backend() -> str:
+    """
+    Backend definido por JSON_BACKEND: "auto" (orjson se instalado), "orjson"
+    ou "json" (biblioteca padrão). Sem o orjson, sempre cai para "json".
+    """
+    wanted = os.getenv("JSON_BACKEND", "auto").strip().lower()
+    if wanted not in ("auto", "orjson", "json"):
+        raise ValueError(f"JSON_BACKEND '{wanted}' inválido; use auto, orjson ou json.")
+    if wanted == "json":
+        return "json"
+    if orjson is None:
+        if wanted == "orjson":
+            logger.warning("JSON_BACKEND=orjson, mas o orjson não está instalado; usando json.")
+        return "json"
+    return "orjson"
+
+
+BACKEND = _select_backend()
+
+
+_USE_ORJSON = BACKEND == "orjson"
+# Chaves não textuais (ex: int) são aceitas como na biblioteca padrão.
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if _USE_ORJSON else 0
+_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def dumps(obj: Any, default: Default = None) -> bytes:
+    """Serializa `obj` em JSON compacto (UTF-8)."""
+    if _USE_ORJSON:
+        return orjson.dumps(obj, default=default, option=_ORJSON_OPTIONS)
+    return dumps_text(obj, default=default).encode()
+
+
+def dumps_text(obj: Any, indent: bool = False, default: Default = None) -> str:
+    """Como `dumps`, mas devolve texto; `indent` formata para leitura (logs de debug)."""
+    if _USE_ORJSON:
+        option = _ORJSON_OPTIONS | orjson.OPT_INDENT_2 if indent else _ORJSON_OPTIONS
+        return orjson.dumps(obj, default=default, option=option).decode()
+    if indent or default is not None:
+        return json.dumps(
+            obj,
+            ensure_ascii=False,
+            indent=2 if indent else None,
+            separators=None if indent else (",", ":"),
+            default=default,
+        )
+    return _encoder.encode(obj)
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Decodifica JSON de bytes ou texto; entrada inválida levanta `ValueError`."""
+    if _USE_ORJSON:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def decode_response(response: Any) -> Any:
+    """
+    Decodifica o corpo JSON de uma resposta (`requests` ou `httpx`) direto dos
+    bytes, sem passar pela detecção de encoding do `response.json()`.
+    Corpo vazio ou inválido levanta `ValueError`, como o `response.json()`.
+    """
+    return loads(response.content)
+
+
+def encode_json_kwargs(kwargs: Dict[str, Any], body_arg: str) -> Dict[str, Any]:
+    """
+    Troca o `json=` dos argumentos de uma requisição pelo corpo já codificado em
+    `body_arg` ("data" no `requests`, "content" no `httpx`), com o
+    `Content-Type` JSON quando nenhum foi informado.
+
+    `json` pode ser um objeto (codificado aqui, uma única vez mesmo com novas
+    tentativas) ou bytes já codificados, enviados como estão.
+    """
+    body = kwargs.get("json")
+    if body is None:
+        return kwargs
+
+    kwargs = dict(kwargs)
+    del kwargs["json"]
+    kwargs[body_arg] = body if isinstance(body, (bytes, bytearray)) else dumps(body)
+
+    headers = dict(kwargs.get("headers") or {})
+    if not any(name.lower() == "content-type" for name in headers):
+        headers["Content-Type"] = JSON_CONTENT_TYPE
+    kwargs["headers"] = headers
+    return kwargs
@@ -2,12 +2,114 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+import threading
 from pathlib import Path
+from typing import Dict, Optional
+
+# Formato do log
+_formatter = logging.Formatter(
+    "[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+
+class _LazyQueueHandler(logging.handlers.QueueHandler):
+    """
+    Enfileira o registro sem formatá-lo na thread chamadora.
+
+    Apenas a mensagem (`msg % args`) e o traceback são resolvidos aqui, para que
+    objetos mutáveis passados como argumento sejam registrados como estavam no
+    momento da chamada; data/hora e o layout final ficam para a thread de escrita.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class _RoutingHandler(logging.Handler):
+    """
+    Handler executado pela thread de escrita: envia cada registro ao console e ao
+    arquivo `<LOG_DIR>/<nome do logger>.log` correspondente.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._console = logging.StreamHandler()
+        self._console.setFormatter(_formatter)
+        self._log_files: Dict[str, Path] = {}
+        self._file_handlers: Dict[str, logging.FileHandler] = {}
+
+    def register(self, name: str, log_file: Path) -> None:
+        self._log_files[name] = log_file
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self._console.handle(record)
+
+        file_handler = self._file_handlers.get(record.name)
+        if file_handler is None:
+            log_file = self._log_files.get(record.name)
+            if log_file is None:
+                return
+            file_handler = logging.FileHandler(log_file)
+            file_handler.setFormatter(_formatter)
+            self._file_handlers[record.name] = file_handler
+        file_handler.handle(record)
+
+    def close(self) -> None:
+        for file_handler in self._file_handlers.values():
+            file_handler.close()
+        self._file_handlers.clear()
+        self._console.close()
+        super().close()
+
+
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_queue_handler = _LazyQueueHandler(_log_queue)
+_routing_handler = _RoutingHandler()
+_listener: Optional[logging.handlers.QueueListener] = None
+_listener_lock = threading.Lock()
+
+
+def _start_listener() -> None:
+    global _listener
+    with _listener_lock:
+        if _listener is None:
+            _listener = logging.handlers.QueueListener(_log_queue, _routing_handler)
+            _listener.start()
+            atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """Escreve os registros pendentes e encerra a thread de escrita dos logs."""
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+            _routing_handler.close()
 
 
 def get_logger(name: str) -> logging.Logger:
+    """
+    Retorna o logger `name` com saída no console e em `<LOG_DIR>/<name>.log`.
+
+    Os registros são apenas enfileirados na thread chamadora; uma única thread em
+    segundo plano formata e escreve todos eles, de modo que chamadas de log não
+    bloqueiam em I/O de disco. Use argumentos no estilo `%s`
+    (`logger.debug("payload: %s", data)`) para que mensagens de níveis
+    desabilitados não sejam nem formatadas.
+    """
     # Carrega variáveis de ambiente
     log_level = os.getenv("LOG_LEVEL", "INFO").upper()
     log_dir = os.getenv("LOG_DIR", "logs")
@@ -15,29 +117,14 @@ def get_logger(name: str) -> logging.Logger:
     # Cria o diretório se não existir
     Path(log_dir).mkdir(parents=True, exist_ok=True)
 
-    # Caminho completo do arquivo de log
-    log_file = Path(log_dir) / f"{name}.log"
-
     # Cria o logger
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, log_level, logging.INFO))
 
     # Evita duplicação de handlers
     if not logger.handlers:
-        # Formato do log
-        formatter = logging.Formatter(
-            "[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-
-        # Handler para console
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
-
-        # Handler para arquivo
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        _routing_handler.register(name, Path(log_dir) / f"{name}.log")
+        logger.addHandler(_queue_handler)
+        _start_listener()
 
     return logger
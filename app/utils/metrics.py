@@ -0,0 +1,356 @@
+import bisect
+import contextvars
+import functools
+import inspect
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+from app.config.settings import env_bool
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Limites (em segundos) dos buckets dos histogramas de latência.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# nome -> (tipo, descrição)
+METRICS = {
+    "bridge_client_calls_total": ("counter", "Chamadas aos métodos dos clientes."),
+    "bridge_client_call_duration_seconds": (
+        "histogram",
+        "Duração das chamadas aos métodos dos clientes.",
+    ),
+    "bridge_http_requests_total": ("counter", "Requisições HTTP aos provedores, por status."),
+    "bridge_http_request_duration_seconds": (
+        "histogram",
+        "Duração de cada requisição HTTP (por tentativa).",
+    ),
+    "bridge_http_retries_total": ("counter", "Novas tentativas de requisições HTTP."),
+    "bridge_http_throttled_total": ("counter", "Respostas 429 recebidas dos provedores."),
+    "bridge_http_rate_limit_wait_seconds_total": ("counter", "Tempo de espera no rate limiter."),
+    "bridge_http_request_bytes_total": ("counter", "Bytes enviados aos provedores."),
+    "bridge_http_response_bytes_total": ("counter", "Bytes recebidos dos provedores."),
+}
+
+Labels = Tuple[Tuple[str, str], ...]
+
+# (provedor, operação) do método de cliente em execução; usado para rotular as
+# métricas HTTP registradas pelos transportes.
+current_operation: contextvars.ContextVar[Optional[Tuple[str, str]]] = contextvars.ContextVar(
+    "current_operation", default=None
+)
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, size: int):
+        self.counts = [0] * size
+        self.sum = 0.0
+        self.count = 0
+
+
+class MetricsRegistry:
+    """
+    Contadores e histogramas em memória, rotulados, seguros entre threads.
+
+    `snapshot()` devolve os valores atuais (com p50/p95/p99 estimados a partir
+    dos buckets) e `render_prometheus()` os formata no padrão de texto do
+    Prometheus.
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[Labels, float]] = {}
+        self._histograms: Dict[str, Dict[Labels, _Histogram]] = {}
+
+    def inc(self, name: str, labels: Labels, value: float = 1.0) -> None:
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[labels] = series.get(labels, 0.0) + value
+
+    def observe(self, name: str, labels: Labels, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(labels)
+            if histogram is None:
+                histogram = series[labels] = _Histogram(len(self.buckets) + 1)
+            histogram.counts[index] += 1
+            histogram.sum += value
+            histogram.count += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def _quantile(self, counts: List[int], total: int, q: float) -> Optional[float]:
+        """Estimativa por interpolação linear dentro do bucket (como `histogram_quantile`)."""
+        if not total:
+            return None
+        rank = q * total
+        cumulative = 0
+        for index, count in enumerate(counts):
+            if cumulative + count >= rank and count:
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                if index == len(self.buckets):
+                    return lower
+                upper = self.buckets[index]
+                return lower + (upper - lower) * (rank - cumulative) / count
+            cumulative += count
+        return self.buckets[-1]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Valores atuais de todas as métricas."""
+        with self._lock:
+            counters = {
+                name: [{"labels": dict(labels), "value": value} for labels, value in series.items()]
+                for name, series in self._counters.items()
+            }
+            histograms = {
+                name: [
+                    (dict(labels), list(h.counts), h.sum, h.count)
+                    for labels, h in series.items()
+                ]
+                for name, series in self._histograms.items()
+            }
+
+        result_histograms: Dict[str, List[Dict[str, Any]]] = {}
+        for name, series in histograms.items():
+            result_histograms[name] = [
+                {
+                    "labels": labels,
+                    "count": count,
+                    "sum": round(total, 6),
+                    "avg": round(total / count, 6) if count else None,
+                    "p50": self._quantile(counts, count, 0.50),
+                    "p95": self._quantile(counts, count, 0.95),
+                    "p99": self._quantile(counts, count, 0.99),
+                }
+                for labels, counts, total, count in series
+            ]
+        return {"counters": counters, "histograms": result_histograms}
+
+    def render_prometheus(self) -> str:
+        """Formato de texto do Prometheus (versão 0.0.4)."""
+        with self._lock:
+            counters = {name: dict(series) for name, series in self._counters.items()}
+            histograms = {
+                name: {labels: (list(h.counts), h.sum, h.count) for labels, h in series.items()}
+                for name, series in self._histograms.items()
+            }
+
+        lines: List[str] = []
+        for name in sorted(set(counters) | set(histograms)):
+            kind, description = METRICS.get(name, ("untyped", name))
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {kind}")
+
+            for labels, value in counters.get(name, {}).items():
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+            for labels, (counts, total, count) in histograms.get(name, {}).items():
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                    cumulative += bucket_count
+                    le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                    lines.append(f"{name}_bucket{_format_labels(labels + (('le', le),))} {cumulative}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {total:.6f}")
+                lines.append(f"{name}_count{_format_labels(labels)} {count}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _format_value(value: float) -> str:
+    """Valor exato: inteiros sem expoente (contadores de bytes passam de 1e6)."""
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+_registry = MetricsRegistry()
+_enabled = env_bool("METRICS_ENABLED", True)
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    return _registry
+
+
+def metrics_snapshot() -> Dict[str, Any]:
+    """Snapshot em memória das métricas dos clientes e dos transportes."""
+    return _registry.snapshot()
+
+
+# --- Registro pelos clientes e transportes ---------------------------------
+
+
+def _operation_labels(provider: str) -> Labels:
+    current = current_operation.get()
+    return (("provider", provider), ("operation", current[1] if current else "other"))
+
+
+def record_http(
+    provider: str,
+    status: str,
+    duration: float,
+    bytes_out: int = 0,
+    bytes_in: int = 0,
+) -> None:
+    """Registra uma tentativa de requisição HTTP (`status` é o código ou "error")."""
+    if not _enabled:
+        return
+    labels = _operation_labels(provider)
+    _registry.inc("bridge_http_requests_total", labels + (("status", status),))
+    _registry.observe("bridge_http_request_duration_seconds", labels, duration)
+    if status == "429":
+        _registry.inc("bridge_http_throttled_total", labels)
+    if bytes_out:
+        _registry.inc("bridge_http_request_bytes_total", labels, bytes_out)
+    if bytes_in:
+        _registry.inc("bridge_http_response_bytes_total", labels, bytes_in)
+
+
+def content_length(headers: Any) -> int:
+    """`Content-Length` de cabeçalhos HTTP (0 se ausente ou inválido)."""
+    try:
+        return int(headers.get("Content-Length") or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def record_retry(provider: str) -> None:
+    if _enabled:
+        _registry.inc("bridge_http_retries_total", _operation_labels(provider))
+
+
+def record_rate_limit_wait(provider: str, seconds: float) -> None:
+    if _enabled and seconds > 0:
+        _registry.inc("bridge_http_rate_limit_wait_seconds_total", _operation_labels(provider), seconds)
+
+
+def _record_call(provider: str, operation: str, outcome: str, duration: float) -> None:
+    labels = (("provider", provider), ("operation", operation))
+    _registry.inc("bridge_client_calls_total", labels + (("outcome", outcome),))
+    _registry.observe("bridge_client_call_duration_seconds", labels, duration)
+
+
+def _instrument(provider: str, operation: str, func: Callable) -> Callable:
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            token = current_operation.set((provider, operation))
+            start = time.perf_counter()
+            outcome = "error"
+            try:
+                result = await func(*args, **kwargs)
+                outcome = "success"
+                return result
+            finally:
+                current_operation.reset(token)
+                _record_call(provider, operation, outcome, time.perf_counter() - start)
+
+        wrapper = async_wrapper
+    else:
+
+        @functools.wraps(func)
+        def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+            token = current_operation.set((provider, operation))
+            start = time.perf_counter()
+            outcome = "error"
+            try:
+                result = func(*args, **kwargs)
+                outcome = "success"
+                return result
+            finally:
+                current_operation.reset(token)
+                _record_call(provider, operation, outcome, time.perf_counter() - start)
+
+        wrapper = sync_wrapper
+
+    wrapper.__instrumented__ = True
+    return wrapper
+
+
+T = TypeVar("T", bound=type)
+
+
+def instrument_client(provider: str, include: Iterable[str] = ()) -> Callable[[T], T]:
+    """
+    Decorador de classe: mede todos os métodos das interfaces implementadas pelo
+    cliente (e os de `include`), com latência e resultado por provedor e
+    operação. Durante cada chamada, as requisições HTTP feitas pelos
+    transportes são atribuídas à mesma operação.
+
+    Desligado com METRICS_ENABLED=false.
+    """
+
+    def decorate(cls: T) -> T:
+        if not _enabled:
+            return cls
+
+        names = set(include)
+        for base in cls.__mro__[1:]:
+            names.update(getattr(base, "__abstractmethods__", ()))
+
+        for name in names:
+            method = getattr(cls, name, None)
+            # Listagens (geradores) ficam de fora: o tempo de cada item depende
+            # de quem consome; suas requisições entram como operação "other".
+            if inspect.isgeneratorfunction(method) or inspect.isasyncgenfunction(method):
+                continue
+            if callable(method) and not getattr(method, "__instrumented__", False):
+                setattr(cls, name, _instrument(provider, name, method))
+        return cls
+
+    return decorate
+
+
+# --- Exportador Prometheus ----------------------------------------------------
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = _registry.render_prometheus().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def start_metrics_server(port: Optional[int] = None, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """
+    Expõe `GET /metrics` (formato de texto do Prometheus) em uma thread de fundo.
+
+    Args:
+        port (int): Porta (default: METRICS_PORT ou 9464; 0 escolhe uma livre).
+        host (str): Interface de escuta (default: apenas local).
+    """
+    port = port if port is not None else int(os.getenv("METRICS_PORT", "9464"))
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-exporter", daemon=True).start()
+    logger.info("Métricas disponíveis em http://%s:%s/metrics", host, server.server_address[1])
+    return server
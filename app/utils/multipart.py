@@ -0,0 +1,107 @@
+import hashlib
+import mimetypes
+import os
+import uuid
+from typing import AsyncIterator, BinaryIO, Optional
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def file_sha256(file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+    """Calcula o SHA-256 do arquivo lendo-o em blocos."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class MultipartFileBody:
+    """
+    Corpo `multipart/form-data` com um único arquivo, lido sob demanda.
+
+    O arquivo nunca é carregado inteiro em memória: o corpo é composto pelo
+    cabeçalho da parte, o conteúdo do arquivo (lido em blocos) e o delimitador
+    final. Como o tamanho total é conhecido (`len(body)`), a requisição é
+    enviada com `Content-Length` em vez de `Transfer-Encoding: chunked`.
+
+    Funciona com `requests` (`data=body`, via `read`) e com `httpx`
+    (`content=body`, via `__aiter__`). Cada instância só pode ser enviada uma vez.
+
+    Use como context manager (ou chame `close()`) para fechar o arquivo.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        field_name: str = "arquivo",
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+        self.boundary = uuid.uuid4().hex
+
+        filename = filename or os.path.basename(file_path)
+        content_type = (
+            content_type or mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        )
+        self._head = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field_name}"; filename="{filename}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode()
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode()
+        self._length = len(self._head) + os.path.getsize(file_path) + len(self._tail)
+
+        self._file: BinaryIO = open(file_path, "rb")
+        self._parts = [self._head, None, self._tail]
+        self._buffer = b""
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _next_chunk(self) -> bytes:
+        while self._parts:
+            part = self._parts[0]
+            if part is None:
+                chunk = self._file.read(self.chunk_size)
+                if chunk:
+                    return chunk
+                self._parts.pop(0)
+                continue
+            self._parts.pop(0)
+            return part
+        return b""
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            data = self._buffer + b"".join(iter(self._next_chunk, b""))
+            self._buffer = b""
+            return data
+
+        while len(self._buffer) < size:
+            chunk = self._next_chunk()
+            if not chunk:
+                break
+            self._buffer += chunk
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in iter(self._next_chunk, b""):
+            yield chunk
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "MultipartFileBody":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
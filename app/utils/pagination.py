@@ -0,0 +1,82 @@
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, List, Optional, Tuple
+
+# Uma página: (itens, total de páginas). O total só precisa ser informado na
+# primeira página; None indica que ele é desconhecido.
+Page = Tuple[List[Any], Optional[int]]
+
+
+def iter_pages(fetch_page: Callable[[int], Page], prefetch: int = 4) -> Iterator[List[Any]]:
+    """
+    Percorre uma listagem paginada, buscando até `prefetch` páginas à frente em paralelo.
+
+    A primeira página (índice 0) é buscada antes das demais para descobrir o
+    total de páginas; as seguintes são buscadas em threads, numa janela
+    deslizante, e entregues na ordem. Se o total for desconhecido, as páginas
+    são buscadas uma a uma até a primeira vazia.
+
+    A busca só avança conforme as páginas são consumidas: interromper a
+    iteração cancela as buscas ainda não iniciadas.
+
+    Args:
+        fetch_page (Callable[[int], Page]): Busca a página de índice `n` (a partir de 0).
+        prefetch (int): Páginas buscadas simultaneamente.
+    """
+    items, total_pages = fetch_page(0)
+    yield items
+
+    if total_pages is None:
+        index = 1
+        while items:
+            items, _ = fetch_page(index)
+            if items:
+                yield items
+            index += 1
+        return
+
+    prefetch = max(prefetch, 1)
+    executor = ThreadPoolExecutor(max_workers=prefetch)
+    try:
+        pending = deque()
+        next_index = 1
+        while next_index < total_pages or pending:
+            while next_index < total_pages and len(pending) < prefetch:
+                pending.append(executor.submit(fetch_page, next_index))
+                next_index += 1
+            items, _ = pending.popleft().result()
+            yield items
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_pages(
+    fetch_page: Callable[[int], Awaitable[Page]], prefetch: int = 4
+) -> AsyncIterator[List[Any]]:
+    """Equivalente assíncrono de `iter_pages`; as buscas rodam como tasks no event loop."""
+    items, total_pages = await fetch_page(0)
+    yield items
+
+    if total_pages is None:
+        index = 1
+        while items:
+            items, _ = await fetch_page(index)
+            if items:
+                yield items
+            index += 1
+        return
+
+    prefetch = max(prefetch, 1)
+    pending = deque()
+    try:
+        next_index = 1
+        while next_index < total_pages or pending:
+            while next_index < total_pages and len(pending) < prefetch:
+                pending.append(asyncio.ensure_future(fetch_page(next_index)))
+                next_index += 1
+            items, _ = await pending.popleft()
+            yield items
+    finally:
+        for task in pending:
+            task.cancel()
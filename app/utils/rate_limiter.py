@@ -0,0 +1,230 @@
+import asyncio
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Mapping, Optional
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# Limites padrão (requisições por segundo) por provedor. Podem ser sobrescritos
+# via variáveis de ambiente <PROVEDOR>_RATE_LIMIT e <PROVEDOR>_RATE_BURST.
+DEFAULT_RATE_LIMITS = {
+    "omie": 4.0,
+    "asaas": 10.0,
+    "nfe_io": 5.0,
+    "superlogica": 5.0,
+}
+
+THROTTLE_STATUS_CODES = {429}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Converte o cabeçalho `Retry-After` (segundos ou data HTTP) em segundos."""
+    if not value:
+        return None
+
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket adaptativo, compartilhado por todas as threads de um provedor.
+
+    Cada chamada reserva um "slot" no bucket (algoritmo GCRA): com o bucket cheio
+    até `burst` chamadas passam imediatamente e as seguintes são espaçadas em
+    `1 / rate` segundos, na ordem de chegada.
+
+    A taxa se adapta às respostas do provedor (AIMD):
+        - 429 ou `Retry-After`: a taxa é multiplicada por `decrease_factor` (no
+          máximo uma vez por janela) e novas chamadas ficam suspensas até o fim
+          do `Retry-After`;
+        - sucesso: a taxa volta a subir aos poucos (`increase_step` por chamada)
+          até o limite configurado.
+
+    `stats()` informa quanto tempo as chamadas esperaram na fila.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rate: float,
+        burst: Optional[int] = None,
+        min_rate: Optional[float] = None,
+        decrease_factor: float = 0.5,
+        increase_step: Optional[float] = None,
+    ):
+        if rate <= 0:
+            raise ValueError("A taxa do rate limiter deve ser maior que zero.")
+
+        self.name = name
+        self.max_rate = float(rate)
+        self.burst = max(int(burst or rate), 1)
+        self.min_rate = min_rate or self.max_rate * 0.05
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step or self.max_rate * 0.01
+
+        self._lock = threading.Lock()
+        self._rate = self.max_rate
+        self._tat = 0.0
+        self._paused_until = 0.0
+        self._decrease_window_until = 0.0
+
+        self._calls = 0
+        self._waited_calls = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._throttled = 0
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    def reserve(self) -> float:
+        """Reserva um slot e retorna quantos segundos o chamador deve aguardar."""
+        with self._lock:
+            now = time.monotonic()
+            interval = 1.0 / self._rate
+            tolerance = interval * (self.burst - 1)
+
+            tat = max(self._tat, now)
+            slot = max(now, tat - tolerance, self._paused_until)
+            self._tat = max(tat, slot) + interval
+
+            wait = slot - now
+            self._calls += 1
+            if wait > 0:
+                self._waited_calls += 1
+                self._total_wait += wait
+                self._max_wait = max(self._max_wait, wait)
+            return wait
+
+    def acquire(self) -> float:
+        """Bloqueia a thread atual até que a chamada possa ser feita."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """Equivalente assíncrono de `acquire`, sem bloquear o event loop."""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        """
+        Reduz a taxa após um 429. Vários 429 simultâneos (respostas de chamadas
+        já em voo) contam como uma única redução: até o fim da janela da última
+        redução (`Retry-After` ou um intervalo de emissão), novos 429 apenas
+        estendem a pausa.
+        """
+        with self._lock:
+            now = time.monotonic()
+            previous = self._rate
+            self._throttled += 1
+            decrease = now >= self._decrease_window_until
+            if decrease:
+                self._rate = max(self.min_rate, self._rate * self.decrease_factor)
+            pause = retry_after if retry_after is not None else 1.0 / self._rate
+            self._paused_until = max(self._paused_until, now + pause)
+            if decrease:
+                self._decrease_window_until = now + max(pause, 1.0 / self._rate)
+            current = self._rate
+
+        if not decrease:
+            logger.debug(
+                "RateLimiter[%s]: 429 na janela da última redução; taxa mantida em %.2f req/s.",
+                self.name,
+                current,
+            )
+            return
+        logger.warning(
+            "RateLimiter[%s]: limitado pelo provedor; taxa %.2f -> %.2f req/s, pausa de %.2fs.",
+            self.name,
+            previous,
+            current,
+            pause,
+        )
+
+    def on_success(self) -> None:
+        if self._rate >= self.max_rate:
+            return
+        with self._lock:
+            self._rate = min(self.max_rate, self._rate + self.increase_step)
+
+    def observe(self, status_code: int, headers: Optional[Mapping[str, str]] = None) -> None:
+        """Ajusta a taxa de acordo com a resposta recebida do provedor."""
+        retry_after = parse_retry_after((headers or {}).get("Retry-After"))
+
+        if status_code in THROTTLE_STATUS_CODES or (
+            retry_after is not None and status_code >= 500
+        ):
+            self.on_throttle(retry_after)
+        elif status_code < 400:
+            self.on_success()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "rate": round(self._rate, 4),
+                "max_rate": self.max_rate,
+                "burst": self.burst,
+                "calls": self._calls,
+                "waited_calls": self._waited_calls,
+                "total_wait": round(self._total_wait, 6),
+                "avg_wait": round(self._total_wait / self._calls, 6) if self._calls else 0.0,
+                "max_wait": round(self._max_wait, 6),
+                "throttled": self._throttled,
+            }
+
+
+_limiters: Dict[str, AdaptiveRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str) -> AdaptiveRateLimiter:
+    """
+    Retorna o rate limiter compartilhado do provedor, criando-o na primeira chamada.
+
+    Configuração:
+        - <PROVEDOR>_RATE_LIMIT: requisições por segundo (ex: OMIE_RATE_LIMIT=4)
+        - <PROVEDOR>_RATE_BURST: rajada máxima permitida (default: igual à taxa)
+    """
+    limiter = _limiters.get(provider)
+    if limiter is not None:
+        return limiter
+
+    with _limiters_lock:
+        limiter = _limiters.get(provider)
+        if limiter is None:
+            prefix = provider.upper()
+            rate = float(
+                os.getenv(f"{prefix}_RATE_LIMIT", DEFAULT_RATE_LIMITS.get(provider, 5.0))
+            )
+            burst = os.getenv(f"{prefix}_RATE_BURST")
+            limiter = AdaptiveRateLimiter(provider, rate, burst=int(burst) if burst else None)
+            _limiters[provider] = limiter
+    return limiter
+
+
+def rate_limiter_stats() -> Dict[str, Dict[str, Any]]:
+    """Retorna as estatísticas de todos os rate limiters já criados."""
+    return {name: limiter.stats() for name, limiter in list(_limiters.items())}
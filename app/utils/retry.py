@@ -0,0 +1,73 @@
+import os
+import random
+from typing import FrozenSet, Iterable, Optional, Tuple
+
+# Status que indicam falha transitória do provedor.
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class RetryPolicy:
+    """
+    Política de novas tentativas com backoff exponencial e jitter ("full jitter").
+
+    Só é aplicada a operações seguras de repetir: leituras (GET), chamadas
+    marcadas como idempotentes ou criações que carregam uma chave de
+    idempotência. As demais são executadas uma única vez.
+
+    Configuração (variáveis de ambiente):
+        - HTTP_RETRY_MAX_ATTEMPTS: total de tentativas, incluindo a primeira (default: 3)
+        - HTTP_RETRY_BASE_DELAY: atraso base em segundos (default: 0.5)
+        - HTTP_RETRY_MAX_DELAY: atraso máximo em segundos (default: 10)
+    """
+
+    def __init__(
+        self,
+        max_attempts: Optional[int] = None,
+        base_delay: Optional[float] = None,
+        max_delay: Optional[float] = None,
+        retry_on_status: Iterable[int] = RETRYABLE_STATUS_CODES,
+    ):
+        self.max_attempts = max_attempts or int(os.getenv("HTTP_RETRY_MAX_ATTEMPTS", "3"))
+        self.base_delay = (
+            base_delay if base_delay is not None
+            else float(os.getenv("HTTP_RETRY_BASE_DELAY", "0.5"))
+        )
+        self.max_delay = (
+            max_delay if max_delay is not None
+            else float(os.getenv("HTTP_RETRY_MAX_DELAY", "10"))
+        )
+        self.retry_on_status = frozenset(retry_on_status)
+
+    def _key(self) -> Tuple[int, float, float, FrozenSet[int]]:
+        return (self.max_attempts, self.base_delay, self.max_delay, self.retry_on_status)
+
+    # Comparada por valor: políticas com a mesma configuração são intercambiáveis
+    # (ex: como chave do cache de visões por provedor do transporte assíncrono).
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RetryPolicy):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def attempts_for(
+        self,
+        method: str,
+        idempotent: Optional[bool] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> int:
+        """Retorna quantas tentativas a operação pode fazer."""
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS or bool(idempotency_key)
+        return self.max_attempts if idempotent else 1
+
+    def should_retry_status(self, status_code: int) -> bool:
+        return status_code in self.retry_on_status
+
+    def backoff(self, attempt: int) -> float:
+        """Atraso antes da próxima tentativa (`attempt` começa em 1)."""
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
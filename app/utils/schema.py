@@ -0,0 +1,253 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_MISSING = object()
+
+REQUIRED_MESSAGE = "O campo obrigatório '{name}' está ausente."
+INVALID_MESSAGE = "Valor inválido para '{name}': {value!r}."
+
+# Passo de validação compilado: recebe o valor e devolve (valor, erro ou None).
+Step = Callable[[Any], Tuple[Any, Optional[str]]]
+Message = Union[str, Callable[[str, Any], str]]
+
+
+def is_blank(value: Any) -> bool:
+    """Ausente, None ou texto em branco (padrão)."""
+    return value is _MISSING or value is None or (isinstance(value, str) and not value.strip())
+
+
+def is_falsy(value: Any) -> bool:
+    """Ausente ou qualquer valor falso (None, "", 0, []), como `not data.get(campo)`."""
+    return value is _MISSING or not value
+
+
+def is_absent(value: Any) -> bool:
+    """Somente a chave ausente, como `campo not in data` (None é um valor)."""
+    return value is _MISSING
+
+
+class SchemaValidationError(ValueError):
+    """Payload inválido; `errors` traz todas as mensagens encontradas."""
+
+    def __init__(self, errors: List[str]):
+        super().__init__("; ".join(errors))
+        self.errors = errors
+
+
+class Field:
+    """
+    Regra de um campo do schema.
+
+    Args:
+        name (str): Nome do campo.
+        required (bool): Ausente, None ou texto em branco é erro.
+        types (type | tuple): Tipos aceitos (bool nunca conta como número).
+        choices (Iterable): Valores permitidos.
+        positive (bool): Exige número maior que zero.
+        default: Valor usado quando o campo opcional está ausente.
+        normalize (Callable): Converte o valor; um `ValueError` vira erro do campo.
+        schema (Schema): Schema do valor (dicionário aninhado).
+        message (str | Callable): Mensagem para valor inválido: texto com
+            `{name}` e `{value}` ou função `(name, value) -> str`.
+        required_message (str): Mensagem para campo obrigatório ausente.
+        missing (Callable): Quando o valor conta como ausente (obrigatório
+            ausente ou opcional que recebe o `default`): `is_blank` (padrão),
+            `is_falsy` ou `is_absent`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        required: bool = False,
+        types: Any = None,
+        choices: Optional[Iterable[Any]] = None,
+        positive: bool = False,
+        default: Any = _MISSING,
+        normalize: Optional[Callable[[Any], Any]] = None,
+        schema: Optional["Schema"] = None,
+        message: Message = INVALID_MESSAGE,
+        required_message: str = REQUIRED_MESSAGE,
+        missing: Callable[[Any], bool] = is_blank,
+    ):
+        self.name = name
+        self.required = required
+        self.types = types
+        self.choices = frozenset(choices) if choices is not None else None
+        self.positive = positive
+        self.default = default
+        self.normalize = normalize
+        self.schema = schema
+        self.message = message
+        self.required_message = required_message
+        self.missing = missing
+
+    def compile(self) -> List[Step]:
+        """Passos de validação deste campo, apenas os que a regra usa."""
+        steps: List[Step] = []
+        name, message = self.name, self.message
+
+        def invalid(value: Any) -> str:
+            if callable(message):
+                return message(name, value)
+            return message.format(name=name, value=value)
+
+        if self.types is not None:
+            types = self.types
+            numeric = bool({int, float} & set(types if isinstance(types, tuple) else (types,)))
+
+            def check_type(value: Any) -> Tuple[Any, Optional[str]]:
+                if not isinstance(value, types) or (numeric and isinstance(value, bool)):
+                    return value, invalid(value)
+                return value, None
+
+            steps.append(check_type)
+
+        if self.choices is not None:
+            choices = self.choices
+
+            def check_choice(value: Any) -> Tuple[Any, Optional[str]]:
+                try:
+                    allowed = value in choices
+                except TypeError:
+                    allowed = False
+                return value, None if allowed else invalid(value)
+
+            steps.append(check_choice)
+
+        if self.positive:
+
+            def check_positive(value: Any) -> Tuple[Any, Optional[str]]:
+                ok = isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0
+                return value, None if ok else invalid(value)
+
+            steps.append(check_positive)
+
+        if self.schema is not None:
+            schema = self.schema
+
+            def check_nested(value: Any) -> Tuple[Any, Optional[str]]:
+                normalized, errors = schema.validate(value)
+                return normalized, "; ".join(errors) if errors else None
+
+            steps.append(check_nested)
+
+        if self.normalize is not None:
+            normalize = self.normalize
+
+            def apply_normalize(value: Any) -> Tuple[Any, Optional[str]]:
+                try:
+                    return normalize(value), None
+                except ValueError as e:
+                    return value, str(e)
+
+            steps.append(apply_normalize)
+
+        return steps
+
+
+class Schema:
+    """
+    Schema declarativo de um payload, compilado uma vez em uma lista de passos.
+
+    `validate` devolve uma cópia normalizada (defaults e normalizações
+    aplicados; o dicionário recebido não é alterado) e todos os erros
+    encontrados, em vez de parar no primeiro. Campos que não estão no schema
+    são mantidos como vieram.
+
+    Args:
+        fields (Iterable[Field]): Regras dos campos.
+        type_message (str): Mensagem quando o payload não é um dicionário.
+    """
+
+    def __init__(
+        self,
+        fields: Iterable[Field],
+        type_message: str = "O payload deve ser um dicionário.",
+    ):
+        self.fields = list(fields)
+        self.type_message = type_message
+        self._compiled = [
+            (
+                field.name,
+                field.required,
+                field.default,
+                field.missing,
+                field.required_message,
+                field.compile(),
+            )
+            for field in self.fields
+        ]
+
+    def extend(self, *fields: Field, **options: Any) -> "Schema":
+        """Novo schema com os campos deste mais `fields` (que substituem os de mesmo nome)."""
+        names = {field.name for field in fields}
+        kept = [field for field in self.fields if field.name not in names]
+        return Schema(kept + list(fields), **{"type_message": self.type_message, **options})
+
+    def validate(self, data: Any) -> Tuple[Dict[str, Any], List[str]]:
+        if not isinstance(data, dict):
+            return data, [self.type_message]
+
+        normalized = dict(data)
+        errors: List[str] = []
+        for name, required, default, missing, required_message, steps in self._compiled:
+            value = data.get(name, _MISSING)
+            if missing(value):
+                if required:
+                    errors.append(required_message.format(name=name))
+                elif default is not _MISSING:
+                    normalized[name] = default
+                continue
+
+            for step in steps:
+                value, error = step(value)
+                if error is not None:
+                    errors.append(error)
+                    break
+            else:
+                normalized[name] = value
+        return normalized, errors
+
+    def check(self, data: Any) -> Dict[str, Any]:
+        """Como `validate`, mas levanta `SchemaValidationError` se houver erros."""
+        normalized, errors = self.validate(data)
+        if errors:
+            raise SchemaValidationError(errors)
+        return normalized
+
+
+def validate_many(schema: Schema, records: Iterable[Any]) -> Dict[str, Any]:
+    """
+    Valida vários registros em uma passada, coletando todos os erros de cada um.
+
+    Returns:
+        Dict[str, Any]: Resumo com `status` ("success", "partial" ou "error"),
+        contadores, `results` (`index`, `status` e `data` normalizado ou
+        `errors`, na ordem recebida) e `failures` (apenas os inválidos).
+    """
+    validate = schema.validate
+    results: List[Dict[str, Any]] = []
+    failures: List[Dict[str, Any]] = []
+    for index, record in enumerate(records):
+        normalized, errors = validate(record)
+        if errors:
+            result = {"index": index, "status": "error", "errors": errors}
+            failures.append(result)
+        else:
+            result = {"index": index, "status": "success", "data": normalized}
+        results.append(result)
+
+    succeeded = len(results) - len(failures)
+    if failures:
+        logger.info("Validação em lote: %d de %d registros inválidos.", len(failures), len(results))
+    return {
+        "status": "success" if not failures else ("partial" if succeeded else "error"),
+        "total": len(results),
+        "succeeded": succeeded,
+        "failed": len(failures),
+        "results": results,
+        "failures": failures,
+    }